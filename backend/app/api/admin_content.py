@@ -4,8 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from backend.app.core.deps import get_current_user
+from backend.app.core.user_cache import UserIdentity
 from backend.app.db.session import get_db
-from backend.app.models.user import User
 from backend.app.repositories.admin_content_repo import (
     delete_answer,
     delete_question,
@@ -14,13 +14,13 @@ from backend.app.repositories.admin_content_repo import (
 )
 from backend.app.schemas.answer import AnswerAdminUpdate, AnswerOut
 from backend.app.schemas.question import QuestionAdminUpdate, QuestionOut
-from backend.app.repositories.answer_repo import count_answers_for_question
-from backend.app.repositories.vote_repo import get_vote_score
+from backend.app.services.answer_service import build_answer_outs
+from backend.app.services.question_service import build_question_outs
 
 router = APIRouter(prefix="/admin/content", tags=["admin"])
 
 
-def _ensure_admin(current_user: User) -> None:
+def _ensure_admin(current_user: UserIdentity) -> None:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="admin only"
@@ -31,7 +31,7 @@ def _ensure_admin(current_user: User) -> None:
 def delete_question_endpoint(
     question_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     _ensure_admin(current_user)
     if not delete_question(db, question_id=question_id):
@@ -46,7 +46,7 @@ def update_question_endpoint(
     question_id: uuid.UUID,
     payload: QuestionAdminUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> QuestionOut:
     _ensure_admin(current_user)
     question = update_question_content(
@@ -61,30 +61,14 @@ def update_question_endpoint(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="question not found"
         )
-    return QuestionOut(
-        id=question.id,
-        author_id=question.author_id,
-        author_name=None,
-        title=question.title,
-        body=question.body,
-        category=question.category,
-        stage=question.stage,
-        accepted_answer_id=question.accepted_answer_id,
-        created_at=question.created_at,
-        updated_at=question.updated_at,
-        answers_count=count_answers_for_question(db, question_id=question.id),
-        views_count=0,
-        vote_score=get_vote_score(
-            db, target_type="question", target_id=question.id
-        ),
-    )
+    return build_question_outs(db, [question])[0]
 
 
 @router.delete("/answers/{answer_id}")
 def delete_answer_endpoint(
     answer_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     _ensure_admin(current_user)
     if not delete_answer(db, answer_id=answer_id):
@@ -99,7 +83,7 @@ def update_answer_endpoint(
     answer_id: uuid.UUID,
     payload: AnswerAdminUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> AnswerOut:
     _ensure_admin(current_user)
     answer = update_answer_content(db, answer_id=answer_id, body=payload.body)
@@ -107,16 +91,4 @@ def update_answer_endpoint(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="answer not found"
         )
-    return AnswerOut(
-        id=answer.id,
-        question_id=answer.question_id,
-        author_id=answer.author_id,
-        author_name=None,
-        body=answer.body,
-        is_accepted=answer.is_accepted,
-        created_at=answer.created_at,
-        updated_at=answer.updated_at,
-        vote_score=get_vote_score(
-            db, target_type="answer", target_id=answer.id
-        ),
-    )
+    return build_answer_outs(db, [answer])[0]
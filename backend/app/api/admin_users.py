@@ -5,6 +5,7 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from backend.app.core.deps import get_current_user
+from backend.app.core.user_cache import UserIdentity, mark_users_changed
 from backend.app.db.session import get_db
 from backend.app.models.answer import Answer
 from backend.app.models.question import Question
@@ -16,7 +17,7 @@ from backend.app.schemas.user import UserOut, UserRoleUpdate
 router = APIRouter(prefix="/admin/users", tags=["admin"])
 
 
-def _ensure_admin(current_user: User) -> None:
+def _ensure_admin(current_user: UserIdentity) -> None:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="admin only"
@@ -26,7 +27,7 @@ def _ensure_admin(current_user: User) -> None:
 @router.get("", response_model=list[UserOut])
 def list_users_endpoint(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> list[UserOut]:
     _ensure_admin(current_user)
     users = list(db.scalars(select(User).order_by(User.created_at.desc())).all())
@@ -68,7 +69,7 @@ def update_user_role_endpoint(
     user_id: uuid.UUID,
     payload: UserRoleUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> UserOut:
     _ensure_admin(current_user)
 
@@ -86,6 +87,7 @@ def update_user_role_endpoint(
 
     user.role = payload.role
     db.add(user)
+    mark_users_changed(db, user.id)
     db.commit()
     db.refresh(user)
     return user
@@ -95,7 +97,7 @@ def update_user_role_endpoint(
 def delete_user_endpoint(
     user_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     _ensure_admin(current_user)
 
@@ -1,57 +1,27 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from backend.app.core.deps import get_current_user
+from backend.app.core.outbox import outbox_worker
+from backend.app.core.user_cache import UserIdentity
 from backend.app.db.session import get_db
-from backend.app.models.user import User
 from backend.app.repositories.answer_repo import create_answer, list_answers_for_question
-from backend.app.repositories.follow_repo import list_followers
-from backend.app.repositories.notification_repo import create_notification
 from backend.app.repositories.question_repo import get_question_by_id
-from backend.app.repositories.vote_repo import get_vote_score
 from backend.app.schemas.answer import AnswerCreate, AnswerOut
-from backend.app.services.answer_service import accept_answer
+from backend.app.services.answer_service import accept_answer, build_answer_outs
 
 router = APIRouter(prefix="/questions/{question_id}/answers", tags=["answers"])
 
 
-def _author_lookup(db: Session, author_ids: list) -> dict:
-    if not author_ids:
-        return {}
-    rows = db.execute(
-        select(User.id, User.full_name).where(User.id.in_(author_ids))
-    ).all()
-    return {row[0]: row[1] for row in rows}
-
-
-def _answer_out(
-    db: Session, answer, author_map: dict | None = None
-) -> AnswerOut:
-    author_name = None
-    if author_map is not None:
-        author_name = author_map.get(answer.author_id)
-    return AnswerOut(
-        id=answer.id,
-        question_id=answer.question_id,
-        author_id=answer.author_id,
-        author_name=author_name,
-        body=answer.body,
-        is_accepted=answer.is_accepted,
-        created_at=answer.created_at,
-        updated_at=answer.updated_at,
-        vote_score=get_vote_score(db, target_type="answer", target_id=answer.id),
-    )
-
-
 @router.post("", response_model=AnswerOut)
 def create_answer_endpoint(
     question_id: uuid.UUID,
     payload: AnswerCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> AnswerOut:
     question = get_question_by_id(db, question_id=question_id)
     if question is None:
@@ -65,35 +35,11 @@ def create_answer_endpoint(
         author_id=current_user.id,
         body=payload.body,
     )
+    background_tasks.add_task(outbox_worker.kick, db.get_bind())
 
-    if question.author_id != current_user.id:
-        create_notification(
-            db,
-            user_id=question.author_id,
-            type="answer_posted",
-            payload={
-                "question_id": str(question.id),
-                "answer_id": str(answer.id),
-                "actor_id": str(current_user.id),
-            },
-        )
-
-    followers = list_followers(db, question_id=question.id)
-    for follow in followers:
-        if follow.user_id in (current_user.id, question.author_id):
-            continue
-        create_notification(
-            db,
-            user_id=follow.user_id,
-            type="followed_question_answer",
-            payload={
-                "question_id": str(question.id),
-                "answer_id": str(answer.id),
-                "actor_id": str(current_user.id),
-            },
-        )
-
-    return _answer_out(db, answer, {current_user.id: current_user.full_name})
+    return build_answer_outs(
+        db, [answer], author_map={current_user.id: current_user.full_name}
+    )[0]
 
 
 @router.get("", response_model=list[AnswerOut])
@@ -102,16 +48,16 @@ def list_answers_endpoint(
     db: Session = Depends(get_db),
 ) -> list[AnswerOut]:
     answers = list_answers_for_question(db, question_id=question_id)
-    author_map = _author_lookup(db, [a.author_id for a in answers])
-    return [_answer_out(db, a, author_map) for a in answers]
+    return build_answer_outs(db, answers)
 
 
 @router.post("/{answer_id}/accept")
 def accept_answer_endpoint(
     question_id: uuid.UUID,
     answer_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     try:
         result = accept_answer(
@@ -138,16 +84,6 @@ def accept_answer_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail="question not found"
         )
 
-    if result.answer.author_id != current_user.id:
-        create_notification(
-            db,
-            user_id=result.answer.author_id,
-            type="accepted_answer",
-            payload={
-                "question_id": str(result.question.id),
-                "answer_id": str(result.answer.id),
-                "actor_id": str(current_user.id),
-            },
-        )
+    background_tasks.add_task(outbox_worker.kick, db.get_bind())
 
     return {"detail": "accepted"}
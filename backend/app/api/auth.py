@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from backend.app.core.jwt import create_access_token
-from backend.app.core.security import hash_password
+from backend.app.core.security import PasswordHasherBusy
 from backend.app.db.session import get_db
 from backend.app.repositories.user_repo import get_user_by_email
 from backend.app.schemas.auth import LoginRequest, RegisterRequest, TokenResponse
@@ -12,19 +12,27 @@ from backend.app.schemas.password_reset import (
 )
 from backend.app.services.auth_service import authenticate_user, register_user
 from backend.app.services.password_reset_service import (
-    consume_reset_token,
     create_reset_token,
+    reset_password,
 )
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="too many password requests, try again shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=TokenResponse)
-def register_user_endpoint(
+async def register_user_endpoint(
     payload: RegisterRequest, db: Session = Depends(get_db)
 ) -> TokenResponse:
     try:
-        user = register_user(
+        user = await register_user(
             db,
             email=payload.email,
             full_name=payload.full_name,
@@ -36,6 +44,8 @@ def register_user_endpoint(
             status_code=status.HTTP_409_CONFLICT,
             detail="email already registered",
         )
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
     access_token = create_access_token(sub=str(user.id))
     return TokenResponse(
@@ -44,10 +54,15 @@ def register_user_endpoint(
 
 
 @router.post("/login", response_model=TokenResponse)
-def login_user_endpoint(
+async def login_user_endpoint(
     payload: LoginRequest, db: Session = Depends(get_db)
 ) -> TokenResponse:
-    user = authenticate_user(db, email=payload.email, password=payload.password)
+    try:
+        user = await authenticate_user(
+            db, email=payload.email, password=payload.password
+        )
+    except PasswordHasherBusy:
+        raise _hasher_busy()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -78,18 +93,19 @@ def forgot_password_endpoint(
 
 
 @router.post("/reset-password")
-def reset_password_endpoint(
+async def reset_password_endpoint(
     payload: ResetPasswordRequest, db: Session = Depends(get_db)
 ) -> dict:
-    user = consume_reset_token(db, token=payload.token)
-    if user is None:
+    try:
+        updated = await reset_password(
+            db, token=payload.token, new_password=payload.new_password
+        )
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="invalid or expired token",
         )
 
-    user.password_hash = hash_password(payload.new_password)
-    db.add(user)
-    db.commit()
-
     return {"detail": "password updated"}
@@ -0,0 +1,164 @@
+import threading
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from jose import JWTError
+from starlette.concurrency import run_in_threadpool
+
+from backend.app.core.config import Settings
+from backend.app.core.deps import (
+    get_current_user,
+    stream_ticket_subject,
+    token_subject,
+)
+from backend.app.core.jwt import create_stream_ticket
+from backend.app.core.pubsub import (
+    format_sse,
+    pubsub,
+    question_channel,
+    user_channel,
+)
+from backend.app.core.user_cache import UserIdentity
+from backend.app.db import session as db_session
+from backend.app.repositories.question_repo import get_question_by_id
+from backend.app.repositories.user_repo import get_user_identity
+from backend.app.schemas.auth import StreamTicketResponse
+
+router = APIRouter(tags=["events"])
+settings = Settings()
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+class StreamLimiter:
+    # Counts open streams per key so anonymous clients cannot pile up an
+    # unbounded number of long-lived subscriptions in one worker.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open: dict[str, int] = {}
+
+    def acquire(self, limits: dict[str, int]) -> bool:
+        with self._lock:
+            if any(self._open.get(key, 0) >= limit for key, limit in limits.items()):
+                return False
+            for key in limits:
+                self._open[key] = self._open.get(key, 0) + 1
+        return True
+
+    def release(self, keys) -> None:
+        with self._lock:
+            for key in keys:
+                remaining = self._open.get(key, 0) - 1
+                if remaining > 0:
+                    self._open[key] = remaining
+                else:
+                    self._open.pop(key, None)
+
+
+stream_limiter = StreamLimiter()
+
+
+def _authenticate(token: str | None, subject) -> uuid.UUID:
+    # The session is closed before streaming starts so a long-lived stream
+    # does not hold a pooled connection.
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="not authenticated"
+        )
+    try:
+        user_id = subject(token)
+    except (JWTError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token"
+        )
+    with db_session.SessionLocal() as db:
+        if get_user_identity(db, user_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="user not found"
+            )
+    return user_id
+
+
+def _question_exists(question_id: uuid.UUID) -> bool:
+    with db_session.SessionLocal() as db:
+        return get_question_by_id(db, question_id=question_id) is not None
+
+
+async def event_stream(request: Request, subscription, heartbeat: float, on_close=None):
+    try:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            message = await subscription.get(heartbeat)
+            yield ": keep-alive\n\n" if message is None else format_sse(message)
+    finally:
+        pubsub.unsubscribe(subscription)
+        if on_close is not None:
+            on_close()
+
+
+@router.post("/events/ticket", response_model=StreamTicketResponse)
+def stream_ticket_endpoint(
+    current_user: UserIdentity = Depends(get_current_user),
+) -> StreamTicketResponse:
+    # EventSource cannot send headers, so browsers trade their access token
+    # for a short-lived ticket that is only accepted in the /events query.
+    return StreamTicketResponse(
+        ticket=create_stream_ticket(str(current_user.id)),
+        expires_in=settings.sse_ticket_seconds,
+    )
+
+
+@router.get("/events")
+async def user_events_endpoint(
+    request: Request,
+    ticket: str | None = None,
+    question_id: list[uuid.UUID] = Query(default=[]),
+) -> StreamingResponse:
+    authorization = request.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        user_id = await run_in_threadpool(
+            _authenticate, authorization[7:], token_subject
+        )
+    else:
+        user_id = await run_in_threadpool(_authenticate, ticket, stream_ticket_subject)
+
+    channels = [user_channel(user_id)]
+    channels.extend(question_channel(qid) for qid in question_id)
+    subscription = pubsub.subscribe(channels)
+    return StreamingResponse(
+        event_stream(request, subscription, settings.sse_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.get("/questions/{question_id}/events")
+async def question_events_endpoint(
+    request: Request, question_id: uuid.UUID
+) -> StreamingResponse:
+    if not await run_in_threadpool(_question_exists, question_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="question not found"
+        )
+    client = request.client.host if request.client else "unknown"
+    limits = {
+        f"question:{question_id}": settings.sse_max_streams_per_question,
+        f"client:{client}": settings.sse_max_streams_per_client,
+    }
+    if not stream_limiter.acquire(limits):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="too many open streams",
+        )
+    subscription = pubsub.subscribe([question_channel(question_id)])
+    return StreamingResponse(
+        event_stream(
+            request,
+            subscription,
+            settings.sse_heartbeat_seconds,
+            on_close=lambda: stream_limiter.release(limits),
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
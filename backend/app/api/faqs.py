@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from backend.app.core.content_versions import get_content_version
 from backend.app.core.deps import get_current_user
+from backend.app.core.http_cache import make_etag, not_modified
+from backend.app.core.user_cache import UserIdentity
 from backend.app.db.session import get_db
-from backend.app.models.user import User
 from backend.app.repositories.faq_repo import create_faq, delete_faq, list_faqs, update_faq
 from backend.app.schemas.faq import FAQCreate, FAQOut, FAQUpdate
 
@@ -11,7 +13,13 @@ router = APIRouter(prefix="/faqs", tags=["faqs"])
 
 
 @router.get("", response_model=list[FAQOut])
-def list_faqs_endpoint(db: Session = Depends(get_db)) -> list[FAQOut]:
+def list_faqs_endpoint(
+    request: Request, response: Response, db: Session = Depends(get_db)
+) -> list[FAQOut]:
+    etag = make_etag("faqs", get_content_version(db, name="faqs"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
     return list_faqs(db)
 
 
@@ -19,7 +27,7 @@ def list_faqs_endpoint(db: Session = Depends(get_db)) -> list[FAQOut]:
 def create_faq_endpoint(
     payload: FAQCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> FAQOut:
     if current_user.role != "admin":
         raise HTTPException(
@@ -40,7 +48,7 @@ def update_faq_endpoint(
     faq_id: str,
     payload: FAQUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> FAQOut:
     if current_user.role != "admin":
         raise HTTPException(
@@ -65,7 +73,7 @@ def update_faq_endpoint(
 def delete_faq_endpoint(
     faq_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     if current_user.role != "admin":
         raise HTTPException(
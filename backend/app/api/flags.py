@@ -2,14 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from backend.app.core.deps import get_current_user
+from backend.app.core.user_cache import UserIdentity
 from backend.app.db.session import get_db
 from backend.app.models.answer import Answer
 from backend.app.models.question import Question
-from backend.app.models.user import User
 from backend.app.repositories.flag_repo import (
     create_flag,
     delete_flag,
-    get_flag,
     list_flags,
 )
 from backend.app.schemas.flag import FlagCreate, FlagOut
@@ -21,7 +20,7 @@ router = APIRouter(prefix="/flags", tags=["flags"])
 def create_flag_endpoint(
     payload: FlagCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> FlagOut:
     if payload.target_type == "question":
         target = db.get(Question, payload.target_id)
@@ -38,25 +37,19 @@ def create_flag_endpoint(
             status_code=status.HTTP_403_FORBIDDEN, detail="self-flag not allowed"
         )
 
-    existing = get_flag(
+    flag = create_flag(
         db,
         user_id=current_user.id,
         target_type=payload.target_type,
         target_id=payload.target_id,
+        reason=payload.reason,
     )
-    if existing is not None:
+    if flag is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="already flagged",
         )
-
-    return create_flag(
-        db,
-        user_id=current_user.id,
-        target_type=payload.target_type,
-        target_id=payload.target_id,
-        reason=payload.reason,
-    )
+    return flag
 
 
 @router.get("", response_model=list[FlagOut])
@@ -64,7 +57,7 @@ def list_flags_endpoint(
     target_type: str | None = None,
     target_id: str | None = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> list[FlagOut]:
     if current_user.role != "admin":
         raise HTTPException(
@@ -78,7 +71,7 @@ def list_flags_endpoint(
 def delete_flag_endpoint(
     flag_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     if current_user.role != "admin":
         raise HTTPException(
@@ -1,8 +1,56 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.app.core.deps import get_current_user, token_cache
+from backend.app.core.outbox import outbox_worker
+from backend.app.core.pubsub import pubsub
+from backend.app.core.question_cache import question_cache
+from backend.app.core.security import password_hasher
+from backend.app.core.user_cache import UserIdentity, user_cache
+from backend.app.core.view_buffer import view_buffer
+from backend.app.db.session import get_db, pool_status
+from backend.app.repositories.outbox_repo import outbox_stats
 
 router = APIRouter()
 
 
+def _require_admin(current_user: UserIdentity = Depends(get_current_user)) -> None:
+    # Only the liveness probe is public; the detailed reports expose pool,
+    # queue and subscriber internals.
+    if current_user.role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="admin only")
+
+
 @router.get("/health")
 def health_check() -> dict:
     return {"status": "ok"}
+
+
+@router.get("/health/cache", dependencies=[Depends(_require_admin)])
+def cache_stats() -> dict:
+    return {
+        "question_detail": question_cache.stats(),
+        "user_identity": user_cache.stats(),
+        "token_claims": token_cache.stats(),
+        "view_buffer": view_buffer.stats(),
+    }
+
+
+@router.get("/health/database", dependencies=[Depends(_require_admin)])
+def database_health() -> dict:
+    return pool_status()
+
+
+@router.get("/health/outbox", dependencies=[Depends(_require_admin)])
+def outbox_health(db: Session = Depends(get_db)) -> dict:
+    return {"worker": outbox_worker.stats(), "queue": outbox_stats(db)}
+
+
+@router.get("/health/passwords", dependencies=[Depends(_require_admin)])
+def password_hasher_health() -> dict:
+    return password_hasher.stats()
+
+
+@router.get("/health/events", dependencies=[Depends(_require_admin)])
+def events_health() -> dict:
+    return pubsub.stats()
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from backend.app.core.deps import get_current_user
+from backend.app.core.user_cache import UserIdentity
 from backend.app.db.session import get_db
-from backend.app.models.user import User
 from backend.app.repositories.answer_repo import list_answers_by_author
 from backend.app.repositories.question_repo import list_questions_by_author
+from backend.app.repositories.user_repo import get_user_by_id
 from backend.app.schemas.me import MyAnswerOut, MyQuestionOut
 from backend.app.schemas.user import UserOut
 
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/me", tags=["me"])
 @router.get("/questions", response_model=list[MyQuestionOut])
 def my_questions_endpoint(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> list[MyQuestionOut]:
     return list_questions_by_author(db, author_id=current_user.id)
 
@@ -23,13 +24,20 @@ def my_questions_endpoint(
 @router.get("/answers", response_model=list[MyAnswerOut])
 def my_answers_endpoint(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> list[MyAnswerOut]:
     return list_answers_by_author(db, author_id=current_user.id)
 
 
 @router.get("/profile", response_model=UserOut)
 def my_profile_endpoint(
-    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> UserOut:
-    return current_user
+    user = get_user_by_id(db, current_user.id)
+    if user is None:
+        # The identity cache can outlive a deletion made by another worker.
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="user not found"
+        )
+    return user
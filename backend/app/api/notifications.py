@@ -1,31 +1,75 @@
-from fastapi import APIRouter, Depends
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.app.core.deps import get_current_user
-from backend.app.db.session import get_db
-from backend.app.models.user import User
+from backend.app.core.deps import get_current_user, get_current_user_async
+from backend.app.core.user_cache import UserIdentity
+from backend.app.db.session import get_async_db, get_db
 from backend.app.repositories.notification_repo import (
+    get_unread_count,
     list_notifications,
     mark_all_read,
+    mark_notification_read,
 )
+from backend.app.repositories.question_repo import encode_cursor
 from backend.app.schemas.notification import NotificationOut
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
 @router.get("", response_model=list[NotificationOut])
-def list_notifications_endpoint(
+async def list_notifications_endpoint(
+    response: Response,
     unread_only: bool = False,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    limit: int = 20,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserIdentity = Depends(get_current_user_async),
 ) -> list[NotificationOut]:
-    return list_notifications(db, user_id=current_user.id, unread_only=unread_only)
+    try:
+        items = await db.run_sync(
+            list_notifications,
+            user_id=current_user.id,
+            unread_only=unread_only,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="invalid cursor"
+        )
+
+    if items and len(items) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(items[-1])
+    return items
+
+
+@router.get("/unread-count")
+async def unread_count_endpoint(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserIdentity = Depends(get_current_user_async),
+) -> dict:
+    return {"unread": await db.run_sync(get_unread_count, user_id=current_user.id)}
 
 
 @router.post("/mark-all-read")
 def mark_all_read_endpoint(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> dict:
     updated = mark_all_read(db, user_id=current_user.id)
     return {"updated": updated}
+
+
+@router.post("/{notification_id}/read")
+def mark_notification_read_endpoint(
+    notification_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: UserIdentity = Depends(get_current_user),
+) -> dict:
+    updated = mark_notification_read(
+        db, user_id=current_user.id, notification_id=notification_id
+    )
+    return {"updated": updated}
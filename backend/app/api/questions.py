@@ -1,76 +1,52 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.app.core.deps import get_current_user, get_optional_user
-from backend.app.db.session import get_db
-from backend.app.models.user import User
-from backend.app.repositories.answer_repo import (
-    count_answers_for_question,
-    list_answers_for_question_ordered,
-)
+from backend.app.core.content_versions import get_content_version
+from backend.app.core.deps import get_current_user, get_optional_user_async
+from backend.app.core.http_cache import make_etag, not_modified
+from backend.app.core.question_cache import question_cache
+from backend.app.core.user_cache import UserIdentity
+from backend.app.core.view_buffer import view_buffer
+from backend.app.db.duplicates import duplicate_index
+from backend.app.db.session import get_async_db, get_db
+from backend.app.repositories.answer_repo import list_answers_for_question_ordered
 from backend.app.repositories.question_repo import (
     create_question,
+    encode_cursor,
     get_question_by_id,
+    get_question_stamps,
+    get_questions_by_ids,
     list_questions,
-    search_questions_by_title,
+    search_snippets,
 )
 from backend.app.repositories.question_tag_repo import list_tags_for_question
 from backend.app.repositories.related_question_repo import (
     list_related_questions,
     list_related_questions_by_tags,
 )
-from backend.app.repositories.question_view_repo import (
-    count_views_for_question,
-    create_view,
-    has_view_for_question,
+from backend.app.schemas.question import (
+    DuplicateQuestionOut,
+    QuestionCreate,
+    QuestionOut,
 )
-from backend.app.repositories.vote_repo import get_vote_score
-from backend.app.schemas.question import QuestionCreate, QuestionOut
 from backend.app.schemas.question_detail import QuestionDetailOut
+from backend.app.services.answer_service import build_answer_outs
+from backend.app.services.question_service import (
+    build_question_outs,
+    load_author_names,
+)
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
 
-def _author_lookup(db: Session, author_ids: list) -> dict:
-    if not author_ids:
-        return {}
-    rows = db.execute(
-        select(User.id, User.full_name).where(User.id.in_(author_ids))
-    ).all()
-    return {row[0]: row[1] for row in rows}
-
-
-def _question_out(db: Session, question, author_map: dict | None = None) -> QuestionOut:
-    author_name = None
-    if author_map is not None:
-        author_name = author_map.get(question.author_id)
-    return QuestionOut(
-        id=question.id,
-        author_id=question.author_id,
-        author_name=author_name,
-        title=question.title,
-        body=question.body,
-        category=question.category,
-        stage=question.stage,
-        accepted_answer_id=question.accepted_answer_id,
-        created_at=question.created_at,
-        updated_at=question.updated_at,
-        answers_count=count_answers_for_question(db, question_id=question.id),
-        views_count=count_views_for_question(db, question_id=question.id),
-        vote_score=get_vote_score(
-            db, target_type="question", target_id=question.id
-        ),
-    )
-
-
 @router.post("", response_model=QuestionOut)
 def create_question_endpoint(
     payload: QuestionCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> QuestionOut:
     question = create_question(
         db,
@@ -80,116 +56,174 @@ def create_question_endpoint(
         category=payload.category,
         stage=payload.stage,
     )
-    return _question_out(db, question, {current_user.id: current_user.full_name})
+    return build_question_outs(
+        db, [question], author_map={current_user.id: current_user.full_name}
+    )[0]
 
 
 @router.get("", response_model=list[QuestionOut])
-def list_questions_endpoint(
+async def list_questions_endpoint(
+    request: Request,
+    response: Response,
     limit: int = 20,
     offset: int = 0,
     tag: str | None = None,
     category: str | None = None,
     stage: str | None = None,
     q: str | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[QuestionOut]:
-    questions = list_questions(
-        db,
-        limit=limit,
-        offset=offset,
-        tag=tag,
-        category=category,
-        stage=stage,
-        q=q,
+    if q is not None and cursor is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor is not supported with q",
+        )
+    etag = make_etag(
+        "questions",
+        await db.run_sync(get_content_version, name="questions"),
+        request.url.query,
     )
-    author_map = _author_lookup(db, [q.author_id for q in questions])
-    return [_question_out(db, q, author_map) for q in questions]
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    try:
+        questions, outs = await db.run_sync(
+            _list_questions_page,
+            limit=limit,
+            offset=offset,
+            tag=tag,
+            category=category,
+            stage=stage,
+            q=q,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="invalid cursor"
+        )
+
+    if q is None and questions and len(questions) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(questions[-1])
+    return outs
+
 
+def _list_questions_page(db: Session, *, q: str | None, **filters):
+    questions = list_questions(db, q=q, **filters)
+    snippets = None
+    if q and questions:
+        snippets = search_snippets(db, q=q, question_ids=[x.id for x in questions])
+    return questions, build_question_outs(db, questions, snippets=snippets)
 
-@router.get("/duplicates", response_model=list[QuestionOut])
+
+@router.get("/duplicates", response_model=list[DuplicateQuestionOut])
 def duplicate_questions_endpoint(
     title: str,
+    body: str | None = None,
+    limit: int = 5,
     db: Session = Depends(get_db),
-) -> list[QuestionOut]:
+) -> list[DuplicateQuestionOut]:
     if len(title) < 10:
         return []
 
-    questions = search_questions_by_title(db, title=title, limit=5)
-    author_map = _author_lookup(db, [q.author_id for q in questions])
-    return [_question_out(db, q, author_map) for q in questions]
+    matches = duplicate_index.query(title, body=body, limit=limit)
+    scores = dict(matches)
+    questions = get_questions_by_ids(db, question_ids=[i for i, _ in matches])
+    return [
+        DuplicateQuestionOut(**out.model_dump(), score=round(scores[out.id], 3))
+        for out in build_question_outs(db, questions)
+    ]
 
 
 @router.get("/{question_id}", response_model=QuestionDetailOut)
-def get_question_endpoint(
+async def get_question_endpoint(
     question_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     track_view: bool = False,
     view_session: str | None = Header(default=None, alias="X-View-Session"),
-    current_user: User | None = Depends(get_optional_user),
+    current_user: UserIdentity | None = Depends(get_optional_user_async),
 ) -> QuestionDetailOut:
-    question = get_question_by_id(db, question_id=question_id)
-    if question is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="question not found"
-        )
+    # A cached payload is served only while the versions it was built from
+    # are current; another process may have committed since.
+    entry = question_cache.get(question_id)
+    if entry is not None:
+        entry, stamps = entry
+        current = await db.run_sync(_detail_stamps, question_ids=list(stamps[1]))
+        if current != stamps:
+            question_cache.discard_stale(question_id)
+            entry = None
+    if entry is None:
+        entry = await db.run_sync(_build_question_detail, question_id=question_id)
+        if entry is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="question not found"
+            )
+    detail, etag = entry
+    cached = not_modified(request, response, etag)
 
     if track_view:
-        viewer_id = current_user.id if current_user is not None else None
-        has_view = has_view_for_question(
-            db,
-            question_id=question.id,
-            viewer_id=viewer_id,
+        view_buffer.record(
+            question_id,
+            viewer_id=current_user.id if current_user is not None else None,
             viewer_session=view_session,
         )
-        if not has_view:
-            create_view(
-                db,
-                question_id=question.id,
-                viewer_id=viewer_id,
-                viewer_session=view_session,
-            )
+    return cached if cached is not None else detail
+
+
+def _detail_stamps(db: Session, *, question_ids: list) -> tuple[int, dict]:
+    return (
+        get_content_version(db, name="question_details"),
+        get_question_stamps(db, question_ids=question_ids),
+    )
 
+
+def _build_question_detail(
+    db: Session, *, question_id
+) -> tuple[QuestionDetailOut, str] | None:
+    version = question_cache.version()
+    epoch = get_content_version(db, name="question_details")
+    question = get_question_by_id(db, question_id=question_id)
+    if question is None:
+        return None
     answers = list_answers_for_question_ordered(db, question_id=question_id)
     tags = list_tags_for_question(db, question_id=question_id)
     related = list_related_questions(db, question_id=question_id)
     if not related:
-      related = list_related_questions_by_tags(db, question_id=question_id)
+        related = list_related_questions_by_tags(db, question_id=question_id)
     author_ids = {question.author_id}
     author_ids.update(a.author_id for a in answers)
     author_ids.update(q.author_id for q in related)
-    author_map = _author_lookup(db, list(author_ids))
-
-    answers_out = [
-        {
-            "id": a.id,
-            "question_id": a.question_id,
-            "author_id": a.author_id,
-            "author_name": author_map.get(a.author_id),
-            "body": a.body,
-            "is_accepted": a.is_accepted,
-            "created_at": a.created_at,
-            "updated_at": a.updated_at,
-            "vote_score": get_vote_score(
-                db, target_type="answer", target_id=a.id
-            ),
-        }
-        for a in answers
-    ]
+    author_map = load_author_names(db, author_ids)
 
-    return QuestionDetailOut(
-        id=question.id,
-        author_id=question.author_id,
-        author_name=author_map.get(question.author_id),
-        title=question.title,
-        body=question.body,
-        category=question.category,
-        stage=question.stage,
-        accepted_answer_id=question.accepted_answer_id,
-        created_at=question.created_at,
-        updated_at=question.updated_at,
-        answers_count=count_answers_for_question(db, question_id=question.id),
-        views_count=count_views_for_question(db, question_id=question.id),
-        answers=answers_out,
+    question_out, *related_out = build_question_outs(
+        db, [question, *related], author_map=author_map
+    )
+
+    detail = QuestionDetailOut(
+        **question_out.model_dump(),
+        answers=build_answer_outs(db, answers, author_map=author_map),
         tags=tags,
-        related_questions=[_question_out(db, q, author_map) for q in related],
+        related_questions=related_out,
+    )
+    # The detail embeds its related questions, so their stamps are part of
+    # the ETag too.
+    versions = {q.id: (q.version, q.views_count) for q in (question, *related)}
+    etag = make_etag(
+        "question",
+        question_id,
+        epoch,
+        *sorted(
+            f"{key}:{version}:{views}" for key, (version, views) in versions.items()
+        ),
+    )
+    question_cache.put(
+        question_id,
+        (detail, etag),
+        depends_on={q.id for q in related},
+        stamps=(epoch, versions),
+        version=version,
     )
+    return detail, etag
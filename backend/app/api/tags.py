@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from backend.app.core.content_versions import get_content_version
 from backend.app.core.deps import get_current_user
+from backend.app.core.http_cache import make_etag, not_modified
+from backend.app.core.user_cache import UserIdentity
 from backend.app.db.session import get_db
-from backend.app.models.user import User
 from backend.app.repositories.question_repo import get_question_by_id
 from backend.app.repositories.question_tag_repo import attach_tags, list_tags_for_question
 from backend.app.repositories.tag_repo import create_tag, list_tags
@@ -14,7 +16,13 @@ router = APIRouter(tags=["tags"])
 
 
 @router.get("/tags", response_model=list[TagOut])
-def list_tags_endpoint(db: Session = Depends(get_db)) -> list[TagOut]:
+def list_tags_endpoint(
+    request: Request, response: Response, db: Session = Depends(get_db)
+) -> list[TagOut]:
+    etag = make_etag("tags", get_content_version(db, name="tags"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
     return list_tags(db)
 
 
@@ -22,7 +30,7 @@ def list_tags_endpoint(db: Session = Depends(get_db)) -> list[TagOut]:
 def create_tag_endpoint(
     payload: TagCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> TagOut:
     if current_user.role != "admin":
         raise HTTPException(
@@ -37,7 +45,7 @@ def attach_tags_endpoint(
     question_id,
     payload: QuestionTagCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user),
 ) -> list[TagOut]:
     question = get_question_by_id(db, question_id=question_id)
     if question is None:
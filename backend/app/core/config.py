@@ -5,10 +5,57 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_url: str = ""
+    async_db: bool = True
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: str = "auto"
+    sqlite_journal_mode: str = "wal"
+    sqlite_synchronous: str = "normal"
+    sqlite_mmap_size: int = 268435456
+    sqlite_cache_size_kib: int = 65536
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_foreign_keys: bool = True
     jwt_secret: str = ""
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
     cors_origins: str = "http://localhost:5173,http://127.0.0.1:5173"
+    search_backend: str = "auto"
+    duplicate_index_path: str = ""
+    question_cache_size: int = 1024
+    question_cache_ttl_seconds: float = 300
+    user_cache_size: int = 10000
+    user_cache_ttl_seconds: float = 60
+    token_cache_size: int = 10000
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 256
+    public_cache_control: str = "public, max-age=0, must-revalidate"
+    view_flush_interval_ms: int = 1000
+    view_flush_size: int = 500
+    view_buffer_max_pending: int = 10000
+    view_dedupe_size: int = 100000
+    store_view_rows: bool = True
+    view_list_refresh_seconds: float = 60
+    outbox_workers: int = 2
+    outbox_poll_interval_ms: int = 1000
+    outbox_batch_size: int = 100
+    outbox_max_attempts: int = 8
+    outbox_retry_base_ms: int = 1000
+    outbox_retry_max_ms: int = 300000
+    outbox_lease_seconds: float = 60
+    pubsub_relay: str = "local"
+    pubsub_queue_size: int = 100
+    pubsub_poll_interval_ms: int = 500
+    pubsub_retention_seconds: int = 300
+    pubsub_lookback_seconds: float = 10
+    sse_heartbeat_seconds: float = 15
+    sse_ticket_seconds: int = 60
+    sse_max_streams_per_question: int = 500
+    sse_max_streams_per_client: int = 10
+    notification_coalesce_seconds: int = 3600
+    notification_coalesce_actors: int = 3
 
     model_config = SettingsConfigDict(
         env_file=(
@@ -0,0 +1,90 @@
+import random
+import zlib
+
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.app.models.content_version import ContentVersion
+
+CONTENT_NAMES = ("questions", "question_details", "tags", "faqs")
+
+# Versions written by most requests are spread over several rows so that
+# concurrent writers bump different rows instead of queueing on one lock.
+# Readers add the rows up; the unstriped row is kept in the sum so the
+# version never goes backwards.
+STRIPED_NAMES = {"questions": 16}
+
+_PENDING = "content_versions_pending"
+
+
+def _row_names(name: str) -> list[str]:
+    stripes = STRIPED_NAMES.get(name, 0)
+    return [name, *(f"{name}:{slot}" for slot in range(stripes))]
+
+
+def _row_name(name: str, key) -> str:
+    stripes = STRIPED_NAMES.get(name)
+    if stripes is None:
+        return name
+    if key is None:
+        slot = random.randrange(stripes)
+    else:
+        slot = zlib.crc32(str(key).encode("utf-8")) % stripes
+    return f"{name}:{slot}"
+
+
+def mark_content_changed(session: Session, *names: str, key=None) -> None:
+    session.info.setdefault(_PENDING, set()).update(
+        _row_name(name, key) for name in names
+    )
+
+
+def get_content_version(session: Session, *, name: str) -> int:
+    stmt = select(func.sum(ContentVersion.version)).where(
+        ContentVersion.name.in_(_row_names(name))
+    )
+    return session.scalar(stmt) or 0
+
+
+def seed_content_versions(engine: Engine) -> None:
+    with engine.begin() as conn:
+        existing = set(conn.scalars(select(ContentVersion.name)).all())
+        missing = [
+            row
+            for name in CONTENT_NAMES
+            for row in _row_names(name)
+            if row not in existing
+        ]
+        if missing:
+            conn.execute(insert(ContentVersion), [{"name": n} for n in missing])
+
+
+# Stamps are bumped inside the writing transaction so every worker sees the
+# new version as soon as the data itself is visible.
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session: Session) -> None:
+    names = session.info.pop(_PENDING, None)
+    if not names:
+        return
+    result = session.execute(
+        update(ContentVersion)
+        .where(ContentVersion.name.in_(sorted(names)))
+        .values(version=ContentVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount < len(names):
+        existing = set(
+            session.scalars(
+                select(ContentVersion.name).where(ContentVersion.name.in_(names))
+            ).all()
+        )
+        session.execute(
+            insert(ContentVersion),
+            [{"name": n, "version": 1} for n in sorted(names - existing)],
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -1,68 +1,168 @@
+import hashlib
+import threading
+import time
 import uuid
+from collections import OrderedDict
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.app.core.jwt import decode_token
-from backend.app.db.session import get_db
-from backend.app.repositories.user_repo import get_user_by_id
+from backend.app.core.config import Settings
+from backend.app.core.jwt import STREAM_TICKET_PURPOSE, decode_token
+from backend.app.core.user_cache import UserIdentity
+from backend.app.db.session import get_async_db, get_db
+from backend.app.repositories.user_repo import get_user_identity
 
+settings = Settings()
 security = HTTPBearer(auto_error=False)
 
 
-def get_optional_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    db: Session = Depends(get_db),
-):
+class TokenClaimCache:
+    # Verified (subject, exp) pairs keyed by a digest of the token, so a
+    # repeated bearer token skips signature checking and parsing. Entries
+    # are dropped once exp passes, using the same whole-second comparison
+    # as jose.
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: bytes) -> uuid.UUID | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < int(time.time()):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: bytes, user_id: uuid.UUID, exp: int) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (user_id, exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+token_cache = TokenClaimCache(settings.token_cache_size)
+
+
+def token_subject(token: str) -> uuid.UUID:
+    # Raises JWTError or ValueError for a token that does not verify.
+    key = hashlib.sha256(token.encode()).digest()
+    user_id = token_cache.get(key)
+    if user_id is not None:
+        return user_id
+    payload = decode_token(token)
+    sub = payload.get("sub")
+    if not sub:
+        raise ValueError("token has no subject")
+    if "purpose" in payload:
+        raise ValueError("token is not an access token")
+    user_id = uuid.UUID(sub)
+    if isinstance(payload.get("exp"), int):
+        token_cache.put(key, user_id, payload["exp"])
+    return user_id
+
+
+def stream_ticket_subject(ticket: str) -> uuid.UUID:
+    # Raises JWTError or ValueError for anything but a live stream ticket.
+    payload = decode_token(ticket)
+    if payload.get("purpose") != STREAM_TICKET_PURPOSE or not payload.get("sub"):
+        raise ValueError("token is not a stream ticket")
+    return uuid.UUID(payload["sub"])
+
+
+def _optional_subject(credentials) -> uuid.UUID | None:
     if credentials is None:
         return None
-
-    token = credentials.credentials
     try:
-        payload = decode_token(token)
-        sub = payload.get("sub")
-        if not sub:
-            return None
-        user_id = uuid.UUID(sub)
+        return token_subject(credentials.credentials)
     except (JWTError, ValueError):
         return None
 
-    return get_user_by_id(db, user_id)
-
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    db: Session = Depends(get_db),
-):
+def _required_subject(credentials) -> uuid.UUID:
     if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="not authenticated",
         )
 
-    token = credentials.credentials
     try:
-        payload = decode_token(token)
-        sub = payload.get("sub")
-        if not sub:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="invalid token",
-            )
-        user_id = uuid.UUID(sub)
+        return token_subject(credentials.credentials)
     except (JWTError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="invalid token",
         )
 
-    user = get_user_by_id(db, user_id)
+
+def _require_user(user):
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="user not found",
         )
-
     return user
+
+
+def get_optional_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: Session = Depends(get_db),
+) -> UserIdentity | None:
+    user_id = _optional_subject(credentials)
+    if user_id is None:
+        return None
+    return get_user_identity(db, user_id)
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: Session = Depends(get_db),
+) -> UserIdentity:
+    user_id = _required_subject(credentials)
+    return _require_user(get_user_identity(db, user_id))
+
+
+# Variants for async handlers; they share the handler's get_async_db session.
+
+
+async def get_optional_user_async(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> UserIdentity | None:
+    user_id = _optional_subject(credentials)
+    if user_id is None:
+        return None
+    return await db.run_sync(get_user_identity, user_id)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> UserIdentity:
+    user_id = _required_subject(credentials)
+    return _require_user(await db.run_sync(get_user_identity, user_id))
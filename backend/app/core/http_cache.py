@@ -0,0 +1,39 @@
+import hashlib
+
+from fastapi import Request, Response
+
+from backend.app.core.config import Settings
+
+settings = Settings()
+
+
+def make_etag(*parts) -> str:
+    raw = ":".join(str(part) for part in parts)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            "private, no-cache"
+            if "authorization" in request.headers
+            else settings.public_cache_control
+        ),
+        "Vary": "Authorization",
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    candidates = {_strip_weak(tag) for tag in if_none_match.split(",")}
+    if "*" in candidates or _strip_weak(etag) in candidates:
+        return Response(status_code=304, headers=headers)
+    return None
@@ -6,6 +6,8 @@ from backend.app.core.config import Settings
 
 settings = Settings()
 
+STREAM_TICKET_PURPOSE = "events"
+
 
 def create_access_token(sub: str, expires_delta: timedelta | None = None) -> str:
     expire = datetime.now(tz=timezone.utc) + (
@@ -17,5 +19,14 @@ def create_access_token(sub: str, expires_delta: timedelta | None = None) -> str
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
+def create_stream_ticket(sub: str) -> str:
+    # Only good for opening an event stream; access-token checks refuse it.
+    expire = datetime.now(tz=timezone.utc) + timedelta(
+        seconds=settings.sse_ticket_seconds
+    )
+    payload = {"sub": sub, "exp": expire, "purpose": STREAM_TICKET_PURPOSE}
+    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
@@ -0,0 +1,183 @@
+import logging
+import threading
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.config import Settings
+from backend.app.repositories.outbox_repo import (
+    claim_outbox_events,
+    complete_outbox_event,
+    retry_outbox_event,
+)
+from backend.app.services.notification_service import OUTBOX_HANDLERS
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+
+class OutboxWorker:
+    # Side effects are recorded as outbox_events rows in the transaction that
+    # caused them and applied here, off the request path. Each event's
+    # effects are committed together with its deletion, so a delivered event
+    # is applied exactly once; failures are retried with exponential backoff
+    # and parked after max_attempts.
+    def __init__(
+        self,
+        *,
+        handlers: dict,
+        workers: int,
+        poll_interval_ms: int,
+        batch_size: int,
+        max_attempts: int,
+        retry_base_ms: int,
+        retry_max_ms: int,
+        lease_seconds: float,
+    ) -> None:
+        self.handlers = dict(handlers)
+        self.workers = workers
+        self.poll_interval_ms = poll_interval_ms
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_ms = retry_base_ms
+        self.retry_max_ms = retry_max_ms
+        self.lease_seconds = lease_seconds
+        self.processed = 0
+        self.retried = 0
+        self.dead = 0
+        self.lost = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._session_factory = None
+
+    def retry_delay(self, attempts: int) -> float | None:
+        if attempts >= self.max_attempts:
+            return None
+        delay_ms = min(self.retry_base_ms * 2 ** (attempts - 1), self.retry_max_ms)
+        return delay_ms / 1000
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _deliver(self, session_factory, token: str, event) -> None:
+        event_id, topic, payload, attempts = event
+        try:
+            handler = self.handlers.get(topic)
+            if handler is None:
+                raise LookupError(f"no outbox handler for topic {topic!r}")
+            with session_factory() as session:
+                handler(session, payload)
+                if not complete_outbox_event(
+                    session, event_id=event_id, claimed_by=token
+                ):
+                    # The lease ran out and another worker owns the event now.
+                    session.rollback()
+                    self._count("lost")
+                    return
+                session.commit()
+            self._count("processed")
+        except Exception as exc:
+            delay = self.retry_delay(attempts)
+            logger.warning(
+                "outbox event %s (%s) failed on attempt %d",
+                event_id,
+                topic,
+                attempts,
+                exc_info=True,
+            )
+            with session_factory() as session:
+                retry_outbox_event(
+                    session,
+                    event_id=event_id,
+                    claimed_by=token,
+                    error=f"{type(exc).__name__}: {exc}"[:1000],
+                    delay_seconds=delay,
+                )
+            self._count("retried" if delay is not None else "dead")
+
+    def run_once(self, session_factory=None) -> int:
+        session_factory = session_factory or self._session_factory
+        if session_factory is None:
+            return 0
+        try:
+            with session_factory() as session:
+                token, events = claim_outbox_events(
+                    session, limit=self.batch_size, lease_seconds=self.lease_seconds
+                )
+            for event in events:
+                self._deliver(session_factory, token, event)
+        except Exception:
+            logger.exception("outbox batch failed")
+            return 0
+        return len(events)
+
+    def drain(self, session_factory=None) -> int:
+        # Deliver everything that is due now; retries scheduled for later
+        # are left for the next pass.
+        total = 0
+        while True:
+            claimed = self.run_once(session_factory)
+            if not claimed:
+                return total
+            total += claimed
+
+    def kick(self, bind=None) -> None:
+        # Called after a request commits events. Running workers are woken;
+        # without them (no lifespan) the events are delivered inline, unless
+        # the in-process pool is disabled in favour of the worker CLI.
+        if self._threads:
+            self._wakeup.set()
+        elif self.workers > 0 and bind is not None:
+            self.drain(sessionmaker(bind=bind))
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            if self.run_once():
+                continue
+            self._wakeup.wait(self.poll_interval_ms / 1000)
+            self._wakeup.clear()
+
+    def start(self, session_factory, workers: int | None = None) -> None:
+        self._session_factory = session_factory
+        if workers is not None:
+            self.workers = workers
+        if self._threads:
+            return
+        self._stopping.clear()
+        for idx in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"outbox-worker-{idx}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": len(self._threads),
+                "processed": self.processed,
+                "retried": self.retried,
+                "dead": self.dead,
+                "lost": self.lost,
+            }
+
+
+outbox_worker = OutboxWorker(
+    handlers=OUTBOX_HANDLERS,
+    workers=settings.outbox_workers,
+    poll_interval_ms=settings.outbox_poll_interval_ms,
+    batch_size=settings.outbox_batch_size,
+    max_attempts=settings.outbox_max_attempts,
+    retry_base_ms=settings.outbox_retry_base_ms,
+    retry_max_ms=settings.outbox_retry_max_ms,
+    lease_seconds=settings.outbox_lease_seconds,
+)
@@ -0,0 +1,286 @@
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, event, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import Settings
+from backend.app.models.pubsub_message import PubSubMessage
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+_PENDING = "pubsub_pending"
+
+RESYNC = {"event": "resync", "data": {}}
+
+
+def user_channel(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def question_channel(question_id) -> str:
+    return f"question:{question_id}"
+
+
+def _utc(value: datetime) -> datetime:
+    # SQLite hands back naive timestamps; they were written in UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def format_sse(message: dict) -> str:
+    return f"event: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+
+
+class Subscription:
+    # Messages are handed over on the subscriber's event loop. A subscriber
+    # that falls max_queue messages behind loses its backlog and gets a
+    # single resync message telling it to refetch instead.
+    def __init__(self, channels: list[str], *, loop, max_queue: int) -> None:
+        self.channels = channels
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def offer(self, message: dict) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize() + 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+    async def get(self, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class PubSubBroker:
+    # In-process fan-out to SSE subscribers. With relay="database" every
+    # published batch is also written to pubsub_messages and each process
+    # polls that table for batches from the others, so subscribers see
+    # events no matter which worker produced them. Ids are handed out before
+    # commit, so a batch can become visible after a higher id was already
+    # read; each poll re-reads the last lookback_seconds and skips the ids
+    # it has delivered.
+    def __init__(
+        self,
+        *,
+        max_queue: int,
+        relay: str = "local",
+        poll_interval_ms: int = 500,
+        retention_seconds: int = 300,
+        lookback_seconds: float = 10,
+    ) -> None:
+        self.max_queue = max_queue
+        self.relay = relay
+        self.poll_interval_ms = poll_interval_ms
+        self.retention_seconds = retention_seconds
+        self.lookback_seconds = lookback_seconds
+        self.origin = uuid.uuid4().hex
+        self.published = 0
+        self.delivered = 0
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._session_factory = None
+        self._last_id = 0
+        self._seen: dict[int, datetime] = {}
+
+    def subscribe(self, channels: list[str]) -> Subscription:
+        subscription = Subscription(
+            channels, loop=asyncio.get_running_loop(), max_queue=self.max_queue
+        )
+        with self._lock:
+            for channel in channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def deliver(self, messages: list[dict]) -> int:
+        delivered = 0
+        for message in messages:
+            with self._lock:
+                subscribers = list(self._subscribers.get(message["channel"], ()))
+            for subscription in subscribers:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.offer, message)
+                except RuntimeError:
+                    # The subscriber's loop is gone.
+                    self.unsubscribe(subscription)
+                    continue
+                delivered += 1
+        with self._lock:
+            self.delivered += delivered
+        return delivered
+
+    def publish(self, messages: list[dict]) -> None:
+        if not messages:
+            return
+        with self._lock:
+            self.published += len(messages)
+        self.deliver(messages)
+        if self.relay == "database" and self._session_factory is not None:
+            try:
+                with self._session_factory() as session:
+                    session.execute(
+                        insert(PubSubMessage).values(
+                            origin=self.origin, messages=messages
+                        )
+                    )
+                    session.commit()
+            except Exception:
+                logger.exception("dropping %d relayed messages", len(messages))
+
+    def poll(self) -> int:
+        if self._session_factory is None:
+            return 0
+        horizon = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=self.lookback_seconds
+        )
+        with self._session_factory() as session:
+            rows = session.execute(
+                select(
+                    PubSubMessage.id,
+                    PubSubMessage.origin,
+                    PubSubMessage.messages,
+                    PubSubMessage.created_at,
+                )
+                .where(
+                    or_(
+                        PubSubMessage.id > self._last_id,
+                        PubSubMessage.created_at >= horizon,
+                    )
+                )
+                .order_by(PubSubMessage.id)
+            ).all()
+        delivered = 0
+        for row_id, origin, messages, created_at in rows:
+            if row_id in self._seen:
+                continue
+            self._seen[row_id] = _utc(created_at)
+            self._last_id = max(self._last_id, row_id)
+            if origin != self.origin:
+                delivered += self.deliver(messages)
+        # Rows behind the horizon are at or below _last_id, so no later
+        # poll can return them again.
+        self._seen = {
+            row_id: created_at
+            for row_id, created_at in self._seen.items()
+            if created_at >= horizon
+        }
+        return delivered
+
+    def prune(self) -> int:
+        cutoff = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=self.retention_seconds
+        )
+        with self._session_factory() as session:
+            result = session.execute(
+                delete(PubSubMessage).where(PubSubMessage.created_at < cutoff)
+            )
+            session.commit()
+        return result.rowcount
+
+    def _run(self) -> None:
+        polls = 0
+        while not self._stopping.wait(self.poll_interval_ms / 1000):
+            try:
+                self.poll()
+                polls += 1
+                if polls % 120 == 0:
+                    self.prune()
+            except Exception:
+                logger.exception("pubsub relay poll failed")
+
+    def start(self, session_factory) -> None:
+        self._session_factory = session_factory
+        if self.relay != "database" or self._thread is not None:
+            return
+        horizon = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=self.lookback_seconds
+        )
+        with session_factory() as session:
+            self._last_id = session.scalar(select(func.max(PubSubMessage.id))) or 0
+            # Batches already in the window predate this process.
+            self._seen = {
+                row_id: _utc(created_at)
+                for row_id, created_at in session.execute(
+                    select(PubSubMessage.id, PubSubMessage.created_at).where(
+                        PubSubMessage.created_at >= horizon
+                    )
+                )
+            }
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pubsub-relay", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            subscriptions = {
+                subscription
+                for subscribers in self._subscribers.values()
+                for subscription in subscribers
+            }
+            return {
+                "relay": self.relay,
+                "channels": len(self._subscribers),
+                "subscribers": len(subscriptions),
+                "published": self.published,
+                "delivered": self.delivered,
+                "dropped": sum(s.dropped for s in subscriptions),
+            }
+
+
+pubsub = PubSubBroker(
+    max_queue=settings.pubsub_queue_size,
+    relay=settings.pubsub_relay,
+    poll_interval_ms=settings.pubsub_poll_interval_ms,
+    retention_seconds=settings.pubsub_retention_seconds,
+    lookback_seconds=settings.pubsub_lookback_seconds,
+)
+
+
+def publish_after_commit(session: Session, channel: str, name: str, data: dict) -> None:
+    session.info.setdefault(_PENDING, []).append(
+        {"channel": channel, "event": name, "data": data}
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    messages = session.info.pop(_PENDING, None)
+    if messages:
+        pubsub.publish(messages)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
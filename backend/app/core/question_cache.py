@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import Settings
+from backend.app.core.content_versions import mark_content_changed
+from backend.app.models.question import Question
+
+settings = Settings()
+
+_PENDING = "question_cache_pending"
+_CLEAR_ALL = object()
+
+
+class QuestionDetailCache:
+    # Entries remember which questions they embed (the question itself plus
+    # its related questions) so a change to any of them evicts the entry.
+    # That only covers commits made in this process; callers also compare an
+    # entry's stamps with the database before serving it, and entries expire
+    # after ttl_seconds.
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stale = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._dependents: dict = {}
+        self._version = 0
+
+    def get(self, question_id):
+        with self._lock:
+            entry = self._entries.get(question_id)
+            if entry is None or entry[3] < time.monotonic():
+                if entry is not None:
+                    self._drop(question_id)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(question_id)
+            self.hits += 1
+            return entry[0], entry[2]
+
+    def discard_stale(self, question_id) -> None:
+        with self._lock:
+            if question_id in self._entries:
+                self._drop(question_id)
+                self.stale += 1
+
+    def version(self) -> int:
+        return self._version
+
+    def put(self, question_id, payload, *, depends_on, stamps, version: int) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            # Skip the store if anything was invalidated while the payload was
+            # being assembled; it may have been read before that commit.
+            if version != self._version:
+                return
+            self._drop(question_id)
+            depends_on = set(depends_on) | {question_id}
+            self._entries[question_id] = (payload, depends_on, stamps, expires_at)
+            for dependency in depends_on:
+                self._dependents.setdefault(dependency, set()).add(question_id)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, question_id) -> None:
+        entry = self._entries.pop(question_id, None)
+        if entry is None:
+            return
+        for dependency in entry[1]:
+            dependents = self._dependents.get(dependency)
+            if dependents is None:
+                continue
+            dependents.discard(question_id)
+            if not dependents:
+                del self._dependents[dependency]
+
+    def invalidate(self, question_ids) -> None:
+        with self._lock:
+            self._version += 1
+            for question_id in question_ids:
+                for dependent in self._dependents.get(question_id, set()).copy():
+                    self._drop(dependent)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._dependents.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "stale": self.stale,
+            }
+
+
+question_cache = QuestionDetailCache(
+    settings.question_cache_size, settings.question_cache_ttl_seconds
+)
+
+
+def mark_questions_changed(session: Session, *question_ids) -> None:
+    session.info.setdefault(_PENDING, set()).update(question_ids)
+    for question_id in question_ids:
+        mark_content_changed(session, "questions", key=question_id)
+
+
+def mark_all_questions_changed(session: Session) -> None:
+    session.info.setdefault(_PENDING, set()).add(_CLEAR_ALL)
+    mark_content_changed(session, "questions", "question_details")
+
+
+# Per-question versions back the detail ETags. They are bumped in the
+# writing transaction, which already holds these rows for its own updates.
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session: Session) -> None:
+    question_ids = session.info.get(_PENDING, set()) - {_CLEAR_ALL}
+    if not question_ids:
+        return
+    session.execute(
+        update(Question)
+        .where(Question.id.in_(sorted(question_ids)))
+        .values(version=Question.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if not pending:
+        return
+    if _CLEAR_ALL in pending:
+        question_cache.clear()
+    else:
+        question_cache.invalidate(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
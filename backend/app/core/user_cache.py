@@ -0,0 +1,109 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import Settings
+
+settings = Settings()
+
+_PENDING = "user_cache_pending"
+
+
+class UserIdentity(NamedTuple):
+    id: uuid.UUID
+    full_name: str
+    role: str
+
+
+class UserIdentityCache:
+    # Entries expire after ttl_seconds so changes committed by other
+    # processes are picked up; changes committed here evict them at once.
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._version = 0
+
+    def get(self, user_id) -> UserIdentity | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[0]
+
+    def version(self) -> int:
+        return self._version
+
+    def put(self, identities, *, version: int) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            # A user changed while these rows were being read; they may be
+            # stale.
+            if version != self._version:
+                return
+            for identity in identities:
+                self._entries[identity.id] = (identity, expires_at)
+                self._entries.move_to_end(identity.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids) -> None:
+        with self._lock:
+            self._version += 1
+            for user_id in user_ids:
+                if self._entries.pop(user_id, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+user_cache = UserIdentityCache(
+    settings.user_cache_size, settings.user_cache_ttl_seconds
+)
+
+
+def mark_users_changed(session: Session, *user_ids) -> None:
+    session.info.setdefault(_PENDING, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if pending:
+        user_cache.invalidate(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
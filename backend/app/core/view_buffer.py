@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from backend.app.core.config import Settings
+from backend.app.core.content_versions import mark_content_changed
+from backend.app.repositories.question_view_repo import record_views
+
+settings = Settings()
+logger = logging.getLogger(__name__)
+
+
+class ViewBuffer:
+    # Views are queued in memory and written in batches by a background
+    # thread. Recently seen (question, viewer) pairs are remembered so repeat
+    # views are dropped before they reach the queue; the flush re-checks the
+    # database for pairs that fell out of that window. Flushed counts move
+    # the question list version at most every list_refresh_seconds, so list
+    # ETags pick them up without changing on every flush.
+    def __init__(
+        self,
+        *,
+        flush_interval_ms: int,
+        flush_size: int,
+        max_pending: int,
+        dedupe_size: int,
+        store_rows: bool = True,
+        list_refresh_seconds: float = 60,
+    ) -> None:
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_size = flush_size
+        self.max_pending = max_pending
+        self.dedupe_size = dedupe_size
+        self.store_rows = store_rows
+        self.list_refresh_seconds = list_refresh_seconds
+        self.recorded = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.flushed = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: list[tuple] = []
+        self._seen: OrderedDict = OrderedDict()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._session_factory = None
+        self._lists_stale = False
+        self._lists_refreshed_at: float | None = None
+
+    def record(self, question_id, *, viewer_id=None, viewer_session=None) -> bool:
+        key = (question_id, viewer_id if viewer_id is not None else viewer_session)
+        with self._lock:
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                self.duplicates += 1
+                return False
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._seen[key] = None
+            while len(self._seen) > self.dedupe_size:
+                self._seen.popitem(last=False)
+            self._pending.append((question_id, viewer_id, viewer_session))
+            self.recorded += 1
+            full = len(self._pending) >= self.flush_size
+        if full:
+            self._wakeup.set()
+        return True
+
+    def flush(self, session_factory=None) -> int:
+        session_factory = session_factory or self._session_factory
+        if session_factory is None:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            written = 0
+            if batch:
+                try:
+                    with session_factory() as session:
+                        written = record_views(
+                            session, views=batch, store_rows=self.store_rows
+                        )
+                except Exception:
+                    logger.exception("dropping %d buffered question views", len(batch))
+            self.flushed += written
+            self._lists_stale = self._lists_stale or written > 0
+            self._refresh_lists(session_factory)
+            return written
+
+    def _refresh_lists(self, session_factory) -> None:
+        now = time.monotonic()
+        if not self._lists_stale or (
+            self._lists_refreshed_at is not None
+            and now - self._lists_refreshed_at < self.list_refresh_seconds
+        ):
+            return
+        try:
+            with session_factory() as session:
+                mark_content_changed(session, "questions")
+                session.commit()
+        except Exception:
+            logger.exception("could not refresh question list versions")
+            return
+        self._lists_stale = False
+        self._lists_refreshed_at = now
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval_ms / 1000)
+            self._wakeup.clear()
+            self.flush()
+
+    def start(self, session_factory) -> None:
+        self._session_factory = session_factory
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="view-buffer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> int:
+        if self._thread is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        return self.flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._seen.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "recorded": self.recorded,
+                "duplicates": self.duplicates,
+                "dropped": self.dropped,
+                "flushed": self.flushed,
+            }
+
+
+view_buffer = ViewBuffer(
+    flush_interval_ms=settings.view_flush_interval_ms,
+    flush_size=settings.view_flush_size,
+    max_pending=settings.view_buffer_max_pending,
+    dedupe_size=settings.view_dedupe_size,
+    store_rows=settings.store_view_rows,
+    list_refresh_seconds=settings.view_list_refresh_seconds,
+)
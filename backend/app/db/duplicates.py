@@ -0,0 +1,258 @@
+import hashlib
+import json
+import random
+import re
+import threading
+import uuid
+from array import array
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import Settings
+from backend.app.models.question import Question
+
+settings = Settings()
+
+NUM_PERM = 96
+BAND_ROWS = 3
+BANDS = NUM_PERM // BAND_ROWS
+FORMAT_VERSION = 1
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)
+]
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it my of on or "
+    "the this to what when where which why with".split()
+)
+
+
+def shingles(text: str) -> set[str]:
+    tokens = set()
+    for token in re.findall(r"\w+", text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return tokens
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+def minhash(items: set[str]) -> array | None:
+    if not items:
+        return None
+    hashes = [_hash(item) for item in items]
+    return array(
+        "I",
+        (
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in _PERMUTATIONS
+        ),
+    )
+
+
+def similarity(left: array, right: array) -> float:
+    return sum(x == y for x, y in zip(left, right)) / NUM_PERM
+
+
+def _digest(title: str, body: str) -> str:
+    return hashlib.blake2b(
+        f"{title}\x00{body}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+def _bands(signature: array) -> list[int]:
+    return [
+        hash((band, *signature[band * BAND_ROWS : (band + 1) * BAND_ROWS]))
+        for band in range(BANDS)
+    ]
+
+
+class DuplicateIndex:
+    # Title signatures are banded for candidate lookup; body signatures are
+    # only used to re-rank candidates when the caller supplies a body.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[uuid.UUID, tuple[str, array, array | None]] = {}
+        self._buckets: dict[int, set[uuid.UUID]] = {}
+        self.path: Path | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, question_id, digest: str, title_sig, body_sig) -> None:
+        self._discard(question_id)
+        self._entries[question_id] = (digest, title_sig, body_sig)
+        if title_sig is None:
+            return
+        for key in _bands(title_sig):
+            self._buckets.setdefault(key, set()).add(question_id)
+
+    def _discard(self, question_id) -> None:
+        entry = self._entries.pop(question_id, None)
+        if entry is None or entry[1] is None:
+            return
+        for key in _bands(entry[1]):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(question_id)
+            if not bucket:
+                del self._buckets[key]
+
+    def add(self, question_id, *, title: str, body: str) -> None:
+        title_sig = minhash(shingles(title))
+        body_sig = minhash(shingles(body))
+        with self._lock:
+            self._insert(question_id, _digest(title, body), title_sig, body_sig)
+
+    def remove(self, question_id) -> None:
+        with self._lock:
+            self._discard(question_id)
+
+    def query(
+        self,
+        title: str,
+        *,
+        body: str | None = None,
+        limit: int = 5,
+        min_score: float = 0.2,
+    ) -> list[tuple[uuid.UUID, float]]:
+        title_sig = minhash(shingles(title))
+        if title_sig is None:
+            return []
+        body_sig = minhash(shingles(body)) if body else None
+
+        with self._lock:
+            candidates = set()
+            for key in _bands(title_sig):
+                candidates.update(self._buckets.get(key, ()))
+            scored = []
+            for question_id in candidates:
+                _, other_title, other_body = self._entries[question_id]
+                score = similarity(title_sig, other_title)
+                if body_sig is not None and other_body is not None:
+                    score = (score + similarity(body_sig, other_body)) / 2
+                if score >= min_score:
+                    scored.append((question_id, score))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+    def sync(self, session: Session) -> int:
+        rows = session.execute(select(Question.id, Question.title, Question.body)).all()
+        live = set()
+        updated = 0
+        for question_id, title, body in rows:
+            live.add(question_id)
+            entry = self._entries.get(question_id)
+            if entry is not None and entry[0] == _digest(title, body):
+                continue
+            self.add(question_id, title=title, body=body)
+            updated += 1
+        with self._lock:
+            for question_id in set(self._entries) - live:
+                self._discard(question_id)
+                updated += 1
+        return updated
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def load(self, path: Path) -> bool:
+        signatures = array("I")
+        try:
+            with path.open("rb") as handle:
+                header = json.loads(handle.readline())
+                signatures.frombytes(handle.read())
+        except (OSError, ValueError):
+            return False
+        if header.get("version") != FORMAT_VERSION:
+            return False
+        if header.get("num_perm") != NUM_PERM:
+            return False
+        if len(signatures) != 2 * NUM_PERM * len(header["entries"]):
+            return False
+
+        empty = array("I", [0] * NUM_PERM)
+        self.clear()
+        with self._lock:
+            for idx, (question_id, digest) in enumerate(header["entries"]):
+                start = 2 * idx * NUM_PERM
+                title_sig = signatures[start : start + NUM_PERM]
+                body_sig = signatures[start + NUM_PERM : start + 2 * NUM_PERM]
+                self._insert(
+                    uuid.UUID(question_id),
+                    digest,
+                    None if title_sig == empty else title_sig,
+                    None if body_sig == empty else body_sig,
+                )
+        return True
+
+    def save(self, path: Path) -> None:
+        empty = array("I", [0] * NUM_PERM)
+        signatures = array("I")
+        with self._lock:
+            entries = []
+            for question_id, (digest, title_sig, body_sig) in self._entries.items():
+                entries.append([str(question_id), digest])
+                signatures.extend(title_sig if title_sig is not None else empty)
+                signatures.extend(body_sig if body_sig is not None else empty)
+        header = {"version": FORMAT_VERSION, "num_perm": NUM_PERM, "entries": entries}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(json.dumps(header).encode("utf-8") + b"\n")
+            handle.write(signatures.tobytes())
+        tmp_path.replace(path)
+
+
+duplicate_index = DuplicateIndex()
+
+
+def index_path(engine: Engine) -> Path | None:
+    if settings.duplicate_index_path:
+        return Path(settings.duplicate_index_path)
+    database = engine.url.database
+    if engine.dialect.name == "sqlite" and database not in (None, "", ":memory:"):
+        return Path(database + ".duplicates")
+    return None
+
+
+def load_duplicate_index(session: Session, path: Path | None) -> int:
+    duplicate_index.path = path
+    if path is None or not duplicate_index.load(path):
+        duplicate_index.clear()
+    updated = duplicate_index.sync(session)
+    if path is not None and updated:
+        duplicate_index.save(path)
+    return updated
+
+
+def save_duplicate_index() -> None:
+    if duplicate_index.path is not None:
+        duplicate_index.save(duplicate_index.path)
+
+
+def index_question_duplicates(question: Question) -> None:
+    duplicate_index.add(question.id, title=question.title, body=question.body)
+
+
+def remove_question_duplicates(question_id) -> None:
+    duplicate_index.remove(question_id)
@@ -0,0 +1,74 @@
+import hashlib
+import math
+
+PRECISION = 11
+REGISTERS = 1 << PRECISION
+STANDARD_ERROR = 1.04 / math.sqrt(REGISTERS)
+
+_SPARSE = 0
+_DENSE = 1
+_RANK_BITS = 64 - PRECISION
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class HyperLogLog:
+    # Serialized as [precision, format, payload]. Sketches with few viewers
+    # store (register, rank) triples; they switch to one byte per register
+    # once that is smaller.
+    def __init__(self, registers: bytearray | None = None) -> None:
+        self.registers = registers if registers is not None else bytearray(REGISTERS)
+
+    def add(self, value: str) -> bool:
+        hashed = _hash(value)
+        index = hashed >> _RANK_BITS
+        rank = _RANK_BITS - (hashed & ((1 << _RANK_BITS) - 1)).bit_length() + 1
+        if rank <= self.registers[index]:
+            return False
+        self.registers[index] = rank
+        return True
+
+    def merge(self, other: "HyperLogLog") -> None:
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        zeros = self.registers.count(0)
+        if zeros == REGISTERS:
+            return 0
+        raw = _ALPHA * REGISTERS * REGISTERS / sum(2.0**-r for r in self.registers)
+        if raw <= 2.5 * REGISTERS and zeros:
+            return round(REGISTERS * math.log(REGISTERS / zeros))
+        return round(raw)
+
+    def to_bytes(self) -> bytes:
+        used = [(index, rank) for index, rank in enumerate(self.registers) if rank]
+        if 3 * len(used) >= REGISTERS:
+            return bytes([PRECISION, _DENSE]) + bytes(self.registers)
+        payload = bytearray([PRECISION, _SPARSE])
+        for index, rank in used:
+            payload += index.to_bytes(2, "big")
+            payload.append(rank)
+        return bytes(payload)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | None) -> "HyperLogLog":
+        if not data:
+            return cls()
+        if len(data) < 2 or data[0] != PRECISION:
+            raise ValueError("unsupported sketch precision")
+        if data[1] == _DENSE:
+            if len(data) != REGISTERS + 2:
+                raise ValueError("truncated dense sketch")
+            return cls(bytearray(data[2:]))
+        if (len(data) - 2) % 3:
+            raise ValueError("truncated sparse sketch")
+        registers = bytearray(REGISTERS)
+        for offset in range(2, len(data), 3):
+            index = int.from_bytes(data[offset : offset + 2], "big")
+            registers[index] = data[offset + 2]
+        return cls(registers)
@@ -0,0 +1,156 @@
+from sqlalchemy import DateTime, LargeBinary, inspect, text
+from sqlalchemy.engine import Engine
+
+from backend.app.core.content_versions import seed_content_versions
+from backend.app.db.base import Base
+from backend.app.db.search import search_index_exists
+
+# Columns added after the first release. Fresh databases get them from
+# create_all; existing ones are patched in place on startup. Types whose DDL
+# differs between dialects are given as SQLAlchemy types.
+ADDED_COLUMNS: dict[str, dict] = {
+    "question_views": {"viewer_session": "TEXT"},
+    "faqs": {"category": "TEXT"},
+    "questions": {
+        "answers_count": "INTEGER NOT NULL DEFAULT 0",
+        "views_count": "INTEGER NOT NULL DEFAULT 0",
+        "vote_score": "INTEGER NOT NULL DEFAULT 0",
+        "up_count": "INTEGER NOT NULL DEFAULT 0",
+        "down_count": "INTEGER NOT NULL DEFAULT 0",
+        "viewers_sketch": LargeBinary(),
+        "version": "INTEGER NOT NULL DEFAULT 0",
+    },
+    "answers": {
+        "vote_score": "INTEGER NOT NULL DEFAULT 0",
+        "up_count": "INTEGER NOT NULL DEFAULT 0",
+        "down_count": "INTEGER NOT NULL DEFAULT 0",
+    },
+    "votes": {"previous_value": "INTEGER NOT NULL DEFAULT 0"},
+    "notifications": {"group_key": "TEXT", "open_group_key": "TEXT"},
+    "notification_counters": {"last_read_at": DateTime()},
+}
+
+# Unique indexes that replaced plain ones. Rows violating them are removed,
+# keeping the newest, before the index is built; the old index is dropped.
+UNIQUE_INDEXES: dict[str, tuple[str, tuple[str, ...], str]] = {
+    "uq_votes_user_target": (
+        "votes",
+        ("user_id", "target_type", "target_id"),
+        "ix_votes_user_target",
+    ),
+    "uq_flags_user_target": (
+        "flags",
+        ("user_id", "target_type", "target_id"),
+        "ix_flags_user_target",
+    ),
+}
+
+# Plain indexes superseded by another index on the same leading column.
+RETIRED_INDEXES: dict[str, str] = {
+    "ix_question_tags_tag_id": "question_tags",
+    "ix_notifications_user_group": "notifications",
+}
+
+COUNTER_COLUMNS = {
+    ("questions", "answers_count"),
+    ("questions", "views_count"),
+    ("questions", "vote_score"),
+    ("questions", "up_count"),
+    ("questions", "down_count"),
+    ("answers", "vote_score"),
+    ("answers", "up_count"),
+    ("answers", "down_count"),
+}
+
+
+def add_missing_columns(engine: Engine) -> list[tuple[str, str]]:
+    inspector = inspect(engine)
+    table_names = set(inspector.get_table_names())
+    added = []
+    for table, new_columns in ADDED_COLUMNS.items():
+        if table not in table_names:
+            continue
+        existing = {col["name"] for col in inspector.get_columns(table)}
+        for name, ddl in new_columns.items():
+            if name in existing:
+                continue
+            if not isinstance(ddl, str):
+                ddl = ddl.compile(dialect=engine.dialect)
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+            added.append((table, name))
+    return added
+
+
+def remove_duplicate_rows(engine: Engine) -> dict[str, int]:
+    inspector = inspect(engine)
+    table_names = set(inspector.get_table_names())
+    removed = {}
+    for name, (table, columns, _) in UNIQUE_INDEXES.items():
+        if table not in table_names:
+            continue
+        if name in {index["name"] for index in inspector.get_indexes(table)}:
+            continue
+        partition = ", ".join(columns)
+        with engine.begin() as conn:
+            result = conn.execute(
+                text(
+                    f"DELETE FROM {table} WHERE id IN ("
+                    f"SELECT id FROM (SELECT id, ROW_NUMBER() OVER ("
+                    f"PARTITION BY {partition} ORDER BY created_at DESC, id DESC"
+                    f") AS position FROM {table}) ranked WHERE position > 1)"
+                )
+            )
+        if result.rowcount:
+            removed[table] = result.rowcount
+    return removed
+
+
+def drop_replaced_indexes(engine: Engine) -> list[str]:
+    inspector = inspect(engine)
+    table_names = set(inspector.get_table_names())
+    dropped = []
+    replaced = [(table, old_name) for table, _, old_name in UNIQUE_INDEXES.values()]
+    replaced.extend((table, name) for name, table in RETIRED_INDEXES.items())
+    for table, old_name in replaced:
+        if table not in table_names:
+            continue
+        if old_name not in {index["name"] for index in inspector.get_indexes(table)}:
+            continue
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX {old_name}"))
+        dropped.append(old_name)
+    return dropped
+
+
+def create_missing_indexes(engine: Engine) -> list[str]:
+    inspector = inspect(engine)
+    created = []
+    for table in Base.metadata.tables.values():
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            index.create(bind=engine, checkfirst=True)
+            created.append(index.name)
+    return created
+
+
+def upgrade_schema(engine: Engine) -> dict:
+    existing_tables = set(inspect(engine).get_table_names())
+    with engine.connect() as conn:
+        had_search_index = search_index_exists(conn)
+    Base.metadata.create_all(bind=engine)
+    seed_content_versions(engine)
+    with engine.connect() as conn:
+        search_index_created = not had_search_index and search_index_exists(conn)
+    return {
+        "tables": [
+            name for name in Base.metadata.tables if name not in existing_tables
+        ],
+        "columns": add_missing_columns(engine),
+        "duplicates": remove_duplicate_rows(engine),
+        "indexes": create_missing_indexes(engine),
+        "dropped_indexes": drop_replaced_indexes(engine),
+        "search_index": search_index_created,
+    }
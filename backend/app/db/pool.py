@@ -0,0 +1,107 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SQLITE_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record_checkout(self, wait_ms: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            stats = {
+                "pool": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "avg_wait_ms": (
+                    round(self.wait_ms_total / attempts, 3) if attempts else 0.0
+                ),
+                "max_wait_ms": round(self.wait_ms_max, 3),
+            }
+        # Only queue pools track their size; StaticPool holds one connection.
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if method is not None:
+                stats[name] = method()
+        return stats
+
+
+def timed_pool_class(base, stats: PoolStats):
+    # A subclass per engine so the stats survive Pool.recreate(), which
+    # builds the replacement pool from self.__class__.
+    class TimedPool(base):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeout:
+                stats.record_checkout(
+                    (time.perf_counter() - started) * 1000, timed_out=True
+                )
+                raise
+            stats.record_checkout((time.perf_counter() - started) * 1000)
+            return connection
+
+    TimedPool.__name__ = base.__name__
+    return TimedPool
+
+
+def count_connects(engine, stats: PoolStats) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        stats.record_connect()
+
+
+def sqlite_pragmas(settings) -> list[str]:
+    journal_mode = settings.sqlite_journal_mode.upper()
+    synchronous = settings.sqlite_synchronous.upper()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f"unsupported SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in SQLITE_SYNCHRONOUS:
+        raise ValueError(f"unsupported SQLITE_SYNCHRONOUS: {synchronous}")
+    return [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        # A negative cache_size is in KiB rather than pages.
+        f"PRAGMA cache_size={-int(settings.sqlite_cache_size_kib)}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA foreign_keys={'ON' if settings.sqlite_foreign_keys else 'OFF'}",
+    ]
+
+
+def apply_sqlite_pragmas(engine, pragmas: list[str]) -> None:
+    # Pragmas are per connection, so they run on every new connection.
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
@@ -0,0 +1,328 @@
+import html
+import re
+import uuid
+import weakref
+
+from sqlalchemy import (
+    DDL,
+    Float,
+    Uuid,
+    bindparam,
+    event,
+    or_,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import Settings
+from backend.app.db.base import Base
+from backend.app.models.question import Question
+
+settings = Settings()
+
+SQLITE_FTS_TABLE = "question_fts"
+POSTGRES_SEARCH_TABLE = "question_search"
+
+_SQLITE_DDL = DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "question_id UNINDEXED, title, body, answers, "
+    "tokenize = 'porter unicode61')"
+)
+_POSTGRES_DDL = [
+    DDL(
+        f"CREATE TABLE IF NOT EXISTS {POSTGRES_SEARCH_TABLE} ("
+        "question_id UUID PRIMARY KEY, document TSVECTOR NOT NULL)"
+    ),
+    DDL(
+        f"CREATE INDEX IF NOT EXISTS ix_{POSTGRES_SEARCH_TABLE}_document "
+        f"ON {POSTGRES_SEARCH_TABLE} USING GIN (document)"
+    ),
+]
+
+
+def _sqlite_has_fts5(ddl, target, bind, **kw) -> bool:
+    return bind.dialect.name == "sqlite" and sqlite_fts5_available(bind)
+
+
+def sqlite_fts5_available(conn: Connection) -> bool:
+    options = conn.exec_driver_sql("PRAGMA compile_options").scalars().all()
+    return "ENABLE_FTS5" in options
+
+
+event.listen(
+    Base.metadata, "after_create", _SQLITE_DDL.execute_if(callable_=_sqlite_has_fts5)
+)
+for _ddl in _POSTGRES_DDL:
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="postgresql"))
+
+
+def _terms(q: str) -> list[str]:
+    return re.findall(r"\w+", q.lower())
+
+
+# Private-use characters stand in for the highlight tags while the database
+# builds the snippet, so the question text around them can be escaped.
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+
+
+def _highlight(snippet: str) -> str:
+    escaped = html.escape(snippet)
+    return escaped.replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+class LikeSearchBackend:
+    name = "like"
+
+    def index_question(self, session: Session, question_id) -> None:
+        return None
+
+    def remove_question(self, session: Session, question_id) -> None:
+        return None
+
+    def rebuild(self, session: Session) -> int:
+        return 0
+
+    def apply(self, stmt, q: str):
+        like = f"%{q}%"
+        return stmt.where(or_(Question.title.ilike(like), Question.body.ilike(like)))
+
+    def snippets(self, session: Session, q: str, question_ids: list) -> dict:
+        return {}
+
+
+class SqliteFtsBackend(LikeSearchBackend):
+    name = "sqlite-fts5"
+
+    # FTS5 rowids must be integers; derive a stable one from the UUID so
+    # upserts and deletes are rowid lookups instead of table scans.
+    @staticmethod
+    def _rowid(question_id) -> int:
+        if not isinstance(question_id, uuid.UUID):
+            question_id = uuid.UUID(str(question_id))
+        return question_id.int >> 65
+
+    @staticmethod
+    def _match(q: str) -> str | None:
+        terms = _terms(q)
+        if not terms:
+            return None
+        return " AND ".join(f'"{term}"*' for term in terms)
+
+    _INSERT = text(
+        f"INSERT INTO {SQLITE_FTS_TABLE} "
+        "(rowid, question_id, title, body, answers) "
+        "SELECT :rowid, q.id, q.title, q.body, "
+        "coalesce((SELECT group_concat(a.body, ' ') FROM answers a "
+        "WHERE a.question_id = q.id), '') "
+        "FROM questions q WHERE q.id = :question_id"
+    ).bindparams(bindparam("question_id", type_=Uuid))
+
+    def index_question(self, session: Session, question_id) -> None:
+        session.flush()
+        rowid = self._rowid(question_id)
+        session.execute(
+            text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :rowid"),
+            {"rowid": rowid},
+        )
+        session.execute(self._INSERT, {"rowid": rowid, "question_id": question_id})
+
+    def remove_question(self, session: Session, question_id) -> None:
+        session.execute(
+            text(f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = :rowid"),
+            {"rowid": self._rowid(question_id)},
+        )
+
+    def rebuild(self, session: Session) -> int:
+        session.execute(text(f"DELETE FROM {SQLITE_FTS_TABLE}"))
+        question_ids = session.scalars(
+            text("SELECT id FROM questions").columns(id=Uuid)
+        ).all()
+        if question_ids:
+            session.execute(
+                self._INSERT,
+                [
+                    {"rowid": self._rowid(question_id), "question_id": question_id}
+                    for question_id in question_ids
+                ],
+            )
+        session.commit()
+        return len(question_ids)
+
+    def _matches(self, match: str):
+        return (
+            text(
+                f"SELECT question_id, -bm25({SQLITE_FTS_TABLE}, 0.0, 10.0, 4.0, 1.0) "
+                f"AS rank FROM {SQLITE_FTS_TABLE} "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH :match"
+            )
+            .bindparams(match=match)
+            .columns(question_id=Uuid, rank=Float)
+            .subquery("search_matches")
+        )
+
+    def apply(self, stmt, q: str):
+        match = self._match(q)
+        if match is None:
+            return super().apply(stmt, q)
+        matches = self._matches(match)
+        stmt = stmt.join(matches, matches.c.question_id == Question.id)
+        return stmt.order_by(matches.c.rank.desc())
+
+    def snippets(self, session: Session, q: str, question_ids: list) -> dict:
+        match = self._match(q)
+        if match is None or not question_ids:
+            return {}
+        stmt = (
+            text(
+                f"SELECT question_id, snippet({SQLITE_FTS_TABLE}, -1, "
+                ":start, :stop, '…', 16) AS snippet "
+                f"FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match "
+                "AND rowid IN :rowids"
+            )
+            .bindparams(bindparam("rowids", expanding=True))
+            .columns(question_id=Uuid)
+        )
+        rows = session.execute(
+            stmt,
+            {
+                "match": match,
+                "rowids": [self._rowid(i) for i in question_ids],
+                "start": _MARK_START,
+                "stop": _MARK_END,
+            },
+        ).all()
+        return {row.question_id: _highlight(row.snippet) for row in rows}
+
+
+class PostgresSearchBackend(LikeSearchBackend):
+    name = "postgres-tsvector"
+
+    _DOCUMENT = (
+        "setweight(to_tsvector('english', q.title), 'A') || "
+        "setweight(to_tsvector('english', q.body), 'B') || "
+        "setweight(to_tsvector('english', coalesce((SELECT string_agg(a.body, ' ') "
+        "FROM answers a WHERE a.question_id = q.id), '')), 'C')"
+    )
+
+    def index_question(self, session: Session, question_id) -> None:
+        session.flush()
+        session.execute(
+            text(
+                f"INSERT INTO {POSTGRES_SEARCH_TABLE} (question_id, document) "
+                f"SELECT q.id, {self._DOCUMENT} FROM questions q "
+                "WHERE q.id = :question_id "
+                "ON CONFLICT (question_id) DO UPDATE SET document = EXCLUDED.document"
+            ).bindparams(bindparam("question_id", type_=Uuid)),
+            {"question_id": question_id},
+        )
+
+    def remove_question(self, session: Session, question_id) -> None:
+        session.execute(
+            text(
+                f"DELETE FROM {POSTGRES_SEARCH_TABLE} WHERE question_id = :question_id"
+            ).bindparams(bindparam("question_id", type_=Uuid)),
+            {"question_id": question_id},
+        )
+
+    def rebuild(self, session: Session) -> int:
+        session.execute(text(f"DELETE FROM {POSTGRES_SEARCH_TABLE}"))
+        result = session.execute(
+            text(
+                f"INSERT INTO {POSTGRES_SEARCH_TABLE} (question_id, document) "
+                f"SELECT q.id, {self._DOCUMENT} FROM questions q"
+            )
+        )
+        session.commit()
+        return result.rowcount or 0
+
+    def apply(self, stmt, q: str):
+        if not _terms(q):
+            return super().apply(stmt, q)
+        matches = (
+            text(
+                "SELECT question_id, ts_rank_cd(document, query) AS rank "
+                f"FROM {POSTGRES_SEARCH_TABLE}, "
+                "websearch_to_tsquery('english', :q) AS query "
+                "WHERE document @@ query"
+            )
+            .bindparams(q=q)
+            .columns(question_id=Uuid, rank=Float)
+            .subquery("search_matches")
+        )
+        stmt = stmt.join(matches, matches.c.question_id == Question.id)
+        return stmt.order_by(matches.c.rank.desc())
+
+    def snippets(self, session: Session, q: str, question_ids: list) -> dict:
+        if not _terms(q) or not question_ids:
+            return {}
+        stmt = (
+            text(
+                "SELECT q.id AS question_id, ts_headline('english', q.body, "
+                "websearch_to_tsquery('english', :q), :options) "
+                "AS snippet FROM questions q WHERE q.id IN :question_ids"
+            )
+            .bindparams(bindparam("question_ids", expanding=True, type_=Uuid))
+            .columns(question_id=Uuid)
+        )
+        options = (
+            f"StartSel={_MARK_START}, StopSel={_MARK_END}, MaxWords=24, MinWords=8"
+        )
+        rows = session.execute(
+            stmt, {"q": q, "question_ids": question_ids, "options": options}
+        ).all()
+        return {row.question_id: _highlight(row.snippet) for row in rows}
+
+
+_backends: "weakref.WeakKeyDictionary[Engine, LikeSearchBackend]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _select_backend(conn: Connection) -> LikeSearchBackend:
+    choice = settings.search_backend
+    dialect = conn.dialect.name
+    if choice == "like":
+        return LikeSearchBackend()
+    if dialect == "postgresql" and choice in ("auto", "postgres"):
+        return PostgresSearchBackend()
+    if dialect == "sqlite" and choice in ("auto", "sqlite"):
+        exists = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (SQLITE_FTS_TABLE,),
+        ).first()
+        if exists is not None:
+            return SqliteFtsBackend()
+    return LikeSearchBackend()
+
+
+def get_search_backend(session: Session) -> LikeSearchBackend:
+    conn = session.connection()
+    backend = _backends.get(conn.engine)
+    if backend is None:
+        backend = _select_backend(conn)
+        _backends[conn.engine] = backend
+    return backend
+
+
+def search_index_exists(conn: Connection) -> bool:
+    if conn.dialect.name == "sqlite":
+        name = SQLITE_FTS_TABLE
+    elif conn.dialect.name == "postgresql":
+        name = POSTGRES_SEARCH_TABLE
+    else:
+        return False
+    return conn.dialect.has_table(conn, name)
+
+
+def rebuild_search_index(session: Session) -> int:
+    return get_search_backend(session).rebuild(session)
+
+
+def index_question(session: Session, question_id) -> None:
+    get_search_backend(session).index_question(session, question_id)
+
+
+def remove_question(session: Session, question_id) -> None:
+    get_search_backend(session).remove_question(session, question_id)
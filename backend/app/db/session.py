@@ -1,27 +1,150 @@
-from sqlalchemy import create_engine
+import importlib.util
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+from starlette.concurrency import run_in_threadpool
 
 from backend.app.core.config import Settings
+from backend.app.db.pool import (
+    PoolStats,
+    apply_sqlite_pragmas,
+    count_connects,
+    sqlite_pragmas,
+    timed_pool_class,
+)
 
 settings = Settings()
 
 database_url = settings.database_url or "sqlite+pysqlite:///:memory:"
 
-engine_kwargs = {"pool_pre_ping": True}
-if database_url.startswith("sqlite"):
-    engine_kwargs["connect_args"] = {"check_same_thread": False}
-    if ":memory:" in database_url:
-        engine_kwargs["poolclass"] = StaticPool
 
-engine = create_engine(database_url, **engine_kwargs)
+def is_memory_sqlite(url) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def pool_kwargs(url, pool_stats: PoolStats, queue_pool=QueuePool) -> dict:
+    url = make_url(url)
+    sqlite = url.get_backend_name() == "sqlite"
+    pre_ping = settings.db_pool_pre_ping.lower()
+    if pre_ping not in ("auto", "always", "never"):
+        raise ValueError(f"unsupported DB_POOL_PRE_PING: {pre_ping}")
+    # A local SQLite file cannot drop a connection the way a server can, so
+    # "auto" skips the extra round trip per checkout there.
+    kwargs = {
+        "pool_pre_ping": pre_ping == "always" or (pre_ping == "auto" and not sqlite)
+    }
+    if sqlite:
+        kwargs["connect_args"] = {"check_same_thread": False}
+    if is_memory_sqlite(url):
+        # Every connection would get its own empty database, so all requests
+        # share the one connection.
+        kwargs["poolclass"] = timed_pool_class(StaticPool, pool_stats)
+        return kwargs
+    kwargs.update(
+        poolclass=timed_pool_class(queue_pool, pool_stats),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+    return kwargs
+
+
+def configure_engine(engine, url, pool_stats: PoolStats) -> None:
+    count_connects(engine, pool_stats)
+    if make_url(url).get_backend_name() == "sqlite" and not is_memory_sqlite(url):
+        apply_sqlite_pragmas(engine, sqlite_pragmas(settings))
+
+
+pool_stats = PoolStats()
+engine = create_engine(database_url, **pool_kwargs(database_url, pool_stats))
+configure_engine(engine, database_url, pool_stats)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def pool_status() -> dict:
+    return {
+        "sync": pool_stats.snapshot(engine.pool),
+        "async": (
+            async_pool_stats.snapshot(async_engine.pool)
+            if async_engine is not None
+            else None
+        ),
+    }
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+# Async drivers for the hot read endpoints, by backend.
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "psycopg"}
+
+
+def async_database_url(url: str):
+    # None when no async driver can reach the same database. An in-memory
+    # SQLite database belongs to one connection, so it cannot be shared.
+    url = make_url(url)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or importlib.util.find_spec(driver) is None:
+        return None
+    if is_memory_sqlite(url):
+        return None
+    return url.set(drivername=f"{backend}+{driver}")
+
+
+async_url = async_database_url(database_url) if settings.async_db else None
+async_pool_stats = PoolStats()
+async_engine = (
+    create_async_engine(
+        async_url, **pool_kwargs(async_url, async_pool_stats, AsyncAdaptedQueuePool)
+    )
+    if async_url is not None
+    else None
+)
+if async_engine is not None:
+    configure_engine(async_engine.sync_engine, async_url, async_pool_stats)
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+
+
+class ThreadedSession:
+    # Stands in for AsyncSession when there is no async engine: the same
+    # run_sync calls run on a regular session in the threadpool.
+    def __init__(self, session) -> None:
+        self.sync_session = session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+async def get_async_db():
+    # Handlers call repository functions through db.run_sync, which runs them
+    # on the AsyncSession's connection without occupying a thread.
+    if AsyncSessionLocal is not None:
+        db = AsyncSessionLocal()
+    else:
+        db = ThreadedSession(SessionLocal())
+    try:
+        yield db
+    finally:
+        await db.close()
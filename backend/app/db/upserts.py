@@ -0,0 +1,17 @@
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def upsert_insert(session: Session, model):
+    # Returns an INSERT that supports on_conflict_do_update/do_nothing, or
+    # None when the dialect has no ON CONFLICT clause.
+    dialect_insert = _INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is None:
+        return None
+    return dialect_insert(model)
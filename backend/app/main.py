@@ -1,11 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.core.config import Settings
+from backend.app.core.outbox import outbox_worker
+from backend.app.core.pubsub import pubsub
+from backend.app.core.security import password_hasher
+from backend.app.core.view_buffer import view_buffer
 from backend.app.api.admin_users import router as admin_users_router
 from backend.app.api.admin_content import router as admin_content_router
 from backend.app.api.answers import router as answers_router
 from backend.app.api.auth import router as auth_router
+from backend.app.api.events import router as events_router
 from backend.app.api.faqs import router as faqs_router
 from backend.app.api.flags import router as flags_router
 from backend.app.api.follows import router as follows_router
@@ -16,33 +23,65 @@ from backend.app.api.questions import router as questions_router
 from backend.app.api.related_questions import router as related_router
 from backend.app.api.tags import router as tags_router
 from backend.app.api.votes import router as votes_router
-from sqlalchemy import inspect, text
-
-from backend.app.db.base import Base
-from backend.app.db.session import engine
+from backend.app.db.duplicates import (
+    index_path,
+    load_duplicate_index,
+    save_duplicate_index,
+)
+from backend.app.db.migrations import COUNTER_COLUMNS, upgrade_schema
+from backend.app.db.search import rebuild_search_index
+from backend.app.db.session import SessionLocal, async_engine, engine
+from backend.app.repositories.counter_repo import reconcile_counters
+from backend.app.repositories.notification_repo import rebuild_unread_counts
+from backend.app.repositories.question_similarity_repo import (
+    rebuild_question_similarity,
+)
+from backend.app.repositories.question_view_repo import backfill_view_sketches
 from backend.app import models  # noqa: F401
 
-app = FastAPI(title="Moringa Desk API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    view_buffer.start(SessionLocal)
+    outbox_worker.start(SessionLocal)
+    pubsub.start(SessionLocal)
+    yield
+    pubsub.stop()
+    outbox_worker.stop()
+    view_buffer.stop()
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+    save_duplicate_index()
+
+
+app = FastAPI(title="Moringa Desk API", lifespan=lifespan)
 settings = Settings()
 
 
 def _parse_cors_origins(value: str) -> list[str]:
     return [origin.strip() for origin in value.split(",") if origin.strip()]
 
-Base.metadata.create_all(bind=engine)
-
-inspector = inspect(engine)
-if "question_views" in inspector.get_table_names():
-    columns = {col["name"] for col in inspector.get_columns("question_views")}
-    if "viewer_session" not in columns:
-        with engine.begin() as conn:
-            conn.execute(text("ALTER TABLE question_views ADD COLUMN viewer_session TEXT"))
 
-if "faqs" in inspector.get_table_names():
-    columns = {col["name"] for col in inspector.get_columns("faqs")}
-    if "category" not in columns:
-        with engine.begin() as conn:
-            conn.execute(text("ALTER TABLE faqs ADD COLUMN category TEXT"))
+schema_changes = upgrade_schema(engine)
+if ("questions", "viewers_sketch") in schema_changes["columns"]:
+    with SessionLocal() as session:
+        backfill_view_sketches(session)
+votes_deduplicated = "votes" in schema_changes["duplicates"]
+if COUNTER_COLUMNS.intersection(schema_changes["columns"]) or votes_deduplicated:
+    with SessionLocal() as session:
+        reconcile_counters(session)
+if "notification_counters" in schema_changes["tables"]:
+    with SessionLocal() as session:
+        rebuild_unread_counts(session)
+if schema_changes["search_index"]:
+    with SessionLocal() as session:
+        rebuild_search_index(session)
+if "question_similarity" in schema_changes["tables"]:
+    with SessionLocal() as session:
+        rebuild_question_similarity(session)
+with SessionLocal() as session:
+    load_duplicate_index(session, index_path(engine))
 
 app.add_middleware(
     CORSMiddleware,
@@ -50,6 +89,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(health_router)
@@ -60,6 +100,7 @@ app.include_router(votes_router)
 app.include_router(tags_router)
 app.include_router(follows_router)
 app.include_router(notifications_router)
+app.include_router(events_router)
 app.include_router(related_router)
 app.include_router(faqs_router)
 app.include_router(flags_router)
@@ -1,10 +1,15 @@
 from backend.app.models.answer import Answer
+from backend.app.models.content_version import ContentVersion
 from backend.app.models.faq import FAQ
 from backend.app.models.flag import Flag
 from backend.app.models.follow import Follow
 from backend.app.models.notification import Notification
+from backend.app.models.notification_counter import NotificationCounter
+from backend.app.models.outbox_event import OutboxEvent
 from backend.app.models.password_reset import PasswordResetToken
+from backend.app.models.pubsub_message import PubSubMessage
 from backend.app.models.question import Question
+from backend.app.models.question_similarity import QuestionSimilarity
 from backend.app.models.question_tag import QuestionTag
 from backend.app.models.question_view import QuestionView
 from backend.app.models.related_question import RelatedQuestion
@@ -21,9 +26,14 @@ __all__ = [
     "Vote",
     "Tag",
     "QuestionTag",
+    "QuestionSimilarity",
     "Follow",
     "Notification",
+    "NotificationCounter",
+    "OutboxEvent",
+    "PubSubMessage",
     "RelatedQuestion",
     "FAQ",
     "Flag",
+    "ContentVersion",
 ]
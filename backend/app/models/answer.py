@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, ForeignKey, Text
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,10 @@ from backend.app.db.base import Base
 
 class Answer(Base):
     __tablename__ = "answers"
+    __table_args__ = (
+        Index("ix_answers_question_id_created_at", "question_id", "created_at"),
+        Index("ix_answers_author_id_created_at", "author_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
@@ -17,6 +21,9 @@ class Answer(Base):
     author_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
     body: Mapped[str] = mapped_column(Text)
     is_accepted: Mapped[bool] = mapped_column(Boolean, default=False)
+    vote_score: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    up_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    down_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(tz=timezone.utc)
     )
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,12 @@ from backend.app.db.base import Base
 
 class Flag(Base):
     __tablename__ = "flags"
+    __table_args__ = (
+        Index("ix_flags_target", "target_type", "target_id"),
+        Index(
+            "uq_flags_user_target", "user_id", "target_type", "target_id", unique=True
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,10 @@ from backend.app.db.base import Base
 
 class Follow(Base):
     __tablename__ = "follows"
+    __table_args__ = (
+        Index("ix_follows_question_id", "question_id"),
+        Index("ix_follows_user_question", "user_id", "question_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
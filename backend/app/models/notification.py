@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, ForeignKey, JSON, String
+from sqlalchemy import Boolean, ForeignKey, Index, JSON, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,24 @@ from backend.app.db.base import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index(
+            "ix_notifications_user_read_created",
+            "user_id",
+            "is_read",
+            "created_at",
+        ),
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # At most one open group per key and recipient; concurrent workers
+        # coalescing the same event race on this index instead of both
+        # inserting.
+        Index(
+            "uq_notifications_open_group",
+            "user_id",
+            "open_group_key",
+            unique=True,
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
@@ -16,6 +34,10 @@ class Notification(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
     type: Mapped[str] = mapped_column(String(50))
     payload: Mapped[dict] = mapped_column(JSON)
+    # Events sharing a group key are folded into one unread notification.
+    group_key: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    # The group key while later events may still fold into this row.
+    open_group_key: Mapped[str | None] = mapped_column(String(200), nullable=True)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(tz=timezone.utc)
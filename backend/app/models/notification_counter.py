@@ -0,0 +1,16 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class NotificationCounter(Base):
+    __tablename__ = "notification_counters"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    unread: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Notifications created at or before this are read.
+    last_read_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class PubSubMessage(Base):
+    __tablename__ = "pubsub_messages"
+    __table_args__ = (Index("ix_pubsub_messages_created_at", "created_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    origin: Mapped[str] = mapped_column(String(32))
+    messages: Mapped[list] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(tz=timezone.utc)
+    )
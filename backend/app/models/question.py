@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,10 @@ from backend.app.db.base import Base
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        Index("ix_questions_created_at_id", "created_at", "id"),
+        Index("ix_questions_author_id_created_at", "author_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
@@ -21,6 +25,17 @@ class Question(Base):
     accepted_answer_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("answers.id"), nullable=True
     )
+    answers_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    views_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    viewers_sketch: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+    vote_score: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    up_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    down_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Bumped with every change shown on the question's detail page except
+    # view counts, which are flushed often and stamped separately.
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(tz=timezone.utc)
     )
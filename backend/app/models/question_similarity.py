@@ -0,0 +1,22 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.app.db.base import Base
+
+
+class QuestionSimilarity(Base):
+    __tablename__ = "question_similarity"
+    __table_args__ = (
+        Index("ix_question_similarity_question_score", "question_id", "score"),
+        Index("ix_question_similarity_other_id", "other_id"),
+    )
+
+    question_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("questions.id"), primary_key=True
+    )
+    other_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("questions.id"), primary_key=True
+    )
+    score: Mapped[float]
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,7 @@ from backend.app.db.base import Base
 
 class QuestionTag(Base):
     __tablename__ = "question_tags"
+    __table_args__ = (Index("ix_question_tags_tag_created", "tag_id", "created_at"),)
 
     question_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("questions.id"), primary_key=True
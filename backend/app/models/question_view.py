@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,11 @@ from backend.app.db.base import Base
 
 class QuestionView(Base):
     __tablename__ = "question_views"
+    __table_args__ = (
+        Index("ix_question_views_question_viewer", "question_id", "viewer_id"),
+        Index("ix_question_views_question_session", "question_id", "viewer_session"),
+        Index("ix_question_views_viewer_id", "viewer_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
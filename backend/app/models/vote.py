@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.app.db.base import Base
@@ -9,6 +9,12 @@ from backend.app.db.base import Base
 
 class Vote(Base):
     __tablename__ = "votes"
+    __table_args__ = (
+        Index("ix_votes_target", "target_type", "target_id"),
+        Index(
+            "uq_votes_user_target", "user_id", "target_type", "target_id", unique=True
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4, unique=True
@@ -17,6 +23,11 @@ class Vote(Base):
     target_type: Mapped[str] = mapped_column(String(50))
     target_id: Mapped[uuid.UUID] = mapped_column()
     value: Mapped[int] = mapped_column(Integer)
+    # Value replaced by the last upsert (0 for a new vote), so the caller can
+    # apply the score delta without reading the row first.
+    previous_value: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(tz=timezone.utc)
     )
@@ -1,15 +1,30 @@
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
+from backend.app.core.content_versions import mark_content_changed
+from backend.app.core.question_cache import mark_questions_changed
+from backend.app.db.duplicates import (
+    index_question_duplicates,
+    remove_question_duplicates,
+)
+from backend.app.db.search import index_question, remove_question
 from backend.app.models.answer import Answer
+from backend.app.models.faq import FAQ
 from backend.app.models.flag import Flag
 from backend.app.models.follow import Follow
 from backend.app.models.notification import Notification
+from backend.app.models.notification_counter import NotificationCounter
+from backend.app.models.password_reset import PasswordResetToken
 from backend.app.models.question import Question
+from backend.app.models.question_similarity import QuestionSimilarity
 from backend.app.models.question_tag import QuestionTag
 from backend.app.models.question_view import QuestionView
 from backend.app.models.related_question import RelatedQuestion
 from backend.app.models.vote import Vote
+from backend.app.repositories.counter_repo import (
+    apply_vote_change,
+    bump_question_counters,
+)
 
 
 def delete_answer(session: Session, *, answer_id) -> bool:
@@ -21,6 +36,7 @@ def delete_answer(session: Session, *, answer_id) -> bool:
     if question is not None and question.accepted_answer_id == answer.id:
         question.accepted_answer_id = None
         session.add(question)
+    bump_question_counters(session, question_id=answer.question_id, answers=-1)
 
     session.execute(
         delete(Flag).where(
@@ -36,6 +52,8 @@ def delete_answer(session: Session, *, answer_id) -> bool:
     )
 
     session.delete(answer)
+    index_question(session, answer.question_id)
+    mark_questions_changed(session, answer.question_id)
     session.commit()
     return True
 
@@ -53,6 +71,17 @@ def delete_user_content(session: Session, *, user_id) -> None:
     for question_id in question_ids:
         delete_question(session, question_id=question_id)
 
+    votes = session.execute(
+        select(Vote.target_type, Vote.target_id, Vote.value).where(
+            Vote.user_id == user_id
+        )
+    ).all()
+    for target_type, target_id, value in votes:
+        apply_vote_change(
+            session, target_type=target_type, target_id=target_id, old_value=value
+        )
+    # views_count mirrors the viewer sketches, which cannot forget a viewer,
+    # so only the raw view rows are removed.
     session.execute(delete(Flag).where(Flag.user_id == user_id))
     session.execute(delete(Vote).where(Vote.user_id == user_id))
     session.execute(delete(Follow).where(Follow.user_id == user_id))
@@ -60,6 +89,15 @@ def delete_user_content(session: Session, *, user_id) -> None:
     session.execute(
         delete(Notification).where(Notification.user_id == user_id)
     )
+    session.execute(
+        delete(NotificationCounter).where(NotificationCounter.user_id == user_id)
+    )
+    session.execute(
+        delete(PasswordResetToken).where(PasswordResetToken.user_id == user_id)
+    )
+    session.execute(
+        update(FAQ).where(FAQ.created_by == user_id).values(created_by=None)
+    )
     session.commit()
 
 
@@ -84,6 +122,9 @@ def delete_question(session: Session, *, question_id) -> bool:
                 Vote.target_id.in_(answer_ids),
             )
         )
+        # The accepted answer is referenced by the question row.
+        question.accepted_answer_id = None
+        session.flush()
         session.execute(delete(Answer).where(Answer.id.in_(answer_ids)))
 
     session.execute(
@@ -100,6 +141,12 @@ def delete_question(session: Session, *, question_id) -> bool:
     )
     session.execute(delete(Follow).where(Follow.question_id == question_id))
     session.execute(delete(QuestionTag).where(QuestionTag.question_id == question_id))
+    session.execute(
+        delete(QuestionSimilarity).where(
+            (QuestionSimilarity.question_id == question_id)
+            | (QuestionSimilarity.other_id == question_id)
+        )
+    )
     session.execute(
         delete(RelatedQuestion).where(
             (RelatedQuestion.question_id == question_id)
@@ -108,8 +155,12 @@ def delete_question(session: Session, *, question_id) -> bool:
     )
     session.execute(delete(QuestionView).where(QuestionView.question_id == question_id))
 
+    remove_question(session, question_id)
+    mark_questions_changed(session, question_id)
+    mark_content_changed(session, "tags")
     session.delete(question)
     session.commit()
+    remove_question_duplicates(question_id)
     return True
 
 
@@ -134,8 +185,11 @@ def update_question_content(
     if stage is not None:
         question.stage = stage
     session.add(question)
+    index_question(session, question.id)
+    mark_questions_changed(session, question.id)
     session.commit()
     session.refresh(question)
+    index_question_duplicates(question)
     return question
 
 
@@ -150,6 +204,8 @@ def update_answer_content(
         return None
     answer.body = body
     session.add(answer)
+    index_question(session, answer.question_id)
+    mark_questions_changed(session, answer.question_id)
     session.commit()
     session.refresh(answer)
     return answer
@@ -2,7 +2,11 @@ from sqlalchemy import select
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from backend.app.core.pubsub import publish_after_commit, question_channel
+from backend.app.db.search import index_question
 from backend.app.models.answer import Answer
+from backend.app.repositories.counter_repo import bump_question_counters
+from backend.app.repositories.outbox_repo import add_outbox_event
 
 
 def create_answer(
@@ -14,6 +18,24 @@ def create_answer(
         body=body,
     )
     session.add(answer)
+    session.flush()
+    bump_question_counters(session, question_id=question_id, answers=1)
+    index_question(session, question_id)
+    add_outbox_event(
+        session,
+        topic="answer_posted",
+        payload={
+            "question_id": str(question_id),
+            "answer_id": str(answer.id),
+            "actor_id": str(author_id),
+        },
+    )
+    publish_after_commit(
+        session,
+        question_channel(question_id),
+        "answer",
+        {"question_id": str(question_id), "answer_id": str(answer.id)},
+    )
     session.commit()
     session.refresh(answer)
     return answer
@@ -51,3 +73,14 @@ def list_answers_by_author(session: Session, *, author_id) -> list[Answer]:
 def count_answers_for_question(session: Session, *, question_id) -> int:
     stmt = select(func.count()).select_from(Answer).where(Answer.question_id == question_id)
     return int(session.scalar(stmt) or 0)
+
+
+def count_answers_for_questions(session: Session, *, question_ids: list) -> dict:
+    if not question_ids:
+        return {}
+    stmt = (
+        select(Answer.question_id, func.count())
+        .where(Answer.question_id.in_(question_ids))
+        .group_by(Answer.question_id)
+    )
+    return {row[0]: int(row[1]) for row in session.execute(stmt).all()}
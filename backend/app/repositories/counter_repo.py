@@ -0,0 +1,157 @@
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+
+from backend.app.core.question_cache import (
+    mark_all_questions_changed,
+    mark_questions_changed,
+)
+from backend.app.models.answer import Answer
+from backend.app.models.question import Question
+from backend.app.models.vote import Vote
+from backend.app.repositories.question_view_repo import view_estimates
+
+QUESTION_COUNTERS = (
+    "answers_count",
+    "views_count",
+    "vote_score",
+    "up_count",
+    "down_count",
+)
+ANSWER_COUNTERS = ("vote_score", "up_count", "down_count")
+
+
+def bump_question_counters(
+    session: Session,
+    *,
+    question_id,
+    answers: int = 0,
+    views: int = 0,
+    votes: int = 0,
+    up: int = 0,
+    down: int = 0,
+) -> None:
+    values = {}
+    if answers:
+        values["answers_count"] = Question.answers_count + answers
+    if views:
+        values["views_count"] = Question.views_count + views
+    if votes:
+        values["vote_score"] = Question.vote_score + votes
+    if up:
+        values["up_count"] = Question.up_count + up
+    if down:
+        values["down_count"] = Question.down_count + down
+    if not values:
+        return
+    session.execute(
+        update(Question)
+        .where(Question.id == question_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    mark_questions_changed(session, question_id)
+
+
+def bump_answer_votes(
+    session: Session, *, answer_id, delta: int, up: int = 0, down: int = 0
+) -> None:
+    values = {}
+    if delta:
+        values["vote_score"] = Answer.vote_score + delta
+    if up:
+        values["up_count"] = Answer.up_count + up
+    if down:
+        values["down_count"] = Answer.down_count + down
+    if not values:
+        return
+    question_id = session.scalar(
+        update(Answer)
+        .where(Answer.id == answer_id)
+        .values(**values)
+        .returning(Answer.question_id)
+        .execution_options(synchronize_session=False)
+    )
+    if question_id is not None:
+        mark_questions_changed(session, question_id)
+
+
+def apply_vote_change(
+    session: Session,
+    *,
+    target_type: str,
+    target_id,
+    old_value: int = 0,
+    new_value: int = 0,
+) -> None:
+    delta = new_value - old_value
+    up = (new_value > 0) - (old_value > 0)
+    down = (new_value < 0) - (old_value < 0)
+    if target_type == "question":
+        bump_question_counters(
+            session, question_id=target_id, votes=delta, up=up, down=down
+        )
+    elif target_type == "answer":
+        bump_answer_votes(session, answer_id=target_id, delta=delta, up=up, down=down)
+
+
+def _grouped(session: Session, stmt) -> dict:
+    return {row[0]: int(row[1] or 0) for row in session.execute(stmt).all()}
+
+
+def _vote_counts(session: Session, *, target_type: str) -> dict:
+    rows = session.execute(
+        select(
+            Vote.target_id,
+            func.sum(Vote.value),
+            func.sum(case((Vote.value > 0, 1), else_=0)),
+            func.sum(case((Vote.value < 0, 1), else_=0)),
+        )
+        .where(Vote.target_type == target_type)
+        .group_by(Vote.target_id)
+    ).all()
+    counts = {"vote_score": {}, "up_count": {}, "down_count": {}}
+    for target_id, score, up, down in rows:
+        counts["vote_score"][target_id] = int(score or 0)
+        counts["up_count"][target_id] = int(up or 0)
+        counts["down_count"][target_id] = int(down or 0)
+    return counts
+
+
+def reconcile_counters(session: Session, *, apply: bool = True) -> dict:
+    expected_questions = {
+        "answers_count": _grouped(
+            session,
+            select(Answer.question_id, func.count()).group_by(Answer.question_id),
+        ),
+        "views_count": view_estimates(session),
+        **_vote_counts(session, target_type="question"),
+    }
+    expected_answers = _vote_counts(session, target_type="answer")
+
+    drift = {
+        "questions": _find_drift(
+            session, Question, QUESTION_COUNTERS, expected_questions
+        ),
+        "answers": _find_drift(session, Answer, ANSWER_COUNTERS, expected_answers),
+    }
+
+    if apply:
+        for model, key in ((Question, "questions"), (Answer, "answers")):
+            rows = [{"id": item["id"], **item["expected"]} for item in drift[key]]
+            if rows:
+                session.execute(update(model), rows)
+                mark_all_questions_changed(session)
+        session.commit()
+
+    return drift
+
+
+def _find_drift(session: Session, model, columns: tuple, expected: dict) -> list:
+    stmt = select(model.id, *(getattr(model, c) for c in columns))
+    drift = []
+    for row in session.execute(stmt).all():
+        stored = {c: int(getattr(row, c) or 0) for c in columns}
+        wanted = {c: expected[c].get(row.id, 0) for c in columns}
+        if stored != wanted:
+            drift.append({"id": row.id, "stored": stored, "expected": wanted})
+    return drift
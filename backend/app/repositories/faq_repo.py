@@ -1,6 +1,8 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.app.core.content_versions import mark_content_changed
+
 from backend.app.models.faq import FAQ
 
 
@@ -11,6 +13,7 @@ def create_faq(
         question=question, answer=answer, category=category, created_by=created_by
     )
     session.add(faq)
+    mark_content_changed(session, "faqs")
     session.commit()
     session.refresh(faq)
     return faq
@@ -39,6 +42,7 @@ def update_faq(
     if category is not None:
         faq.category = category
     session.add(faq)
+    mark_content_changed(session, "faqs")
     session.commit()
     session.refresh(faq)
     return faq
@@ -49,5 +53,6 @@ def delete_faq(session: Session, *, faq_id) -> bool:
     if faq is None:
         return False
     session.delete(faq)
+    mark_content_changed(session, "faqs")
     session.commit()
     return True
@@ -1,6 +1,7 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.app.db.upserts import upsert_insert
 from backend.app.models.flag import Flag
 
 
@@ -11,7 +12,32 @@ def create_flag(
     target_type: str,
     target_id,
     reason: str,
-) -> Flag:
+) -> Flag | None:
+    # Returns None when the user has already flagged the target.
+    stmt = upsert_insert(session, Flag)
+    if stmt is not None:
+        stmt = (
+            stmt.values(
+                user_id=user_id,
+                target_type=target_type,
+                target_id=target_id,
+                reason=reason,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[Flag.user_id, Flag.target_type, Flag.target_id]
+            )
+            .returning(Flag)
+        )
+        flag = session.scalars(stmt).one_or_none()
+        if flag is not None:
+            session.expunge(flag)
+        session.commit()
+        return flag
+
+    if get_flag(
+        session, user_id=user_id, target_type=target_type, target_id=target_id
+    ):
+        return None
     flag = Flag(
         user_id=user_id,
         target_type=target_type,
@@ -1,34 +1,439 @@
-from sqlalchemy import select, update
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import (
+    and_,
+    case,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from backend.app.core.pubsub import publish_after_commit, user_channel
+from backend.app.db.upserts import upsert_insert
+from backend.app.models.follow import Follow
 from backend.app.models.notification import Notification
+from backend.app.models.notification_counter import NotificationCounter
+from backend.app.repositories.question_repo import decode_cursor
+
+
+def _bump_unread(session: Session, *, counts: dict) -> None:
+    rows = [{"user_id": user_id, "unread": n} for user_id, n in counts.items() if n]
+    if not rows:
+        return
+    stmt = upsert_insert(session, NotificationCounter)
+    if stmt is not None:
+        stmt = stmt.values(rows)
+        session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[NotificationCounter.user_id],
+                set_={"unread": NotificationCounter.unread + stmt.excluded.unread},
+            )
+        )
+        return
+
+    for row in rows:
+        result = session.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == row["user_id"])
+            .values(unread=NotificationCounter.unread + row["unread"])
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            session.execute(insert(NotificationCounter).values(**row))
+
+
+def _read_watermark(session: Session, *, user_id) -> datetime | None:
+    return session.scalar(
+        select(NotificationCounter.last_read_at).where(
+            NotificationCounter.user_id == user_id
+        )
+    )
+
+
+def _publish_notifications(session: Session, rows) -> None:
+    for row in rows:
+        publish_after_commit(
+            session,
+            user_channel(row["user_id"]),
+            "notification",
+            {
+                "id": str(row["id"]),
+                "user_id": str(row["user_id"]),
+                "type": row["type"],
+                "payload": row["payload"],
+                "is_read": False,
+                "created_at": row["created_at"].isoformat(),
+            },
+        )
 
 
 def create_notification(
     session: Session, *, user_id, type: str, payload: dict
 ) -> Notification:
-    notification = Notification(user_id=user_id, type=type, payload=payload)
+    row = {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "type": type,
+        "payload": payload,
+        "created_at": datetime.now(tz=timezone.utc),
+    }
+    notification = Notification(**row)
     session.add(notification)
+    _bump_unread(session, counts={user_id: 1})
+    _publish_notifications(session, [row])
     session.commit()
     session.refresh(notification)
     return notification
 
 
+def add_notifications(session: Session, *, notifications: list[dict]) -> int:
+    # Single multi-row insert; the caller owns the transaction.
+    now = datetime.now(tz=timezone.utc)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": item["user_id"],
+            "type": item["type"],
+            "payload": item["payload"],
+            "group_key": item.get("group_key"),
+            "created_at": now,
+        }
+        for item in notifications
+    ]
+    if rows:
+        session.execute(insert(Notification.__table__), rows)
+        _bump_unread(session, counts=Counter(row["user_id"] for row in rows))
+        _publish_notifications(session, rows)
+    return len(rows)
+
+
+def coalesce_notification(
+    session: Session,
+    *,
+    user_id,
+    type: str,
+    group_key: str,
+    actor_id,
+    payload: dict,
+    window_seconds: int,
+    max_actors: int,
+) -> int:
+    # Folds the event into the user's unread notification with the same
+    # group key if that was touched within the window, otherwise starts a
+    # new one. Returns the number of rows inserted; the caller owns the
+    # transaction.
+    now = datetime.now(tz=timezone.utc)
+    actor = str(actor_id)
+
+    # Close the open group first if it was read or has gone quiet, so the
+    # insert below can take the key.
+    closed = or_(
+        Notification.is_read.is_(True),
+        Notification.created_at < now - timedelta(seconds=window_seconds),
+    )
+    watermark = _read_watermark(session, user_id=user_id)
+    if watermark is not None:
+        closed = or_(closed, Notification.created_at <= watermark)
+    session.execute(
+        update(Notification)
+        .where(
+            Notification.user_id == user_id,
+            Notification.open_group_key == group_key,
+            closed,
+        )
+        .values(open_group_key=None)
+        .execution_options(synchronize_session=False)
+    )
+
+    row = {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "type": type,
+        "group_key": group_key,
+        "open_group_key": group_key,
+        "payload": {
+            **payload,
+            "actor_id": actor,
+            "actors": [actor],
+            "actor_count": 1,
+        },
+        "is_read": False,
+        "created_at": now,
+    }
+    stmt = upsert_insert(session, Notification)
+    if stmt is not None:
+        # The unique open-group index decides between concurrent workers:
+        # exactly one insert wins and the others fold into its row.
+        inserted = session.execute(
+            stmt.values(**row)
+            .on_conflict_do_nothing(
+                index_elements=[Notification.user_id, Notification.open_group_key]
+            )
+            .returning(Notification.id)
+        ).first()
+        if inserted is not None:
+            _bump_unread(session, counts={user_id: 1})
+            _publish_notifications(session, [row])
+            return 1
+
+    existing = session.scalars(
+        select(Notification)
+        .where(
+            Notification.user_id == user_id,
+            Notification.open_group_key == group_key,
+        )
+        .with_for_update()
+    ).first()
+    if existing is None:
+        session.execute(insert(Notification.__table__).values(**row))
+        _bump_unread(session, counts={user_id: 1})
+        _publish_notifications(session, [row])
+        return 1
+
+    # Only the latest actors are kept, so a repeat actor who has dropped out
+    # of that list is counted again.
+    actors = existing.payload.get("actors", [])
+    existing.payload = {
+        **payload,
+        "actor_id": actor,
+        "actors": [actor] + [a for a in actors if a != actor][: max_actors - 1],
+        "actor_count": existing.payload.get("actor_count", 1) + (actor not in actors),
+    }
+    existing.created_at = now
+    session.flush()
+    _publish_notifications(
+        session,
+        [
+            {
+                "id": existing.id,
+                "user_id": user_id,
+                "type": type,
+                "payload": existing.payload,
+                "created_at": now,
+            }
+        ],
+    )
+    return 0
+
+
+def _generated_uuid(session: Session):
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return func.gen_random_uuid()
+    if dialect == "sqlite":
+        return func.lower(func.hex(func.randomblob(16)))
+    return None
+
+
+def add_follower_notifications(
+    session: Session,
+    *,
+    question_id,
+    type: str,
+    payload: dict,
+    exclude_user_ids=(),
+) -> int:
+    # INSERT .. SELECT FROM follows, so followers are never loaded into
+    # Python. The caller owns the transaction.
+    excluded = [user_id for user_id in exclude_user_ids if user_id is not None]
+    followers = select(Follow.user_id).where(Follow.question_id == question_id)
+    if excluded:
+        followers = followers.where(Follow.user_id.not_in(excluded))
+
+    new_id = _generated_uuid(session)
+    counters = upsert_insert(session, NotificationCounter)
+    if new_id is None or counters is None:
+        return add_notifications(
+            session,
+            notifications=[
+                {"user_id": user_id, "type": type, "payload": payload}
+                for user_id in session.scalars(followers)
+            ],
+        )
+
+    columns = Notification.__table__.c
+    now = datetime.now(tz=timezone.utc)
+    created = session.execute(
+        insert(Notification.__table__)
+        .from_select(
+            ["id", "user_id", "type", "payload", "is_read", "created_at"],
+            followers.with_only_columns(
+                new_id,
+                Follow.user_id,
+                literal(type, columns.type.type),
+                literal(payload, columns.payload.type),
+                false(),
+                literal(now, columns.created_at.type),
+            ),
+        )
+        .returning(columns.id, columns.user_id)
+    ).all()
+    counters = counters.from_select(
+        ["user_id", "unread"], followers.with_only_columns(Follow.user_id, literal(1))
+    )
+    session.execute(
+        counters.on_conflict_do_update(
+            index_elements=[NotificationCounter.user_id],
+            set_={"unread": NotificationCounter.unread + counters.excluded.unread},
+        )
+    )
+    _publish_notifications(
+        session,
+        [
+            {
+                "id": notification_id,
+                "user_id": user_id,
+                "type": type,
+                "payload": payload,
+                "created_at": now,
+            }
+            for notification_id, user_id in created
+        ],
+    )
+    return len(created)
+
+
 def list_notifications(
-    session: Session, *, user_id, unread_only: bool = False
+    session: Session,
+    *,
+    user_id,
+    unread_only: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
 ) -> list[Notification]:
+    watermark = _read_watermark(session, user_id=user_id)
     stmt = select(Notification).where(Notification.user_id == user_id)
     if unread_only:
         stmt = stmt.where(Notification.is_read.is_(False))
-    stmt = stmt.order_by(Notification.created_at.desc())
-    return list(session.scalars(stmt).all())
+        if watermark is not None:
+            stmt = stmt.where(Notification.created_at > watermark)
+    if cursor is not None:
+        created_at, last_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                Notification.created_at < created_at,
+                and_(Notification.created_at == created_at, Notification.id < last_id),
+            )
+        )
+    stmt = stmt.order_by(Notification.created_at.desc(), Notification.id.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    notifications = list(session.scalars(stmt).all())
+    if watermark is not None:
+        for notification in notifications:
+            if notification.created_at <= watermark:
+                # Derived state; must not be flushed back.
+                set_committed_value(notification, "is_read", True)
+    return notifications
+
+
+def get_unread_count(session: Session, *, user_id) -> int:
+    stmt = select(NotificationCounter.unread).where(
+        NotificationCounter.user_id == user_id
+    )
+    return max(session.scalar(stmt) or 0, 0)
 
 
 def mark_all_read(session: Session, *, user_id) -> int:
-    result = session.execute(
-        update(Notification)
-        .where(Notification.user_id == user_id)
-        .values(is_read=True)
+    # Moves the user's read watermark instead of touching notification rows.
+    marked = get_unread_count(session, user_id=user_id)
+    now = datetime.now(tz=timezone.utc)
+    stmt = upsert_insert(session, NotificationCounter)
+    if stmt is not None:
+        session.execute(
+            stmt.values(
+                user_id=user_id, unread=0, last_read_at=now
+            ).on_conflict_do_update(
+                index_elements=[NotificationCounter.user_id],
+                set_={"unread": 0, "last_read_at": now},
+            )
+        )
+    else:
+        result = session.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == user_id)
+            .values(unread=0, last_read_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            session.execute(
+                insert(NotificationCounter).values(
+                    user_id=user_id, unread=0, last_read_at=now
+                )
+            )
+    session.commit()
+    return marked
+
+
+def mark_notification_read(session: Session, *, user_id, notification_id) -> int:
+    stmt = update(Notification).where(
+        Notification.id == notification_id,
+        Notification.user_id == user_id,
+        Notification.is_read.is_(False),
     )
+    watermark = _read_watermark(session, user_id=user_id)
+    if watermark is not None:
+        stmt = stmt.where(Notification.created_at > watermark)
+    marked = session.execute(
+        stmt.values(is_read=True).execution_options(synchronize_session=False)
+    ).rowcount
+    if marked:
+        session.execute(
+            update(NotificationCounter)
+            .where(NotificationCounter.user_id == user_id)
+            .values(
+                unread=case(
+                    (NotificationCounter.unread > 0, NotificationCounter.unread - 1),
+                    else_=0,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
     session.commit()
-    return result.rowcount or 0
+    return marked
+
+
+def rebuild_unread_counts(session: Session) -> int:
+    # Counter rows are updated in place so read watermarks survive.
+    unread = (
+        select(func.count())
+        .where(
+            Notification.user_id == NotificationCounter.user_id,
+            Notification.is_read.is_(False),
+            or_(
+                NotificationCounter.last_read_at.is_(None),
+                Notification.created_at > NotificationCounter.last_read_at,
+            ),
+        )
+        .scalar_subquery()
+    )
+    session.execute(
+        update(NotificationCounter)
+        .values(unread=unread)
+        .execution_options(synchronize_session=False)
+    )
+    session.execute(
+        insert(NotificationCounter).from_select(
+            ["user_id", "unread"],
+            select(Notification.user_id, func.count())
+            .where(
+                Notification.is_read.is_(False),
+                Notification.user_id.not_in(select(NotificationCounter.user_id)),
+            )
+            .group_by(Notification.user_id),
+        )
+    )
+    session.commit()
+    return session.scalar(
+        select(func.count())
+        .select_from(NotificationCounter)
+        .where(NotificationCounter.unread > 0)
+    )
@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.orm import Session
+
+from backend.app.models.outbox_event import OutboxEvent
+
+
+def add_outbox_event(session: Session, *, topic: str, payload: dict) -> OutboxEvent:
+    # Written by the caller's commit, in the same transaction as the change
+    # that produced it.
+    event = OutboxEvent(topic=topic, payload=payload)
+    session.add(event)
+    return event
+
+
+def claim_outbox_events(
+    session: Session, *, limit: int, lease_seconds: float
+) -> tuple[str, list]:
+    # Claimed events are pushed past the lease so nobody else picks them up;
+    # if the claimant dies they become due again once the lease runs out.
+    now = datetime.now(tz=timezone.utc)
+    token = uuid.uuid4().hex
+    due = (
+        select(OutboxEvent.id)
+        .where(OutboxEvent.available_at <= now)
+        .order_by(OutboxEvent.available_at, OutboxEvent.id)
+        .limit(limit)
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        due = due.with_for_update(skip_locked=True)
+    ids = list(session.scalars(due).all())
+    if not ids:
+        session.rollback()
+        return token, []
+
+    session.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id.in_(ids), OutboxEvent.available_at <= now)
+        .values(
+            claimed_by=token,
+            attempts=OutboxEvent.attempts + 1,
+            available_at=now + timedelta(seconds=lease_seconds),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    events = session.execute(
+        select(
+            OutboxEvent.id,
+            OutboxEvent.topic,
+            OutboxEvent.payload,
+            OutboxEvent.attempts,
+        )
+        .where(OutboxEvent.id.in_(ids), OutboxEvent.claimed_by == token)
+        .order_by(OutboxEvent.id)
+    ).all()
+    session.commit()
+    return token, events
+
+
+def complete_outbox_event(session: Session, *, event_id, claimed_by: str) -> bool:
+    # The caller commits, so the event disappears together with its effects.
+    result = session.execute(
+        delete(OutboxEvent).where(
+            OutboxEvent.id == event_id, OutboxEvent.claimed_by == claimed_by
+        )
+    )
+    return result.rowcount == 1
+
+
+def retry_outbox_event(
+    session: Session,
+    *,
+    event_id,
+    claimed_by: str,
+    error: str,
+    delay_seconds: float | None,
+) -> bool:
+    # A delay of None gives up on the event; it stays in the table for
+    # inspection but is never claimed again.
+    available_at = None
+    if delay_seconds is not None:
+        available_at = datetime.now(tz=timezone.utc) + timedelta(seconds=delay_seconds)
+    result = session.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id == event_id, OutboxEvent.claimed_by == claimed_by)
+        .values(available_at=available_at, claimed_by=None, last_error=error)
+    )
+    session.commit()
+    return result.rowcount == 1
+
+
+def outbox_stats(session: Session) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    pending, due, dead, oldest = session.execute(
+        select(
+            func.count(OutboxEvent.available_at),
+            func.count(case((OutboxEvent.available_at <= now, 1))),
+            func.count() - func.count(OutboxEvent.available_at),
+            func.min(
+                case((OutboxEvent.available_at.is_not(None), OutboxEvent.created_at))
+            ),
+        )
+    ).one()
+    lag = 0.0
+    if oldest is not None:
+        if isinstance(oldest, str):
+            oldest = datetime.fromisoformat(oldest)
+        if oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        lag = max((now - oldest).total_seconds(), 0.0)
+    return {
+        "pending": pending,
+        "due": due,
+        "dead": dead,
+        "lag_seconds": round(lag, 3),
+    }
@@ -1,6 +1,14 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
 from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
+from backend.app.core.question_cache import mark_questions_changed
+from backend.app.db.duplicates import index_question_duplicates
+from backend.app.db.search import get_search_backend, index_question
 from backend.app.models.question import Question
 from backend.app.models.question_tag import QuestionTag
 from backend.app.models.tag import Tag
@@ -23,8 +31,12 @@ def create_question(
         stage=stage,
     )
     session.add(question)
+    session.flush()
+    index_question(session, question.id)
+    mark_questions_changed(session, question.id)
     session.commit()
     session.refresh(question)
+    index_question_duplicates(question)
     return question
 
 
@@ -32,6 +44,22 @@ def get_question_by_id(session: Session, *, question_id) -> Question | None:
     return session.get(Question, question_id)
 
 
+def encode_cursor(question: Question) -> str:
+    raw = json.dumps(
+        {"created_at": question.created_at.isoformat(), "id": str(question.id)}
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["created_at"]), uuid.UUID(data["id"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
 def list_questions(
     session: Session,
     *,
@@ -41,6 +69,7 @@ def list_questions(
     category: str | None = None,
     stage: str | None = None,
     q: str | None = None,
+    cursor: str | None = None,
 ) -> list[Question]:
     stmt = select(Question)
 
@@ -49,26 +78,41 @@ def list_questions(
         filters.append(Question.category == category)
     if stage is not None:
         filters.append(Question.stage == stage)
-    if q is not None:
-        like = f"%{q}%"
-        filters.append(or_(Question.title.ilike(like), Question.body.ilike(like)))
 
     if tag is not None:
         stmt = stmt.join(QuestionTag, QuestionTag.question_id == Question.id)
         stmt = stmt.join(Tag, Tag.id == QuestionTag.tag_id)
         filters.append(Tag.name == tag)
 
+    if cursor is not None:
+        # Search results are ordered by rank, which a created_at/id cursor
+        # cannot resume from; they page with offset instead.
+        if q is not None:
+            raise ValueError("cursor pagination is not available for search")
+        created_at, last_id = decode_cursor(cursor)
+        filters.append(
+            or_(
+                Question.created_at < created_at,
+                and_(Question.created_at == created_at, Question.id < last_id),
+            )
+        )
+
     if filters:
         stmt = stmt.where(and_(*filters))
 
-    stmt = (
-        stmt.order_by(Question.created_at.desc())
-        .limit(limit)
-        .offset(offset)
-    )
+    if q is not None:
+        stmt = get_search_backend(session).apply(stmt, q)
+
+    stmt = stmt.order_by(Question.created_at.desc(), Question.id.desc()).limit(limit)
+    if cursor is None:
+        stmt = stmt.offset(offset)
     return list(session.scalars(stmt).all())
 
 
+def search_snippets(session: Session, *, q: str, question_ids: list) -> dict:
+    return get_search_backend(session).snippets(session, q, question_ids)
+
+
 def list_questions_by_author(session: Session, *, author_id) -> list[Question]:
     stmt = (
         select(Question)
@@ -78,13 +122,23 @@ def list_questions_by_author(session: Session, *, author_id) -> list[Question]:
     return list(session.scalars(stmt).all())
 
 
-def search_questions_by_title(
-    session: Session, *, title: str, limit: int = 5
-) -> list[Question]:
-    stmt = (
-        select(Question)
-        .where(Question.title.ilike(f"%{title}%"))
-        .order_by(Question.created_at.desc())
-        .limit(limit)
-    )
-    return list(session.scalars(stmt).all())
+def get_question_stamps(session: Session, *, question_ids: list) -> dict:
+    # views_count is flushed without bumping version, so it is stamped too.
+    if not question_ids:
+        return {}
+    rows = session.execute(
+        select(Question.id, Question.version, Question.views_count).where(
+            Question.id.in_(question_ids)
+        )
+    ).all()
+    return {question_id: (version, views) for question_id, version, views in rows}
+
+
+def get_questions_by_ids(session: Session, *, question_ids: list) -> list[Question]:
+    if not question_ids:
+        return []
+    questions = session.scalars(
+        select(Question).where(Question.id.in_(question_ids))
+    ).all()
+    by_id = {question.id: question for question in questions}
+    return [by_id[i] for i in question_ids if i in by_id]
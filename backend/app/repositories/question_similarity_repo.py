@@ -0,0 +1,189 @@
+import heapq
+import math
+from collections import defaultdict
+
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from backend.app.core.question_cache import (
+    mark_all_questions_changed,
+    mark_questions_changed,
+)
+
+from backend.app.models.question_similarity import QuestionSimilarity
+from backend.app.models.question_tag import QuestionTag
+
+SIMILARITY_TOP_K = 10
+# Refreshes run on the request path, so each tag offers only its most
+# recently tagged questions as candidates. The offline rebuild scores all.
+SIMILARITY_CANDIDATES_PER_TAG = 200
+
+
+def _idf(total: int, count: int) -> float:
+    return math.log(1 + total / count)
+
+
+def _weighted_jaccard(left: set, right: set, weights: dict) -> float:
+    shared = sum(weights[tag_id] for tag_id in left & right)
+    if not shared:
+        return 0.0
+    return shared / sum(weights[tag_id] for tag_id in left | right)
+
+
+def _tag_weights(session: Session, *, tag_ids: set) -> dict:
+    total = session.scalar(select(func.count(func.distinct(QuestionTag.question_id))))
+    rows = session.execute(
+        select(QuestionTag.tag_id, func.count())
+        .where(QuestionTag.tag_id.in_(tag_ids))
+        .group_by(QuestionTag.tag_id)
+    ).all()
+    return {tag_id: _idf(total, count) for tag_id, count in rows}
+
+
+def list_similarity_candidates(
+    session: Session, *, question_id, tags: set, per_tag: int
+) -> set:
+    candidates = set()
+    for tag_id in tags:
+        candidates.update(
+            session.scalars(
+                select(QuestionTag.question_id)
+                .where(
+                    QuestionTag.tag_id == tag_id,
+                    QuestionTag.question_id != question_id,
+                )
+                .order_by(QuestionTag.created_at.desc())
+                .limit(per_tag)
+            )
+        )
+    return candidates
+
+
+def refresh_question_similarity(
+    session: Session,
+    *,
+    question_id,
+    k: int = SIMILARITY_TOP_K,
+    per_tag: int = SIMILARITY_CANDIDATES_PER_TAG,
+) -> None:
+    session.flush()
+    previous = session.scalars(
+        select(QuestionSimilarity.question_id).where(
+            QuestionSimilarity.other_id == question_id
+        )
+    ).all()
+    mark_questions_changed(session, question_id, *previous)
+    session.execute(
+        delete(QuestionSimilarity).where(
+            (QuestionSimilarity.question_id == question_id)
+            | (QuestionSimilarity.other_id == question_id)
+        )
+    )
+
+    tags = set(
+        session.scalars(
+            select(QuestionTag.tag_id).where(QuestionTag.question_id == question_id)
+        ).all()
+    )
+    if not tags:
+        return
+
+    candidates = list_similarity_candidates(
+        session, question_id=question_id, tags=tags, per_tag=per_tag
+    )
+    if not candidates:
+        return
+    tag_sets = defaultdict(set)
+    for other_id, tag_id in session.execute(
+        select(QuestionTag.question_id, QuestionTag.tag_id).where(
+            QuestionTag.question_id.in_(candidates)
+        )
+    ):
+        tag_sets[other_id].add(tag_id)
+
+    weights = _tag_weights(session, tag_ids=tags.union(*tag_sets.values()))
+    scores = {
+        other_id: _weighted_jaccard(tags, other_tags, weights)
+        for other_id, other_tags in tag_sets.items()
+    }
+
+    rows = [
+        {"question_id": question_id, "other_id": other_id, "score": score}
+        for other_id, score in heapq.nlargest(k, scores.items(), key=lambda i: i[1])
+    ]
+
+    # Offer this question to each neighbour's top-k and evict whatever it
+    # pushes out, so neighbours never hold more than k rows.
+    neighbours = defaultdict(list)
+    for other_id, related_id, score in session.execute(
+        select(
+            QuestionSimilarity.question_id,
+            QuestionSimilarity.other_id,
+            QuestionSimilarity.score,
+        ).where(QuestionSimilarity.question_id.in_(list(scores)))
+    ):
+        neighbours[other_id].append((score, related_id))
+
+    mark_questions_changed(session, *scores)
+    evicted = []
+    for other_id, score in scores.items():
+        current = neighbours[other_id]
+        if len(current) < k:
+            rows.append(
+                {"question_id": other_id, "other_id": question_id, "score": score}
+            )
+            continue
+        lowest_score, lowest_id = min(current)
+        if score > lowest_score:
+            evicted.append((other_id, lowest_id))
+            rows.append(
+                {"question_id": other_id, "other_id": question_id, "score": score}
+            )
+
+    if evicted:
+        session.execute(
+            delete(QuestionSimilarity).where(
+                tuple_(QuestionSimilarity.question_id, QuestionSimilarity.other_id).in_(
+                    evicted
+                )
+            )
+        )
+    session.execute(insert(QuestionSimilarity), rows)
+
+
+def rebuild_question_similarity(session: Session, *, k: int = SIMILARITY_TOP_K) -> int:
+    tag_sets = defaultdict(set)
+    members = defaultdict(set)
+    for question_id, tag_id in session.execute(
+        select(QuestionTag.question_id, QuestionTag.tag_id)
+    ):
+        tag_sets[question_id].add(tag_id)
+        members[tag_id].add(question_id)
+
+    total = len(tag_sets)
+    weights = {tag_id: _idf(total, len(ids)) for tag_id, ids in members.items()}
+
+    session.execute(delete(QuestionSimilarity))
+    stored = 0
+    batch = []
+    for question_id, tags in tag_sets.items():
+        candidates = set().union(*(members[tag_id] for tag_id in tags))
+        candidates.discard(question_id)
+        scores = (
+            (other_id, _weighted_jaccard(tags, tag_sets[other_id], weights))
+            for other_id in candidates
+        )
+        for other_id, score in heapq.nlargest(k, scores, key=lambda i: i[1]):
+            batch.append(
+                {"question_id": question_id, "other_id": other_id, "score": score}
+            )
+        if len(batch) >= 5000:
+            session.execute(insert(QuestionSimilarity), batch)
+            stored += len(batch)
+            batch = []
+    if batch:
+        session.execute(insert(QuestionSimilarity), batch)
+        stored += len(batch)
+    mark_all_questions_changed(session)
+    session.commit()
+    return stored
@@ -1,18 +1,28 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.app.core.content_versions import mark_content_changed
+
 from backend.app.models.question_tag import QuestionTag
 from backend.app.models.tag import Tag
+from backend.app.repositories.question_similarity_repo import (
+    refresh_question_similarity,
+)
 
 
 def attach_tags(
     session: Session, *, question_id, tag_ids: list
 ) -> None:
+    added = False
     for tag_id in tag_ids:
         exists = session.get(QuestionTag, {"question_id": question_id, "tag_id": tag_id})
         if exists is not None:
             continue
         session.add(QuestionTag(question_id=question_id, tag_id=tag_id))
+        added = True
+    if added:
+        refresh_question_similarity(session, question_id=question_id)
+        mark_content_changed(session, "tags")
     session.commit()
 
 
@@ -1,9 +1,66 @@
-from sqlalchemy import func, select
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import bindparam, delete, insert, select, tuple_, update
 from sqlalchemy.orm import Session
 
+from backend.app.db.hyperloglog import HyperLogLog
+from backend.app.models.question import Question
 from backend.app.models.question_view import QuestionView
 
 
+def _viewer_key(viewer_id, viewer_session) -> str | None:
+    if viewer_id is not None:
+        return f"user:{viewer_id}"
+    if viewer_session is not None:
+        return f"session:{viewer_session}"
+    return None
+
+
+def _count_viewers(session: Session, *, viewers: dict) -> int:
+    # Merges viewer keys into each question's sketch and stores the new
+    # estimate as views_count. Returns how much the estimates grew.
+    if not viewers:
+        return 0
+    rows = session.execute(
+        select(Question.id, Question.viewers_sketch, Question.views_count)
+        .where(Question.id.in_(list(viewers)))
+        .with_for_update()
+    ).all()
+    updates = []
+    for question_id, blob, views_count in rows:
+        sketch = HyperLogLog.from_bytes(blob)
+        changed = False
+        for key in viewers[question_id]:
+            changed = sketch.add(key) or changed
+        if changed:
+            updates.append(
+                {
+                    "b_id": question_id,
+                    "b_sketch": sketch.to_bytes(),
+                    "b_views": sketch.estimate(),
+                    "previous": views_count,
+                }
+            )
+    if not updates:
+        return 0
+
+    questions = Question.__table__
+    session.execute(
+        update(questions)
+        .where(questions.c.id == bindparam("b_id"))
+        .values(
+            viewers_sketch=bindparam("b_sketch"),
+            views_count=bindparam("b_views"),
+        ),
+        updates,
+    )
+    # View counts are left out of the content versions here: flushes land
+    # every second. The view buffer moves the list version on a coarser
+    # schedule.
+    return sum(max(row["b_views"] - row["previous"], 0) for row in updates)
+
+
 def create_view(
     session: Session, *, question_id, viewer_id=None, viewer_session=None
 ) -> QuestionView:
@@ -11,6 +68,9 @@ def create_view(
         question_id=question_id, viewer_id=viewer_id, viewer_session=viewer_session
     )
     session.add(view)
+    key = _viewer_key(viewer_id, viewer_session)
+    if key is not None:
+        _count_viewers(session, viewers={question_id: {key}})
     session.commit()
     session.refresh(view)
     return view
@@ -27,8 +87,131 @@ def has_view_for_question(
     return session.execute(stmt).first() is not None
 
 
-def count_views_for_question(session: Session, *, question_id) -> int:
-    stmt = select(func.count()).select_from(QuestionView).where(
-        QuestionView.question_id == question_id
+def _insert_view_rows(session: Session, *, views: list[tuple]) -> None:
+    question_ids = {question_id for question_id, _, _ in views}
+    live = set(
+        session.scalars(select(Question.id).where(Question.id.in_(question_ids)))
     )
+    by_viewer = {(q, v) for q, v, _ in views if q in live and v is not None}
+    by_session = {
+        (q, s) for q, v, s in views if q in live and v is None and s is not None
+    }
+    seen = set()
+    if by_viewer:
+        seen.update(
+            session.execute(
+                select(QuestionView.question_id, QuestionView.viewer_id).where(
+                    tuple_(QuestionView.question_id, QuestionView.viewer_id).in_(
+                        by_viewer
+                    )
+                )
+            ).tuples()
+        )
+    if by_session:
+        seen.update(
+            session.execute(
+                select(QuestionView.question_id, QuestionView.viewer_session).where(
+                    QuestionView.viewer_id.is_(None),
+                    tuple_(QuestionView.question_id, QuestionView.viewer_session).in_(
+                        by_session
+                    ),
+                )
+            ).tuples()
+        )
+
+    rows = []
+    for question_id, viewer_id, viewer_session in views:
+        key = (question_id, viewer_id if viewer_id is not None else viewer_session)
+        if question_id not in live or key in seen:
+            continue
+        if key[1] is not None:
+            seen.add(key)
+        rows.append(
+            {
+                "question_id": question_id,
+                "viewer_id": viewer_id,
+                "viewer_session": viewer_session,
+            }
+        )
+    if rows:
+        session.execute(insert(QuestionView.__table__), rows)
+
+
+def record_views(
+    session: Session, *, views: list[tuple], store_rows: bool = True
+) -> int:
+    # views are (question_id, viewer_id, viewer_session) triples. Distinct
+    # viewers are counted in the question's sketch; raw rows are only an
+    # audit trail and can be switched off or pruned.
+    viewers = defaultdict(set)
+    for question_id, viewer_id, viewer_session in views:
+        key = _viewer_key(viewer_id, viewer_session)
+        if key is not None:
+            viewers[question_id].add(key)
+    counted = _count_viewers(session, viewers=viewers)
+    if store_rows:
+        _insert_view_rows(session, views=views)
+    session.commit()
+    return counted
+
+
+def backfill_view_sketches(session: Session, *, batch_size: int = 5000) -> int:
+    # Merging is idempotent, so this can be re-run and never loses viewers
+    # whose raw rows were already pruned.
+    stmt = (
+        select(
+            QuestionView.question_id,
+            QuestionView.viewer_id,
+            QuestionView.viewer_session,
+        )
+        .order_by(QuestionView.question_id)
+        .execution_options(yield_per=batch_size)
+    )
+    viewers = defaultdict(set)
+    pending = 0
+    touched = 0
+    for question_id, viewer_id, viewer_session in session.execute(stmt):
+        if pending >= batch_size and question_id not in viewers:
+            _count_viewers(session, viewers=viewers)
+            touched += len(viewers)
+            viewers, pending = defaultdict(set), 0
+        key = _viewer_key(viewer_id, viewer_session)
+        if key is not None:
+            viewers[question_id].add(key)
+            pending += 1
+    _count_viewers(session, viewers=viewers)
+    touched += len(viewers)
+    session.commit()
+    return touched
+
+
+def prune_question_views(session: Session, *, before: datetime) -> int:
+    result = session.execute(
+        delete(QuestionView).where(QuestionView.created_at < before)
+    )
+    session.commit()
+    return result.rowcount
+
+
+def view_estimates(session: Session) -> dict:
+    stmt = select(Question.id, Question.viewers_sketch).where(
+        Question.viewers_sketch.is_not(None)
+    )
+    return {
+        question_id: HyperLogLog.from_bytes(blob).estimate()
+        for question_id, blob in session.execute(stmt)
+    }
+
+
+def count_views_for_question(session: Session, *, question_id) -> int:
+    stmt = select(Question.views_count).where(Question.id == question_id)
     return int(session.scalar(stmt) or 0)
+
+
+def count_views_for_questions(session: Session, *, question_ids: list) -> dict:
+    if not question_ids:
+        return {}
+    stmt = select(Question.id, Question.views_count).where(
+        Question.id.in_(question_ids)
+    )
+    return {row[0]: int(row[1]) for row in session.execute(stmt).all()}
@@ -1,8 +1,10 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.app.core.question_cache import mark_questions_changed
+
 from backend.app.models.question import Question
-from backend.app.models.question_tag import QuestionTag
+from backend.app.models.question_similarity import QuestionSimilarity
 from backend.app.models.related_question import RelatedQuestion
 
 
@@ -44,6 +46,7 @@ def add_related_questions(
                 )
             )
 
+    mark_questions_changed(session, question_id, *related_question_ids)
     session.commit()
 
 
@@ -63,19 +66,11 @@ def list_related_questions(session: Session, *, question_id) -> list[Question]:
 def list_related_questions_by_tags(
     session: Session, *, question_id, limit: int = 6
 ) -> list[Question]:
-    tag_ids_subquery = (
-        select(QuestionTag.tag_id)
-        .where(QuestionTag.question_id == question_id)
-        .subquery()
-    )
-
     stmt = (
         select(Question)
-        .join(QuestionTag, QuestionTag.question_id == Question.id)
-        .where(QuestionTag.tag_id.in_(select(tag_ids_subquery.c.tag_id)))
-        .where(Question.id != question_id)
-        .distinct()
-        .order_by(Question.created_at.desc())
+        .join(QuestionSimilarity, QuestionSimilarity.other_id == Question.id)
+        .where(QuestionSimilarity.question_id == question_id)
+        .order_by(QuestionSimilarity.score.desc(), Question.created_at.desc())
         .limit(limit)
     )
     return list(session.scalars(stmt).all())
@@ -1,6 +1,8 @@
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from backend.app.core.content_versions import mark_content_changed
+
 from backend.app.models.question_tag import QuestionTag
 from backend.app.models.tag import Tag
 
@@ -12,6 +14,7 @@ def _normalize_name(name: str) -> str:
 def create_tag(session: Session, *, name: str) -> Tag:
     tag = Tag(name=_normalize_name(name))
     session.add(tag)
+    mark_content_changed(session, "tags")
     session.commit()
     session.refresh(tag)
     return tag
@@ -1,6 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from backend.app.core.question_cache import mark_all_questions_changed
+from backend.app.core.user_cache import UserIdentity, mark_users_changed, user_cache
+
 from backend.app.models.user import User
 
 
@@ -13,6 +16,37 @@ def get_user_by_id(session: Session, user_id) -> User | None:
     return session.get(User, user_id)
 
 
+def get_user_identities(session: Session, *, user_ids) -> dict:
+    identities = {}
+    missing = []
+    for user_id in dict.fromkeys(user_ids):
+        identity = user_cache.get(user_id)
+        if identity is None:
+            missing.append(user_id)
+        else:
+            identities[user_id] = identity
+    if missing:
+        version = user_cache.version()
+        rows = [
+            UserIdentity(*row)
+            for row in session.execute(
+                select(User.id, User.full_name, User.role).where(User.id.in_(missing))
+            ).all()
+        ]
+        user_cache.put(rows, version=version)
+        identities.update((row.id, row) for row in rows)
+    return identities
+
+
+def get_user_identity(session: Session, user_id) -> UserIdentity | None:
+    return get_user_identities(session, user_ids=[user_id]).get(user_id)
+
+
+def get_user_names(session: Session, *, user_ids: list) -> dict:
+    identities = get_user_identities(session, user_ids=user_ids)
+    return {user_id: identity.full_name for user_id, identity in identities.items()}
+
+
 def create_user(
     session: Session,
     *,
@@ -33,10 +67,22 @@ def create_user(
     return user
 
 
+def set_password_hash(session: Session, *, user: User, password_hash: str) -> None:
+    # An UPDATE rather than an attribute change, so a detached user is left
+    # as it is.
+    session.execute(
+        update(User).where(User.id == user.id).values(password_hash=password_hash)
+    )
+    mark_users_changed(session, user.id)
+    session.commit()
+
+
 def delete_user(session: Session, *, user_id) -> bool:
     user = session.get(User, user_id)
     if user is None:
         return False
     session.delete(user)
+    mark_all_questions_changed(session)
+    mark_users_changed(session, user_id)
     session.commit()
     return True
@@ -1,7 +1,11 @@
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.app.db.upserts import upsert_insert
+from backend.app.models.answer import Answer
+from backend.app.models.question import Question
 from backend.app.models.vote import Vote
+from backend.app.repositories.counter_repo import apply_vote_change
 
 
 def create_vote(
@@ -19,6 +23,9 @@ def create_vote(
         value=value,
     )
     session.add(vote)
+    apply_vote_change(
+        session, target_type=target_type, target_id=target_id, new_value=value
+    )
     session.commit()
     session.refresh(vote)
     return vote
@@ -47,6 +54,35 @@ def upsert_vote(
     target_id,
     value: int,
 ) -> Vote:
+    stmt = upsert_insert(session, Vote)
+    if stmt is not None:
+        stmt = stmt.values(
+            user_id=user_id,
+            target_type=target_type,
+            target_id=target_id,
+            value=value,
+            previous_value=0,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Vote.user_id, Vote.target_type, Vote.target_id],
+            set_={"value": stmt.excluded.value, "previous_value": Vote.value},
+        ).returning(Vote)
+        vote = session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
+        apply_vote_change(
+            session,
+            target_type=target_type,
+            target_id=target_id,
+            old_value=vote.previous_value,
+            new_value=value,
+        )
+        # Detach before committing so the RETURNING values stay loaded
+        # instead of being expired and re-read by the caller.
+        session.expunge(vote)
+        session.commit()
+        return vote
+
     existing = get_vote(
         session,
         user_id=user_id,
@@ -55,6 +91,14 @@ def upsert_vote(
     )
 
     if existing is not None:
+        apply_vote_change(
+            session,
+            target_type=target_type,
+            target_id=target_id,
+            old_value=existing.value,
+            new_value=value,
+        )
+        existing.previous_value = existing.value
         existing.value = value
         session.add(existing)
         session.commit()
@@ -70,11 +114,33 @@ def upsert_vote(
     )
 
 
-def get_vote_score(
-    session: Session, *, target_type: str, target_id
-) -> int:
-    stmt = select(func.coalesce(func.sum(Vote.value), 0)).where(
-        Vote.target_type == target_type,
-        Vote.target_id == target_id,
+# Scores are the counter columns kept on the target rows; see
+# counter_repo.apply_vote_change.
+SCORED_MODELS = {"question": Question, "answer": Answer}
+
+
+def get_vote_score(session: Session, *, target_type: str, target_id) -> int:
+    model = SCORED_MODELS[target_type]
+    stmt = select(model.vote_score).where(model.id == target_id)
+    return int(session.scalar(stmt) or 0)
+
+
+def get_vote_scores(session: Session, *, target_type: str, target_ids: list) -> dict:
+    if not target_ids:
+        return {}
+    model = SCORED_MODELS[target_type]
+    stmt = select(model.id, model.vote_score).where(model.id.in_(target_ids))
+    return {row[0]: int(row[1]) for row in session.execute(stmt).all()}
+
+
+def get_vote_totals(session: Session, *, target_type: str, target_ids: list) -> dict:
+    if not target_ids:
+        return {}
+    model = SCORED_MODELS[target_type]
+    stmt = select(model.id, model.vote_score, model.up_count, model.down_count).where(
+        model.id.in_(target_ids)
     )
-    return int(session.execute(stmt).scalar_one())
+    return {
+        row[0]: {"score": int(row[1]), "up": int(row[2]), "down": int(row[3])}
+        for row in session.execute(stmt).all()
+    }
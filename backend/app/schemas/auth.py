@@ -19,3 +19,8 @@ class TokenResponse(BaseModel):
     access_token: str
     token_type: str
     role: Literal["student", "admin"] | None = None
+
+
+class StreamTicketResponse(BaseModel):
+    ticket: str
+    expires_in: int
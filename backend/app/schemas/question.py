@@ -32,5 +32,10 @@ class QuestionOut(BaseModel):
     answers_count: int
     views_count: int
     vote_score: int
+    snippet: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class DuplicateQuestionOut(QuestionOut):
+    score: float
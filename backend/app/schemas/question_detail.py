@@ -19,6 +19,9 @@ class QuestionDetailOut(BaseModel):
     accepted_answer_id: uuid.UUID | None
     created_at: datetime
     updated_at: datetime
+    answers_count: int
+    views_count: int
+    vote_score: int
     answers: list[AnswerOut]
     tags: list[TagOut]
     related_questions: list[QuestionOut]
@@ -1,8 +1,13 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from backend.app.core.pubsub import publish_after_commit, question_channel
+from backend.app.core.question_cache import mark_questions_changed
 from backend.app.models.answer import Answer
 from backend.app.models.question import Question
+from backend.app.repositories.outbox_repo import add_outbox_event
+from backend.app.schemas.answer import AnswerOut
+from backend.app.services.question_service import load_author_names
 
 
 class AcceptAnswerResult:
@@ -41,6 +46,53 @@ def accept_answer(
 
     session.add(question)
     session.add(answer)
+    if answer.author_id != acting_user_id:
+        add_outbox_event(
+            session,
+            topic="answer_accepted",
+            payload={
+                "question_id": str(question.id),
+                "answer_id": str(answer.id),
+                "answer_author_id": str(answer.author_id),
+                "actor_id": str(acting_user_id),
+            },
+        )
+    mark_questions_changed(session, question.id)
+    publish_after_commit(
+        session,
+        question_channel(question.id),
+        "accepted",
+        {"question_id": str(question.id), "answer_id": str(answer.id)},
+    )
     session.commit()
 
     return AcceptAnswerResult(question=question, answer=answer)
+
+
+def build_answer_outs(
+    session: Session,
+    answers: list[Answer],
+    *,
+    author_map: dict | None = None,
+) -> list[AnswerOut]:
+    if not answers:
+        return []
+
+    author_map = load_author_names(
+        session, [a.author_id for a in answers], author_map
+    )
+
+    return [
+        AnswerOut(
+            id=a.id,
+            question_id=a.question_id,
+            author_id=a.author_id,
+            author_name=author_map.get(a.author_id),
+            body=a.body,
+            is_accepted=a.is_accepted,
+            created_at=a.created_at,
+            updated_at=a.updated_at,
+            vote_score=a.vote_score,
+        )
+        for a in answers
+    ]
@@ -1,22 +1,50 @@
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from backend.app.core.security import hash_password, verify_password
+from backend.app.core.security import password_hasher
 from backend.app.models.user import User
-from backend.app.repositories.user_repo import create_user, get_user_by_email
+from backend.app.repositories.user_repo import (
+    create_user,
+    get_user_by_email,
+    set_password_hash,
+)
 
+# Database calls go to the threadpool; bcrypt goes to the hasher's process
+# pool, so neither blocks the event loop.
 
-def register_user(
+
+def _find_user(session: Session, email: str) -> User | None:
+    # Closing detaches the (fully loaded) user and returns the connection to
+    # the pool, so requests waiting on bcrypt don't hold connections.
+    user = get_user_by_email(session, email)
+    session.close()
+    return user
+
+
+def _insert_user(session: Session, **fields) -> User:
+    # The email check runs before hashing, so a concurrent registration can
+    # take the address in between; the unique index has the final say.
+    try:
+        return create_user(session, **fields)
+    except IntegrityError:
+        session.rollback()
+        raise ValueError("email already registered")
+
+
+async def register_user(
     session: Session, *, email: str, full_name: str, password: str, role: str
 ) -> User:
-    existing = get_user_by_email(session, email)
+    existing = await run_in_threadpool(_find_user, session, email)
     if existing is not None:
         raise ValueError("email already registered")
 
     if role not in {"student", "admin"}:
         raise ValueError("invalid role")
 
-    password_hash = hash_password(password)
-    return create_user(
+    password_hash = await password_hasher.hash(password)
+    return await run_in_threadpool(
+        _insert_user,
         session,
         email=email,
         full_name=full_name,
@@ -25,12 +53,21 @@ def register_user(
     )
 
 
-def authenticate_user(session: Session, *, email: str, password: str) -> User | None:
-    user = get_user_by_email(session, email)
+async def authenticate_user(
+    session: Session, *, email: str, password: str
+) -> User | None:
+    user = await run_in_threadpool(_find_user, session, email)
     if user is None:
         return None
 
-    if not verify_password(password, user.password_hash):
+    verified, new_hash = await password_hasher.verify_and_update(
+        password, user.password_hash
+    )
+    if not verified:
         return None
 
+    if new_hash is not None:
+        await run_in_threadpool(
+            set_password_hash, session, user=user, password_hash=new_hash
+        )
     return user
@@ -0,0 +1,115 @@
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.core.config import Settings
+from backend.app.models.question import Question
+from backend.app.repositories.notification_repo import (
+    add_follower_notifications,
+    add_notifications,
+    coalesce_notification,
+)
+
+settings = Settings()
+
+# The functions below run in the outbox worker; the worker commits.
+
+
+def notify_answer_posted(session: Session, *, question_id, answer_id, actor_id) -> int:
+    question_author_id = session.scalar(
+        select(Question.author_id).where(Question.id == question_id)
+    )
+    if question_author_id is None:
+        return 0
+    payload = {
+        "question_id": str(question_id),
+        "answer_id": str(answer_id),
+        "actor_id": str(actor_id),
+    }
+    sent = 0
+    if question_author_id != actor_id:
+        sent += add_notifications(
+            session,
+            notifications=[
+                {
+                    "user_id": question_author_id,
+                    "type": "answer_posted",
+                    "payload": payload,
+                }
+            ],
+        )
+    sent += add_follower_notifications(
+        session,
+        question_id=question_id,
+        type="followed_question_answer",
+        payload=payload,
+        exclude_user_ids=[actor_id, question_author_id],
+    )
+    return sent
+
+
+def _on_answer_posted(session: Session, payload: dict) -> None:
+    notify_answer_posted(
+        session,
+        question_id=uuid.UUID(payload["question_id"]),
+        answer_id=uuid.UUID(payload["answer_id"]),
+        actor_id=uuid.UUID(payload["actor_id"]),
+    )
+
+
+def _on_answer_accepted(session: Session, payload: dict) -> None:
+    add_notifications(
+        session,
+        notifications=[
+            {
+                "user_id": uuid.UUID(payload["answer_author_id"]),
+                "type": "accepted_answer",
+                "payload": {
+                    "question_id": payload["question_id"],
+                    "answer_id": payload["answer_id"],
+                    "actor_id": payload["actor_id"],
+                },
+            }
+        ],
+    )
+
+
+def _on_vote_cast(session: Session, payload: dict) -> None:
+    notification = {
+        "target_type": payload["target_type"],
+        "target_id": payload["target_id"],
+        "actor_id": payload["actor_id"],
+        "value": payload["value"],
+    }
+    if payload.get("question_id") is not None:
+        notification["question_id"] = payload["question_id"]
+    if settings.notification_coalesce_seconds > 0:
+        coalesce_notification(
+            session,
+            user_id=uuid.UUID(payload["owner_id"]),
+            type="vote_received",
+            group_key=f"vote_received:{payload['target_type']}:{payload['target_id']}",
+            actor_id=payload["actor_id"],
+            payload=notification,
+            window_seconds=settings.notification_coalesce_seconds,
+            max_actors=settings.notification_coalesce_actors,
+        )
+        return
+    add_notifications(
+        session,
+        notifications=[
+            {
+                "user_id": uuid.UUID(payload["owner_id"]),
+                "type": "vote_received",
+                "payload": notification,
+            }
+        ],
+    )
+
+
+OUTBOX_HANDLERS = {
+    "answer_posted": _on_answer_posted,
+    "answer_accepted": _on_answer_accepted,
+    "vote_cast": _on_vote_cast,
+}
@@ -2,17 +2,28 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from backend.app.core.security import password_hasher
 from backend.app.models.password_reset import PasswordResetToken
 from backend.app.models.user import User
+from backend.app.repositories.user_repo import set_password_hash
 
 
 def _hash_token(token: str) -> str:
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
+def _expired(record: PasswordResetToken) -> bool:
+    expires_at = record.expires_at
+    # SQLite hands back naive datetimes; they were stored as UTC.
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= datetime.now(tz=timezone.utc)
+
+
 def create_reset_token(
     session: Session, *, user: User, expires_in_minutes: int = 30
 ) -> str:
@@ -38,24 +49,50 @@ def verify_reset_token(session: Session, *, token: str) -> User | None:
     if record is None:
         return None
 
-    if record.expires_at <= datetime.now(tz=timezone.utc):
+    if _expired(record):
         return None
 
     return session.get(User, record.user_id)
 
 
-def consume_reset_token(session: Session, *, token: str) -> User | None:
+def _check_reset_token(session: Session, token: str) -> User | None:
+    # Closing returns the connection to the pool while bcrypt runs.
+    user = verify_reset_token(session, token=token)
+    session.close()
+    return user
+
+
+def consume_reset_token(session: Session, *, token: str, password_hash: str) -> bool:
+    # The token is deleted in the transaction that stores the new hash, so a
+    # refused or failed hash leaves it valid for a retry.
     token_hash = _hash_token(token)
     stmt = select(PasswordResetToken).where(PasswordResetToken.token_hash == token_hash)
     record = session.scalars(stmt).first()
     if record is None:
-        return None
+        return False
 
-    if record.expires_at <= datetime.now(tz=timezone.utc):
-        return None
+    if _expired(record):
+        return False
 
     user = session.get(User, record.user_id)
-    session.delete(record)
-    session.commit()
+    deleted = session.execute(
+        delete(PasswordResetToken).where(PasswordResetToken.id == record.id)
+    )
+    # A concurrent reset with the same token got there first.
+    if user is None or deleted.rowcount != 1:
+        session.rollback()
+        return False
 
-    return user
+    set_password_hash(session, user=user, password_hash=password_hash)
+    return True
+
+
+async def reset_password(session: Session, *, token: str, new_password: str) -> bool:
+    user = await run_in_threadpool(_check_reset_token, session, token)
+    if user is None:
+        return False
+
+    password_hash = await password_hasher.hash(new_password)
+    return await run_in_threadpool(
+        consume_reset_token, session, token=token, password_hash=password_hash
+    )
@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Session
+
+from backend.app.models.question import Question
+from backend.app.repositories.user_repo import get_user_names
+from backend.app.schemas.question import QuestionOut
+
+
+def load_author_names(
+    session: Session, author_ids, known: dict | None = None
+) -> dict:
+    author_map = dict(known or {})
+    missing = list({a for a in author_ids if a not in author_map})
+    author_map.update(get_user_names(session, user_ids=missing))
+    return author_map
+
+
+def build_question_outs(
+    session: Session,
+    questions: list[Question],
+    *,
+    author_map: dict | None = None,
+    snippets: dict | None = None,
+) -> list[QuestionOut]:
+    if not questions:
+        return []
+
+    author_map = load_author_names(
+        session, [q.author_id for q in questions], author_map
+    )
+
+    return [
+        QuestionOut(
+            id=q.id,
+            author_id=q.author_id,
+            author_name=author_map.get(q.author_id),
+            title=q.title,
+            body=q.body,
+            category=q.category,
+            stage=q.stage,
+            accepted_answer_id=q.accepted_answer_id,
+            created_at=q.created_at,
+            updated_at=q.updated_at,
+            answers_count=q.answers_count,
+            views_count=q.views_count,
+            vote_score=q.vote_score,
+            snippet=snippets.get(q.id) if snippets else None,
+        )
+        for q in questions
+    ]
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 
+from backend.app.core.pubsub import publish_after_commit, question_channel
 from backend.app.models.answer import Answer
 from backend.app.models.question import Question
 from backend.app.models.vote import Vote
+from backend.app.repositories.outbox_repo import add_outbox_event
 from backend.app.repositories.vote_repo import upsert_vote
 
 
@@ -27,17 +29,44 @@ def cast_vote(
         if target is None:
             raise VoteTargetNotFound("question not found")
         author_id = target.author_id
+        question_id = target_id
     elif target_type == "answer":
         target = session.get(Answer, target_id)
         if target is None:
             raise VoteTargetNotFound("answer not found")
         author_id = target.author_id
+        question_id = target.question_id
     else:
         raise VoteTargetNotFound("unknown target type")
 
     if author_id == actor_id:
         raise SelfVoteNotAllowed("self vote not allowed")
 
+    # Committed by upsert_vote together with the vote itself.
+    add_outbox_event(
+        session,
+        topic="vote_cast",
+        payload={
+            "owner_id": str(author_id),
+            "target_type": target_type,
+            "target_id": str(target_id),
+            "question_id": str(question_id) if target_type == "answer" else None,
+            "actor_id": str(actor_id),
+            "value": value,
+        },
+    )
+
+    publish_after_commit(
+        session,
+        question_channel(question_id),
+        "vote",
+        {
+            "question_id": str(question_id),
+            "target_type": target_type,
+            "target_id": str(target_id),
+        },
+    )
+
     return upsert_vote(
         session,
         user_id=actor_id,
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+PASSWORD = "password123"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(db_path: str, port: int, hash_workers: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite+pysqlite:///{db_path}",
+        JWT_SECRET=os.environ.get("JWT_SECRET", "bench-secret"),
+        PASSWORD_HASH_WORKERS=str(hash_workers),
+        OUTBOX_WORKERS="0",
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("API did not start")
+
+
+def _seed(client: httpx.Client, users: int) -> list[str]:
+    emails = [f"bench{idx}@example.com" for idx in range(users)]
+    for email in emails:
+        client.post(
+            "/auth/register",
+            json={"email": email, "password": PASSWORD, "full_name": "Bench User"},
+        )
+    token = client.post(
+        "/auth/login", json={"email": emails[0], "password": PASSWORD}
+    ).json()["access_token"]
+    for idx in range(40):
+        client.post(
+            "/questions",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "title": f"Benchmark question number {idx}",
+                "body": "Question body is long enough for validation.",
+                "category": "Python",
+                "stage": "Foundation",
+            },
+        )
+    return emails
+
+
+def _sample(client: httpx.Client, stop: threading.Event) -> list[float]:
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        client.get("/questions", params={"limit": 20})
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    samples = sorted(samples)
+    p99 = samples[max(int(len(samples) * 0.99) - 1, 0)]
+    return (
+        f"n={len(samples):5d} p50={statistics.median(samples):7.2f}ms "
+        f"p99={p99:7.2f}ms"
+    )
+
+
+def _run(hash_workers: int, logins: int, users: int, quiet_seconds: float) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        port = _free_port()
+        server = _start_server(os.path.join(tmp, "bench.db"), port, hash_workers)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            with httpx.Client(base_url=base_url, timeout=600) as client:
+                emails = _seed(client, users)
+
+                stop = threading.Event()
+                with ThreadPoolExecutor(max_workers=1) as sampler:
+                    quiet = sampler.submit(_sample, client, stop)
+                    time.sleep(quiet_seconds)
+                    stop.set()
+                    quiet_samples = quiet.result()
+
+                stop = threading.Event()
+                with (
+                    ThreadPoolExecutor(max_workers=1) as sampler,
+                    httpx.Client(
+                        base_url=base_url,
+                        timeout=600,
+                        limits=httpx.Limits(max_connections=logins),
+                    ) as burst_client,
+                ):
+                    busy = sampler.submit(_sample, client, stop)
+
+                    def _login(idx: int) -> int:
+                        return burst_client.post(
+                            "/auth/login",
+                            json={
+                                "email": emails[idx % len(emails)],
+                                "password": PASSWORD,
+                            },
+                        ).status_code
+
+                    started = time.perf_counter()
+                    with ThreadPoolExecutor(max_workers=logins) as pool:
+                        statuses = list(pool.map(_login, range(logins)))
+                    elapsed = time.perf_counter() - started
+                    stop.set()
+                    busy_samples = busy.result()
+
+            print(f"PASSWORD_HASH_WORKERS={hash_workers}")
+            print(f"  GET /questions idle   {_summary(quiet_samples)}")
+            print(f"  GET /questions burst  {_summary(busy_samples)}")
+            print(
+                f"  {logins} logins in {elapsed:.1f}s "
+                f"({statuses.count(200)} ok, {statuses.count(503)} shed)"
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure GET /questions latency during a burst of logins."
+    )
+    parser.add_argument(
+        "--hash-workers",
+        type=int,
+        nargs="+",
+        default=[0, 2],
+        help="PASSWORD_HASH_WORKERS values to compare (0 = threadpool)",
+    )
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--quiet-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    for hash_workers in args.hash_workers:
+        _run(hash_workers, args.logins, args.users, args.quiet_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import models  # noqa: F401
+from backend.app.db.base import Base
+from backend.app.db.search import LikeSearchBackend, get_search_backend
+from backend.app.models.question import Question
+
+TOPICS = (
+    "python react django flask docker compose kubernetes virtualenv pandas "
+    "numpy dataframe merge state hook effect render component router api "
+    "endpoint request response token auth login session cookie database "
+    "index query migration schema model serializer test fixture deploy "
+    "server nginx gunicorn heroku git branch rebase commit conflict"
+).split()
+# Filler vocabulary with a Zipf-like distribution so query terms have the
+# mixed selectivity of real posts instead of matching most rows.
+VOCABULARY = [f"w{rank}" for rank in range(20_000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+QUERIES = ["docker", "react hook", "git rebase conflict", "w50", "w5000"]
+
+
+def _sentence(rng: random.Random, count: int) -> str:
+    words = rng.choices(VOCABULARY, WEIGHTS, k=count)
+    words[rng.randrange(count)] = rng.choice(TOPICS)
+    return " ".join(words)
+
+
+def _seed(session, count: int) -> None:
+    rng = random.Random(42)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for start in range(0, count, 5000):
+        rows = []
+        for idx in range(start, min(start + 5000, count)):
+            created_at = base + timedelta(seconds=idx)
+            rows.append(
+                {
+                    "id": uuid.uuid4(),
+                    "author_id": uuid.uuid4(),
+                    "title": _sentence(rng, 8),
+                    "body": _sentence(rng, 40),
+                    "category": "Python",
+                    "stage": "Foundation",
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+            )
+        session.execute(insert(Question), rows)
+    session.commit()
+
+
+def _time(session, backend, q: str, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        stmt = backend.apply(select(Question.id), q)
+        stmt = stmt.order_by(Question.created_at.desc()).limit(20)
+        started = time.perf_counter()
+        session.execute(stmt).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ILIKE scanning with the full-text search index."
+    )
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite+pysqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+
+        started = time.perf_counter()
+        _seed(session, args.questions)
+        fts = get_search_backend(session)
+        fts.rebuild(session)
+        print(
+            f"seeded and indexed {args.questions} questions "
+            f"in {time.perf_counter() - started:.1f}s (backend={fts.name})"
+        )
+
+        for q in QUERIES:
+            for backend in (LikeSearchBackend(), fts):
+                samples = sorted(_time(session, backend, q, args.repeat))
+                p95 = samples[int(len(samples) * 0.95) - 1]
+                print(
+                    f"{backend.name:>12} {q!r:<24} "
+                    f"p50={statistics.median(samples):8.2f}ms p95={p95:8.2f}ms"
+                )
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
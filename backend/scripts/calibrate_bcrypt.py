@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from passlib.hash import bcrypt
+
+from backend.app.core.config import Settings
+
+
+def _median_ms(rounds: int, samples: int) -> float:
+    hasher = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time bcrypt on this machine and recommend BCRYPT_ROUNDS."
+    )
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="largest acceptable time for one hash (default: 250)",
+    )
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    args = parser.parse_args()
+
+    recommended = None
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        elapsed = _median_ms(rounds, args.samples)
+        print(f"rounds={rounds:2d} {elapsed:9.1f}ms")
+        if elapsed <= args.target_ms:
+            recommended = rounds
+        else:
+            # Each extra round doubles the cost, so stop at the first miss.
+            break
+
+    print(f"current BCRYPT_ROUNDS={Settings().bcrypt_rounds}")
+    if recommended is None:
+        print(
+            f"even {args.min_rounds} rounds take longer than {args.target_ms}ms; "
+            "lower --min-rounds or raise --target-ms"
+        )
+        return
+    print(f"recommended BCRYPT_ROUNDS={recommended}")
+
+
+if __name__ == "__main__":
+    main()
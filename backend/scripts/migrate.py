@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from backend.app import models  # noqa: F401
+from backend.app.db.migrations import COUNTER_COLUMNS, upgrade_schema
+from backend.app.db.search import rebuild_search_index
+from backend.app.db.session import SessionLocal, engine
+from backend.app.repositories.counter_repo import reconcile_counters
+from backend.app.repositories.notification_repo import rebuild_unread_counts
+from backend.app.repositories.question_similarity_repo import (
+    rebuild_question_similarity,
+)
+from backend.app.repositories.question_view_repo import backfill_view_sketches
+
+
+def main() -> None:
+    changes = upgrade_schema(engine)
+    for table in changes["tables"]:
+        print(f"created table {table}")
+    for table, column in changes["columns"]:
+        print(f"added column {table}.{column}")
+    for table, count in changes["duplicates"].items():
+        print(f"removed {count} duplicate rows from {table}")
+    for name in changes["indexes"]:
+        print(f"created index {name}")
+    for name in changes["dropped_indexes"]:
+        print(f"dropped index {name}")
+
+    if ("questions", "viewers_sketch") in changes["columns"]:
+        with SessionLocal() as session:
+            sketched = backfill_view_sketches(session)
+        print(f"viewer sketches built for {sketched} questions")
+
+    votes_deduplicated = "votes" in changes["duplicates"]
+    if COUNTER_COLUMNS.intersection(changes["columns"]) or votes_deduplicated:
+        with SessionLocal() as session:
+            reconcile_counters(session)
+        print("counters reconciled")
+
+    if "notification_counters" in changes["tables"]:
+        with SessionLocal() as session:
+            stored = rebuild_unread_counts(session)
+        print(f"unread notification counts built for {stored} users")
+
+    if "question_similarity" in changes["tables"]:
+        with SessionLocal() as session:
+            stored = rebuild_question_similarity(session)
+        print(f"question similarity built with {stored} pairs")
+
+    if changes["search_index"]:
+        with SessionLocal() as session:
+            indexed = rebuild_search_index(session)
+        print(f"search index built for {indexed} questions")
+
+    print(
+        "Migration complete:",
+        f"tables={len(changes['tables'])}",
+        f"columns={len(changes['columns'])}",
+        f"indexes={len(changes['indexes'])}",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from backend.app.db.session import SessionLocal
+from backend.app.repositories.question_view_repo import (
+    backfill_view_sketches,
+    prune_question_views,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Delete raw question view rows once they are in the sketches."
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=30,
+        help="keep rows newer than this many days (default: 30)",
+    )
+    args = parser.parse_args()
+
+    before = datetime.now(tz=timezone.utc) - timedelta(days=args.older_than_days)
+    session = SessionLocal()
+    try:
+        sketched = backfill_view_sketches(session)
+        pruned = prune_question_views(session, before=before)
+    finally:
+        session.close()
+
+    print("Prune complete:", f"sketched={sketched}", f"pruned={pruned}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+
+from backend.app.db.session import SessionLocal
+from backend.app.repositories.question_similarity_repo import (
+    SIMILARITY_TOP_K,
+    rebuild_question_similarity,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute the precomputed tag-similarity table."
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=SIMILARITY_TOP_K,
+        help="similar questions kept per question",
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        stored = rebuild_question_similarity(session, k=args.top_k)
+    finally:
+        session.close()
+
+    print("Question similarity rebuilt:", f"pairs={stored}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from backend.app.db.search import get_search_backend
+from backend.app.db.session import SessionLocal
+
+
+def main() -> None:
+    session = SessionLocal()
+    try:
+        backend = get_search_backend(session)
+        indexed = backend.rebuild(session)
+    finally:
+        session.close()
+
+    print("Search index rebuilt:", f"backend={backend.name}", f"questions={indexed}")
+
+
+if __name__ == "__main__":
+    main()
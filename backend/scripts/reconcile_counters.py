@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+
+from backend.app.db.session import SessionLocal
+from backend.app.repositories.counter_repo import reconcile_counters
+from backend.app.repositories.notification_repo import rebuild_unread_counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recompute denormalized question/answer counters."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="report drift without writing corrected values",
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        drift = reconcile_counters(session, apply=not args.dry_run)
+        unread = 0 if args.dry_run else rebuild_unread_counts(session)
+    finally:
+        session.close()
+
+    for table, rows in drift.items():
+        for row in rows:
+            changes = ", ".join(
+                f"{name}: {row['stored'][name]} -> {row['expected'][name]}"
+                for name in row["expected"]
+                if row["stored"][name] != row["expected"][name]
+            )
+            print(f"{table} {row['id']}: {changes}")
+
+    print(
+        "Reconcile complete:",
+        f"questions={len(drift['questions'])}",
+        f"answers={len(drift['answers'])}",
+        f"unread_counts={unread}",
+        "(dry run)" if args.dry_run else "(applied)",
+    )
+
+
+if __name__ == "__main__":
+    main()
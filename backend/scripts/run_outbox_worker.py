@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import threading
+
+from backend.app.core.outbox import outbox_worker
+from backend.app.db.session import SessionLocal
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Deliver outbox events (notifications) outside the API."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(outbox_worker.workers, 1),
+        help="number of worker threads (default: OUTBOX_WORKERS, at least 1)",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="deliver the events that are due now and exit",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.once:
+        delivered = outbox_worker.drain(SessionLocal)
+        print("Outbox drained:", f"claimed={delivered}", outbox_worker.stats())
+        return
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    outbox_worker.start(SessionLocal, workers=args.workers)
+    print(f"Outbox worker running with {args.workers} threads")
+    stopping.wait()
+    outbox_worker.stop()
+    print("Outbox worker stopped:", outbox_worker.stats())
+
+
+if __name__ == "__main__":
+    main()
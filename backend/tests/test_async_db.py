@@ -0,0 +1,96 @@
+import importlib
+import os
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.app.db.base import Base
+
+
+def _reload_app(database_url: str):
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["JWT_SECRET"] = "test-secret"
+    os.environ["JWT_ALGORITHM"] = "HS256"
+    os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "60"
+
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+
+    for name in (
+        "backend.app.core.jwt",
+        "backend.app.api.auth",
+        "backend.app.api.questions",
+        "backend.app.api.notifications",
+    ):
+        importlib.reload(importlib.import_module(name))
+
+    Base.metadata.create_all(bind=session_module.engine)
+
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+
+    return main_module.app, session_module
+
+
+def _exercise_read_endpoints(client: TestClient) -> None:
+    token = client.post(
+        "/auth/register",
+        json={
+            "email": "async@example.com",
+            "password": "password123",
+            "full_name": "Async User",
+        },
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        "/questions",
+        headers=headers,
+        json={
+            "title": "How do async sessions work?",
+            "body": "Question body is long enough for validation.",
+            "category": "Python",
+            "stage": "Foundation",
+        },
+    )
+    assert created.status_code == 200
+    question_id = created.json()["id"]
+
+    listed = client.get("/questions")
+    assert listed.status_code == 200
+    assert [q["id"] for q in listed.json()] == [question_id]
+    assert client.get("/questions", params={"cursor": "nope"}).status_code == 400
+
+    detail = client.get(f"/questions/{question_id}", headers=headers)
+    assert detail.status_code == 200
+    assert detail.json()["title"] == "How do async sessions work?"
+
+    assert client.get("/notifications", headers=headers).json() == []
+    assert client.get("/notifications/unread-count", headers=headers).json() == {
+        "unread": 0
+    }
+    assert client.get("/notifications").status_code == 401
+
+
+def test_file_database_reads_through_the_async_engine(tmp_path) -> None:
+    app, session_module = _reload_app(f"sqlite+pysqlite:///{tmp_path / 'app.db'}")
+    try:
+        assert isinstance(session_module.async_engine, AsyncEngine)
+        assert session_module.async_engine.url.drivername == "sqlite+aiosqlite"
+        with TestClient(app) as client:
+            _exercise_read_endpoints(client)
+    finally:
+        _reload_app("sqlite+pysqlite:///:memory:")
+
+
+def test_in_memory_database_falls_back_to_the_threadpool() -> None:
+    app, session_module = _reload_app("sqlite+pysqlite:///:memory:")
+
+    assert session_module.async_engine is None
+    assert session_module.async_database_url("sqlite+pysqlite:///:memory:") is None
+    assert (
+        session_module.async_database_url(
+            "postgresql+psycopg2://user:pw@db/moringa"
+        ).drivername
+        == "postgresql+psycopg"
+    )
+    _exercise_read_endpoints(TestClient(app))
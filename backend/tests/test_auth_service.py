@@ -1,7 +1,11 @@
-from sqlalchemy import create_engine
+import asyncio
+
+from sqlalchemy import create_engine, select
 from sqlalchemy.orm import sessionmaker
 
 from backend.app.db.base import Base
+from backend.app.models.user import User
+from backend.app.services import auth_service
 from backend.app.services.auth_service import authenticate_user, register_user
 
 
@@ -11,11 +15,13 @@ def test_register_user_creates_user() -> None:
     SessionLocal = sessionmaker(bind=engine)
 
     with SessionLocal() as session:
-        user = register_user(
-            session,
-            email="test@example.com",
-            full_name="Test User",
-            password="password123",
+        user = asyncio.run(
+            register_user(
+                session,
+                email="test@example.com",
+                full_name="Test User",
+                password="password123",
+            )
         )
 
         assert user.id is not None
@@ -28,19 +34,23 @@ def test_register_user_duplicate_email_raises() -> None:
     SessionLocal = sessionmaker(bind=engine)
 
     with SessionLocal() as session:
-        register_user(
-            session,
-            email="test@example.com",
-            full_name="Test User",
-            password="password123",
-        )
-
-        try:
+        asyncio.run(
             register_user(
                 session,
                 email="test@example.com",
-                full_name="Another",
-                password="password456",
+                full_name="Test User",
+                password="password123",
+            )
+        )
+
+        try:
+            asyncio.run(
+                register_user(
+                    session,
+                    email="test@example.com",
+                    full_name="Another",
+                    password="password456",
+                )
             )
             assert False, "expected ValueError"
         except ValueError:
@@ -53,19 +63,61 @@ def test_authenticate_user() -> None:
     SessionLocal = sessionmaker(bind=engine)
 
     with SessionLocal() as session:
-        register_user(
-            session,
-            email="test@example.com",
-            full_name="Test User",
-            password="password123",
+        asyncio.run(
+            register_user(
+                session,
+                email="test@example.com",
+                full_name="Test User",
+                password="password123",
+            )
         )
 
-        user = authenticate_user(
-            session, email="test@example.com", password="password123"
+        user = asyncio.run(
+            authenticate_user(session, email="test@example.com", password="password123")
         )
         assert user is not None
 
-        wrong = authenticate_user(
-            session, email="test@example.com", password="wrong"
+        wrong = asyncio.run(
+            authenticate_user(session, email="test@example.com", password="wrong")
         )
         assert wrong is None
+
+
+def test_concurrent_registrations_with_one_email_conflict_cleanly(
+    tmp_path, monkeypatch
+) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'auth.db'}")
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    # Both requests get past the email check before either inserts.
+    monkeypatch.setattr(auth_service, "_find_user", lambda session, email: None)
+
+    async def _register_twice():
+        sessions = [SessionLocal(), SessionLocal()]
+        try:
+            return await asyncio.gather(
+                *(
+                    register_user(
+                        session,
+                        email="race@example.com",
+                        full_name=f"Racer {idx}",
+                        password="password123",
+                        role="student",
+                    )
+                    for idx, session in enumerate(sessions)
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            for session in sessions:
+                session.close()
+
+    results = asyncio.run(_register_twice())
+    errors = [r for r in results if isinstance(r, Exception)]
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)
+    assert str(errors[0]) == "email already registered"
+
+    with SessionLocal() as session:
+        emails = session.scalars(select(User.email)).all()
+    assert emails == ["race@example.com"]
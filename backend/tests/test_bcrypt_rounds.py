@@ -0,0 +1,72 @@
+import asyncio
+
+from passlib.context import CryptContext
+from passlib.hash import bcrypt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.core import security
+from backend.app.db.base import Base
+from backend.app.repositories.user_repo import create_user, get_user_by_email
+from backend.app.services import auth_service
+
+
+def _rounds(password_hash: str) -> int:
+    return int(password_hash.split("$")[2])
+
+
+def test_login_rehashes_when_the_cost_changes(monkeypatch) -> None:
+    monkeypatch.setattr(
+        security,
+        "pwd_context",
+        CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=5),
+    )
+    monkeypatch.setattr(
+        auth_service,
+        "password_hasher",
+        security.PasswordHasher(workers=0, max_pending=10),
+    )
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as session:
+        create_user(
+            session,
+            email="user@example.com",
+            full_name="Test User",
+            password_hash=bcrypt.using(rounds=4).hash("password123"),
+        )
+
+    def _login(password: str):
+        with SessionLocal() as session:
+            return asyncio.run(
+                auth_service.authenticate_user(
+                    session, email="user@example.com", password=password
+                )
+            )
+
+    def _stored() -> str:
+        with SessionLocal() as session:
+            return get_user_by_email(session, "user@example.com").password_hash
+
+    assert _login("wrong") is None
+    assert _rounds(_stored()) == 4
+
+    user = _login("password123")
+    assert user is not None and user.email == "user@example.com"
+    rehashed = _stored()
+    assert _rounds(rehashed) == 5
+
+    assert _login("password123") is not None
+    assert _stored() == rehashed
+
+
+def test_new_hashes_use_the_configured_rounds() -> None:
+    assert _rounds(security.hash_password("password123")) == (
+        security.settings.bcrypt_rounds
+    )
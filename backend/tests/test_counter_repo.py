@@ -0,0 +1,127 @@
+import uuid
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.models.answer import Answer
+from backend.app.models.question import Question
+from backend.app.repositories.admin_content_repo import (
+    delete_answer,
+    delete_user_content,
+)
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.counter_repo import reconcile_counters
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.question_view_repo import create_view
+from backend.app.repositories.vote_repo import upsert_vote
+
+
+def _make_session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _create_question(session):
+    return create_question(
+        session,
+        author_id=uuid.uuid4(),
+        title="Question title",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+
+
+def test_counters_follow_writes() -> None:
+    session = _make_session()
+    question = _create_question(session)
+    voter_id = uuid.uuid4()
+
+    answer = create_answer(
+        session,
+        question_id=question.id,
+        author_id=uuid.uuid4(),
+        body="This is a helpful answer that explains the solution clearly.",
+    )
+    create_view(session, question_id=question.id, viewer_session="abc")
+    upsert_vote(
+        session,
+        user_id=voter_id,
+        target_type="question",
+        target_id=question.id,
+        value=1,
+    )
+    upsert_vote(
+        session,
+        user_id=voter_id,
+        target_type="question",
+        target_id=question.id,
+        value=-1,
+    )
+    upsert_vote(
+        session,
+        user_id=voter_id,
+        target_type="answer",
+        target_id=answer.id,
+        value=1,
+    )
+
+    question = session.get(Question, question.id)
+    answer = session.get(Answer, answer.id)
+    assert question.answers_count == 1
+    assert question.views_count == 1
+    assert question.vote_score == -1
+    assert answer.vote_score == 1
+
+    delete_user_content(session, user_id=voter_id)
+    session.refresh(question)
+    session.refresh(answer)
+    assert question.vote_score == 0
+    assert answer.vote_score == 0
+
+    delete_answer(session, answer_id=answer.id)
+    session.refresh(question)
+    assert question.answers_count == 0
+
+
+def test_reconcile_reports_and_fixes_drift() -> None:
+    session = _make_session()
+    question = _create_question(session)
+    create_answer(
+        session,
+        question_id=question.id,
+        author_id=uuid.uuid4(),
+        body="This is a helpful answer that explains the solution clearly.",
+    )
+    session.execute(
+        update(Question)
+        .where(Question.id == question.id)
+        .values(answers_count=7, views_count=3)
+    )
+    session.commit()
+
+    drift = reconcile_counters(session, apply=False)
+    assert len(drift["questions"]) == 1
+    entry = drift["questions"][0]
+    assert entry["stored"]["answers_count"] == 7
+    assert entry["expected"] == {
+        "answers_count": 1,
+        "views_count": 0,
+        "vote_score": 0,
+        "up_count": 0,
+        "down_count": 0,
+    }
+    assert drift["answers"] == []
+
+    reconcile_counters(session)
+    question = session.get(Question, question.id)
+    session.refresh(question)
+    assert question.answers_count == 1
+    assert question.views_count == 0
+
+    assert reconcile_counters(session, apply=False) == {
+        "questions": [],
+        "answers": [],
+    }
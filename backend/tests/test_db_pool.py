@@ -0,0 +1,197 @@
+import importlib
+import os
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+from backend.app.db.base import Base
+from backend.app.models.faq import FAQ
+from backend.app.models.password_reset import PasswordResetToken
+from backend.app.models.question import Question
+from backend.app.models.question_view import QuestionView
+from backend.app.repositories.admin_content_repo import (
+    delete_question,
+    delete_user_content,
+)
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.faq_repo import create_faq
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.question_view_repo import create_view
+from backend.app.repositories.user_repo import create_user, delete_user
+from backend.app.services.answer_service import accept_answer
+from backend.app.services.password_reset_service import create_reset_token
+
+POOL_ENV = {
+    "DB_POOL_SIZE": "1",
+    "DB_MAX_OVERFLOW": "0",
+    "DB_POOL_TIMEOUT_SECONDS": "0.05",
+}
+
+
+@pytest.fixture
+def file_session_module(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'app.db'}")
+    for key, value in POOL_ENV.items():
+        monkeypatch.setenv(key, value)
+    session_module = importlib.reload(importlib.import_module("backend.app.db.session"))
+    yield session_module
+    session_module.engine.dispose()
+    monkeypatch.setenv("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+    for key in POOL_ENV:
+        monkeypatch.delenv(key)
+    importlib.reload(session_module)
+
+
+def _pragma(connection, name: str):
+    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_file_sqlite_connections_get_the_pragmas(file_session_module) -> None:
+    with file_session_module.engine.connect() as connection:
+        assert _pragma(connection, "journal_mode") == "wal"
+        assert _pragma(connection, "synchronous") == 1
+        assert _pragma(connection, "mmap_size") == 268435456
+        assert _pragma(connection, "cache_size") == -65536
+        assert _pragma(connection, "busy_timeout") == 5000
+        assert _pragma(connection, "foreign_keys") == 1
+
+
+def test_every_pooled_checkout_has_foreign_keys_on(file_session_module) -> None:
+    engine = file_session_module.engine
+    for _ in range(3):
+        with engine.connect() as connection:
+            assert _pragma(connection, "foreign_keys") == 1
+        with file_session_module.SessionLocal() as session:
+            assert _pragma(session.connection(), "foreign_keys") == 1
+        # Replace the pooled connection so the next checkout is a new one.
+        engine.pool.dispose()
+
+    stats = file_session_module.pool_status()["sync"]
+    assert stats["connects"] == 3
+    assert stats["checkouts"] == 6
+
+
+def test_pool_settings_and_checkout_stats(file_session_module) -> None:
+    engine = file_session_module.engine
+    assert engine.pool.size() == 1
+    assert engine.pool._pre_ping is False
+
+    with engine.connect():
+        with pytest.raises(PoolTimeout):
+            engine.connect()
+    with engine.connect():
+        pass
+
+    stats = file_session_module.pool_status()["sync"]
+    assert stats["pool"] == "QueuePool"
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["connects"] == 1
+    assert stats["max_wait_ms"] >= 50
+    assert stats["checkedout"] == 0
+
+
+def test_deleting_a_user_with_foreign_keys_enforced(file_session_module) -> None:
+    Base.metadata.create_all(bind=file_session_module.engine)
+    session = file_session_module.SessionLocal()
+    user = create_user(
+        session, email="gone@example.com", full_name="Gone", password_hash="x"
+    )
+    other = create_user(
+        session, email="stays@example.com", full_name="Stays", password_hash="x"
+    )
+    create_reset_token(session, user=user)
+    create_reset_token(session, user=user)
+    faq = create_faq(
+        session, question="Q?", answer="A.", category=None, created_by=user.id
+    )
+    kept = create_question(
+        session,
+        author_id=other.id,
+        title="Question that outlives its viewer",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+    create_view(session, question_id=kept.id, viewer_id=user.id)
+    create_view(session, question_id=kept.id, viewer_session="anonymous")
+    owned = create_question(
+        session,
+        author_id=user.id,
+        title="Question removed with its author",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+    create_view(session, question_id=owned.id, viewer_id=other.id)
+
+    delete_user_content(session, user_id=user.id)
+    assert delete_user(session, user_id=user.id)
+
+    assert session.scalars(select(PasswordResetToken)).all() == []
+    assert session.get(FAQ, faq.id).created_by is None
+    assert session.scalars(select(QuestionView.viewer_session)).all() == ["anonymous"]
+    assert session.scalars(select(Question.id)).all() == [kept.id]
+    assert session.execute(text("PRAGMA foreign_key_check")).all() == []
+    session.close()
+
+
+def _accepted_question(session, *, asker, answerer):
+    question = create_question(
+        session,
+        author_id=asker.id,
+        title="Why does the build fail?",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+    answer = create_answer(
+        session, question_id=question.id, author_id=answerer.id, body="Pin it."
+    )
+    accept_answer(
+        session,
+        question_id=question.id,
+        answer_id=answer.id,
+        acting_user_id=asker.id,
+    )
+    return question
+
+
+def test_admin_deletes_accepted_answers_with_foreign_keys_enforced(
+    file_session_module,
+) -> None:
+    Base.metadata.create_all(bind=file_session_module.engine)
+    session = file_session_module.SessionLocal()
+    asker = create_user(
+        session, email="asker@example.com", full_name="Asker", password_hash="x"
+    )
+    answerer = create_user(
+        session, email="answerer@example.com", full_name="Answerer", password_hash="x"
+    )
+    first = _accepted_question(session, asker=asker, answerer=answerer)
+    second = _accepted_question(session, asker=asker, answerer=answerer)
+
+    assert delete_question(session, question_id=first.id)
+
+    delete_user_content(session, user_id=answerer.id)
+    assert delete_user(session, user_id=answerer.id)
+    session.expire_all()
+    assert session.get(Question, second.id).accepted_answer_id is None
+
+    delete_user_content(session, user_id=asker.id)
+    assert delete_user(session, user_id=asker.id)
+    assert session.scalars(select(Question)).all() == []
+    session.close()
+
+
+def test_in_memory_sqlite_shares_one_unconfigured_connection() -> None:
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    session_module = importlib.reload(importlib.import_module("backend.app.db.session"))
+
+    with session_module.engine.connect() as connection:
+        assert _pragma(connection, "foreign_keys") == 0
+    stats = session_module.pool_status()
+    assert stats["sync"]["pool"] == "StaticPool"
+    assert stats["sync"]["checkouts"] == 1
+    assert stats["async"] is None
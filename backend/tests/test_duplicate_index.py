@@ -0,0 +1,129 @@
+import time
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.duplicates import DuplicateIndex, shingles
+from backend.app.models.question import Question
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _add_question(session, title: str, body: str) -> Question:
+    question = Question(
+        author_id=uuid.uuid4(),
+        title=title,
+        body=body,
+        category="Python",
+        stage="Foundation",
+    )
+    session.add(question)
+    session.commit()
+    return question
+
+
+def test_shingles_normalize_case_stopwords_and_plurals() -> None:
+    assert shingles("How do I use Virtual Environments?") == {
+        "use",
+        "virtual",
+        "environment",
+    }
+
+
+def test_query_ranks_near_duplicates_with_scores() -> None:
+    index = DuplicateIndex()
+    exact = uuid.uuid4()
+    close = uuid.uuid4()
+    unrelated = uuid.uuid4()
+    index.add(exact, title="Setting up a Python virtual environment", body="venv help")
+    index.add(
+        close, title="Python virtual environment not activating", body="venv help"
+    )
+    index.add(unrelated, title="React useEffect runs twice", body="strict mode")
+
+    matches = index.query("Setting up a Python virtual environment")
+
+    assert [question_id for question_id, _ in matches] == [exact, close]
+    assert matches[0][1] == 1.0
+    assert 0.2 <= matches[1][1] < 1.0
+
+
+def test_update_and_remove_keep_buckets_consistent() -> None:
+    index = DuplicateIndex()
+    question_id = uuid.uuid4()
+    index.add(question_id, title="Docker compose networking", body="bridge")
+    index.add(question_id, title="Pandas dataframe merge", body="join keys")
+
+    assert index.query("Docker compose networking") == []
+    assert index.query("Pandas dataframe merge")[0][0] == question_id
+
+    index.remove(question_id)
+    assert index.query("Pandas dataframe merge") == []
+    assert len(index) == 0
+    assert index._buckets == {}
+
+
+def test_body_reranks_title_candidates() -> None:
+    index = DuplicateIndex()
+    flask = uuid.uuid4()
+    django = uuid.uuid4()
+    index.add(flask, title="Deploy app to Heroku", body="flask gunicorn procfile")
+    index.add(django, title="Deploy app to Heroku", body="django collectstatic")
+
+    matches = index.query("Deploy app to Heroku", body="gunicorn procfile flask")
+    assert [question_id for question_id, _ in matches] == [flask, django]
+
+
+def test_sync_only_reindexes_changed_rows_and_persists(tmp_path) -> None:
+    session = _session()
+    first = _add_question(session, "Git rebase conflict help", "Stuck mid rebase.")
+    second = _add_question(session, "Git merge conflict help", "Stuck mid merge.")
+
+    index = DuplicateIndex()
+    assert index.sync(session) == 2
+    path = tmp_path / "questions.duplicates"
+    index.save(path)
+
+    first.title = "Git cherry pick conflict help"
+    session.delete(second)
+    _add_question(session, "Rebase onto main branch", "Which command?")
+    session.commit()
+
+    restored = DuplicateIndex()
+    assert restored.load(path)
+    assert len(restored) == 2
+    assert restored.sync(session) == 3
+    assert len(restored) == 2
+    assert restored.query("Git cherry pick conflict help")[0][0] == first.id
+    assert restored.sync(session) == 0
+
+
+def test_load_rejects_corrupt_files(tmp_path) -> None:
+    path = tmp_path / "broken.duplicates"
+    path.write_bytes(b'{"version": 1, "num_perm": 96, "entries": [["x", "y"]]}\n')
+    assert not DuplicateIndex().load(path)
+    assert not DuplicateIndex().load(tmp_path / "missing.duplicates")
+
+
+def test_query_is_fast_on_large_index() -> None:
+    index = DuplicateIndex()
+    topics = ["python", "react", "docker", "git", "django", "flask", "pandas"]
+    verbs = ["install", "debug", "deploy", "configure", "test", "upgrade"]
+    for idx in range(5000):
+        title = (
+            f"{verbs[idx % 6]} {topics[idx % 7]} project{idx} module{idx % 97} "
+            f"error{idx % 89}"
+        )
+        index.add(uuid.uuid4(), title=title, body="")
+
+    started = time.perf_counter()
+    for _ in range(50):
+        index.query("deploy docker project42 module42 error42")
+    elapsed = (time.perf_counter() - started) / 50
+    assert elapsed < 0.005
@@ -0,0 +1,226 @@
+import importlib
+import os
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from backend.app.core.content_versions import (
+    get_content_version,
+    seed_content_versions,
+)
+from backend.app.core.question_cache import question_cache
+from backend.app.core.view_buffer import view_buffer
+from backend.app.db.base import Base
+from backend.app.models.content_version import ContentVersion
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.faq_repo import create_faq
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.tag_repo import create_tag
+
+
+def setup_app_with_sqlite():
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    os.environ["JWT_SECRET"] = "test-secret"
+    os.environ["JWT_ALGORITHM"] = "HS256"
+    os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "60"
+
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+
+    for name in ("questions", "tags", "faqs"):
+        importlib.reload(importlib.import_module(f"backend.app.api.{name}"))
+
+    Base.metadata.create_all(bind=session_module.engine)
+
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+
+    question_cache.clear()
+    return TestClient(main_module.app), session_module
+
+
+def _revalidate(client, path: str, **kwargs):
+    first = client.get(path, **kwargs)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    headers = {**kwargs.pop("headers", {}), "If-None-Match": etag}
+    second = client.get(path, headers=headers, **kwargs)
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    return etag
+
+
+def test_list_endpoints_answer_conditional_requests() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        create_tag(session, name="python")
+        create_faq(
+            session,
+            question="What is Moringa?",
+            answer="A school.",
+            category=None,
+            created_by=uuid.uuid4(),
+        )
+
+    tags_etag = _revalidate(client, "/tags")
+    faqs_etag = _revalidate(client, "/faqs")
+    questions_etag = _revalidate(client, "/questions", params={"q": "python"})
+
+    with session_module.SessionLocal() as session:
+        create_tag(session, name="react")
+    assert _revalidate(client, "/tags") != tags_etag
+    assert _revalidate(client, "/faqs") == faqs_etag
+
+    with session_module.SessionLocal() as session:
+        create_faq(
+            session,
+            question="Where is it?",
+            answer="Nairobi.",
+            category=None,
+            created_by=uuid.uuid4(),
+        )
+    assert _revalidate(client, "/faqs") != faqs_etag
+
+    other_query = client.get("/questions", params={"q": "react"})
+    assert other_query.headers["etag"] != questions_etag
+
+
+def test_question_detail_etag_tracks_writes() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        question = create_question(
+            session,
+            author_id=uuid.uuid4(),
+            title="Conditional question title",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+        )
+        question_id = question.id
+
+    path = f"/questions/{question_id}"
+    etag = _revalidate(client, path)
+    question_cache.clear()
+    assert _revalidate(client, path) == etag
+
+    with session_module.SessionLocal() as session:
+        create_answer(
+            session, question_id=question_id, author_id=uuid.uuid4(), body="Answer"
+        )
+    stale = client.get(path, headers={"If-None-Match": etag})
+    assert stale.status_code == 200
+    assert stale.json()["answers_count"] == 1
+    assert stale.headers["etag"] != etag
+
+    missing = client.get(f"/questions/{uuid.uuid4()}")
+    assert missing.status_code == 404
+
+
+def test_detail_etags_are_keyed_per_question_and_list_versions_striped() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        seed_content_versions(session_module.engine)
+        questions = [
+            create_question(
+                session,
+                author_id=uuid.uuid4(),
+                title=f"Striped question number {idx}",
+                body="Question body is long enough for validation.",
+                category="Python",
+                stage="Foundation",
+            )
+            for idx in range(2)
+        ]
+        quiet, busy = (f"/questions/{q.id}" for q in questions)
+        busy_id = questions[1].id
+    quiet_etag = _revalidate(client, quiet)
+    busy_etag = _revalidate(client, busy)
+    list_etag = _revalidate(client, "/questions")
+
+    def _stripes(session) -> dict:
+        rows = session.execute(
+            select(ContentVersion.name, ContentVersion.version).where(
+                ContentVersion.name.like("questions:%")
+            )
+        ).all()
+        return dict(rows)
+
+    with session_module.SessionLocal() as session:
+        before = get_content_version(session, name="questions")
+        stripes = _stripes(session)
+        for _ in range(3):
+            create_answer(
+                session, question_id=busy_id, author_id=uuid.uuid4(), body="A"
+            )
+        assert get_content_version(session, name="questions") == before + 3
+        # Every write to one question lands on the same stripe row.
+        changed = {
+            name: version - stripes[name]
+            for name, version in _stripes(session).items()
+            if version != stripes[name]
+        }
+        assert list(changed.values()) == [3]
+
+    question_cache.clear()
+    assert _revalidate(client, quiet) == quiet_etag
+    assert _revalidate(client, busy) != busy_etag
+    assert _revalidate(client, "/questions") != list_etag
+
+
+def test_view_flushes_refresh_list_etags_on_a_coarse_schedule() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        seed_content_versions(session_module.engine)
+        question_id = create_question(
+            session,
+            author_id=uuid.uuid4(),
+            title="Question that collects views",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+        ).id
+    view_buffer.clear()
+    view_buffer._lists_refreshed_at = None
+
+    def _view(viewer: str) -> None:
+        client.get(
+            f"/questions/{question_id}",
+            params={"track_view": True},
+            headers={"X-View-Session": viewer},
+        )
+
+    list_etag = _revalidate(client, "/questions")
+    _view("viewer-1")
+    assert view_buffer.flush(session_module.SessionLocal) == 1
+
+    refreshed = client.get("/questions", headers={"If-None-Match": list_etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()[0]["views_count"] == 1
+    list_etag = refreshed.headers["etag"]
+
+    # Inside the refresh interval further views wait for the next refresh.
+    _view("viewer-2")
+    assert view_buffer.flush(session_module.SessionLocal) == 1
+    assert _revalidate(client, "/questions") == list_etag
+
+    interval, view_buffer.list_refresh_seconds = view_buffer.list_refresh_seconds, 0
+    try:
+        assert view_buffer.flush(session_module.SessionLocal) == 0
+    finally:
+        view_buffer.list_refresh_seconds = interval
+    refreshed = client.get("/questions", headers={"If-None-Match": list_etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()[0]["views_count"] == 2
+
+
+def test_cache_control_depends_on_authorization() -> None:
+    client, _ = setup_app_with_sqlite()
+
+    anonymous = client.get("/tags")
+    assert anonymous.headers["cache-control"] == "public, max-age=0, must-revalidate"
+    assert "Authorization" in anonymous.headers["vary"]
+
+    authorized = client.get("/tags", headers={"Authorization": "Bearer token"})
+    assert authorized.headers["cache-control"] == "private, no-cache"
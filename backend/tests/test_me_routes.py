@@ -3,8 +3,10 @@ import os
 import uuid
 
 from fastapi.testclient import TestClient
+from sqlalchemy import delete
 
 from backend.app.db.base import Base
+from backend.app.models.user import User
 from backend.app.repositories.answer_repo import create_answer
 from backend.app.repositories.question_repo import create_question
 
@@ -114,3 +116,19 @@ def test_me_questions_and_answers_return_current_user_data() -> None:
     assert my_answers.status_code == 200
     a_items = my_answers.json()
     assert len(a_items) == 1
+
+
+def test_profile_of_a_user_deleted_elsewhere_is_unauthorized() -> None:
+    client, session_module = setup_app_with_sqlite()
+    token = _register_and_get_token(client, "gone@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/me/profile", headers=headers).status_code == 200
+
+    # Deleted behind the API, so this worker's identity cache still has it.
+    with session_module.SessionLocal() as session:
+        session.execute(delete(User).where(User.id == _decode_sub(token)))
+        session.commit()
+
+    response = client.get("/me/profile", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "user not found"
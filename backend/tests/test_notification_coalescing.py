@@ -0,0 +1,140 @@
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.models.notification import Notification
+from backend.app.repositories.notification_repo import (
+    coalesce_notification,
+    get_unread_count,
+    mark_all_read,
+)
+from backend.app.services.notification_service import OUTBOX_HANDLERS
+
+
+def _setup():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _vote(session, owner_id, target_id, actor_id, value=1) -> None:
+    OUTBOX_HANDLERS["vote_cast"](
+        session,
+        {
+            "owner_id": str(owner_id),
+            "target_type": "answer",
+            "target_id": str(target_id),
+            "question_id": str(uuid.uuid4()),
+            "actor_id": str(actor_id),
+            "value": value,
+        },
+    )
+    session.commit()
+
+
+def _rows(session, owner_id) -> list[Notification]:
+    return list(
+        session.scalars(
+            select(Notification)
+            .where(Notification.user_id == owner_id)
+            .order_by(Notification.created_at)
+        ).all()
+    )
+
+
+def test_votes_on_one_target_fold_into_one_notification() -> None:
+    session = _setup()
+    owner, answer, other_answer = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    actors = [uuid.uuid4() for _ in range(5)]
+
+    for actor in actors:
+        _vote(session, owner, answer, actor)
+    _vote(session, owner, answer, actors[3], value=-1)
+    _vote(session, owner, other_answer, actors[1])
+
+    rows = _rows(session, owner)
+    assert len(rows) == 2
+    folded = next(r for r in rows if r.payload["target_id"] == str(answer))
+    assert folded.type == "vote_received"
+    assert folded.payload["actor_count"] == 5
+    assert folded.payload["actors"] == [
+        str(a) for a in (actors[3], actors[4], actors[2])
+    ]
+    assert folded.payload["actor_id"] == str(actors[3])
+    assert folded.payload["value"] == -1
+    assert get_unread_count(session, user_id=owner) == 2
+
+
+def test_read_or_stale_notifications_start_a_new_group() -> None:
+    session = _setup()
+    owner, answer = uuid.uuid4(), uuid.uuid4()
+
+    _vote(session, owner, answer, uuid.uuid4())
+    mark_all_read(session, user_id=owner)
+    _vote(session, owner, answer, uuid.uuid4())
+    session.execute(
+        update(Notification).values(
+            created_at=datetime.now(tz=timezone.utc) - timedelta(days=1)
+        )
+    )
+    session.commit()
+    _vote(session, owner, answer, uuid.uuid4())
+
+    assert session.scalar(select(func.count()).select_from(Notification)) == 3
+    assert get_unread_count(session, user_id=owner) == 2
+
+
+def test_coalescing_is_scoped_to_the_recipient() -> None:
+    session = _setup()
+    first, second, actor = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    for owner in (first, second, first):
+        inserted = coalesce_notification(
+            session,
+            user_id=owner,
+            type="vote_received",
+            group_key="vote_received:answer:shared",
+            actor_id=actor,
+            payload={},
+            window_seconds=60,
+            max_actors=3,
+        )
+    session.commit()
+
+    assert inserted == 0
+    assert len(_rows(session, first)) == 1
+    assert len(_rows(session, second)) == 1
+    assert _rows(session, first)[0].payload["actor_count"] == 1
+
+
+def test_concurrent_workers_fold_into_one_group(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'coalesce.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    owner, answer = uuid.uuid4(), uuid.uuid4()
+    actors = [uuid.uuid4() for _ in range(8)]
+    barrier = threading.Barrier(len(actors))
+    errors = []
+
+    def _worker(actor) -> None:
+        try:
+            with factory() as session:
+                barrier.wait()
+                _vote(session, owner, answer, actor)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker, args=(a,)) for a in actors]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with factory() as session:
+        (row,) = _rows(session, owner)
+        assert row.payload["actor_count"] == len(actors)
+        assert get_unread_count(session, user_id=owner) == 1
@@ -0,0 +1,226 @@
+import importlib
+import os
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.models.follow import Follow
+from backend.app.models.notification_counter import NotificationCounter
+from backend.app.repositories.notification_repo import (
+    add_follower_notifications,
+    add_notifications,
+    create_notification,
+    get_unread_count,
+    list_notifications,
+    mark_all_read,
+    mark_notification_read,
+    rebuild_unread_counts,
+)
+
+
+def setup_app_with_sqlite():
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    os.environ["JWT_SECRET"] = "test-secret"
+    os.environ["JWT_ALGORITHM"] = "HS256"
+    os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "60"
+
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+
+    jwt_module = importlib.import_module("backend.app.core.jwt")
+    importlib.reload(jwt_module)
+
+    auth_module = importlib.import_module("backend.app.api.auth")
+    importlib.reload(auth_module)
+
+    notifications_module = importlib.import_module("backend.app.api.notifications")
+    importlib.reload(notifications_module)
+
+    Base.metadata.create_all(bind=session_module.engine)
+
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+
+    return TestClient(main_module.app), session_module
+
+
+def _register_and_get_token(client: TestClient, email: str) -> str:
+    response = client.post(
+        "/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "full_name": "Test User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+def _decode_sub(token: str) -> uuid.UUID:
+    from backend.app.core.jwt import decode_token
+
+    payload = decode_token(token)
+    return uuid.UUID(payload["sub"])
+
+
+def _counts(session) -> dict:
+    return dict(
+        session.execute(
+            select(NotificationCounter.user_id, NotificationCounter.unread)
+        ).all()
+    )
+
+
+def test_counter_follows_inserts_and_mark_all_read() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    alice, bob, carol = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    question_id = uuid.uuid4()
+    session.execute(
+        insert(Follow),
+        [{"user_id": u, "question_id": question_id} for u in (alice, bob, carol)],
+    )
+
+    create_notification(session, user_id=alice, type="answer_posted", payload={})
+    add_notifications(
+        session,
+        notifications=[
+            {"user_id": alice, "type": "vote_received", "payload": {}},
+            {"user_id": alice, "type": "vote_received", "payload": {}},
+            {"user_id": bob, "type": "vote_received", "payload": {}},
+        ],
+    )
+    add_follower_notifications(
+        session,
+        question_id=question_id,
+        type="followed_question_answer",
+        payload={},
+        exclude_user_ids=[carol],
+    )
+    session.commit()
+    assert _counts(session) == {alice: 4, bob: 2}
+
+    assert mark_all_read(session, user_id=alice) == 4
+    assert mark_all_read(session, user_id=alice) == 0
+    assert get_unread_count(session, user_id=alice) == 0
+    assert get_unread_count(session, user_id=bob) == 2
+    assert get_unread_count(session, user_id=carol) == 0
+
+    incremental = _counts(session)
+    assert rebuild_unread_counts(session) == 1
+    assert _counts(session) == incremental == {alice: 0, bob: 2}
+
+
+def test_mark_all_read_moves_a_watermark_without_touching_notifications() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    user_id = uuid.uuid4()
+    old = [
+        create_notification(session, user_id=user_id, type="t", payload={"n": n})
+        for n in range(3)
+    ]
+    assert (
+        mark_notification_read(session, user_id=user_id, notification_id=old[0].id) == 1
+    )
+    assert (
+        mark_notification_read(session, user_id=user_id, notification_id=old[0].id) == 0
+    )
+    assert get_unread_count(session, user_id=user_id) == 2
+
+    statements = []
+
+    def _record(*args) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", _record)
+    assert mark_all_read(session, user_id=user_id) == 2
+    event.remove(engine, "before_cursor_execute", _record)
+    assert not any("notifications " in s for s in statements)
+
+    assert (
+        mark_notification_read(session, user_id=user_id, notification_id=old[1].id) == 0
+    )
+    fresh = create_notification(session, user_id=user_id, type="t", payload={"n": 3})
+    session.expire_all()
+
+    listed = list_notifications(session, user_id=user_id)
+    assert [(n.payload["n"], n.is_read) for n in listed] == [
+        (3, False),
+        (2, True),
+        (1, True),
+        (0, True),
+    ]
+    assert not session.dirty
+    unread = list_notifications(session, user_id=user_id, unread_only=True)
+    assert [n.id for n in unread] == [fresh.id]
+    assert get_unread_count(session, user_id=user_id) == 1
+
+    rebuild_unread_counts(session)
+    assert get_unread_count(session, user_id=user_id) == 1
+
+
+def test_unread_count_endpoint_is_one_primary_key_read() -> None:
+    client, session_module = setup_app_with_sqlite()
+    token = _register_and_get_token(client, "user@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = _decode_sub(token)
+    with session_module.SessionLocal() as session:
+        for _ in range(3):
+            create_notification(session, user_id=user_id, type="t", payload={})
+
+    statements = []
+
+    def _record(*args) -> None:
+        statements.append(args[2])
+
+    event.listen(session_module.engine, "before_cursor_execute", _record)
+    response = client.get("/notifications/unread-count", headers=headers)
+    event.remove(session_module.engine, "before_cursor_execute", _record)
+    assert response.status_code == 200
+    assert response.json() == {"unread": 3}
+    counter_reads = [s for s in statements if "notification_counters" in s]
+    assert len(counter_reads) == 1
+    assert not any("FROM notifications" in s for s in statements)
+
+    client.post("/notifications/mark-all-read", headers=headers)
+    response = client.get("/notifications/unread-count", headers=headers)
+    assert response.json() == {"unread": 0}
+    response = client.get("/notifications", headers=headers)
+    assert all(item["is_read"] for item in response.json())
+    response = client.post(f"/notifications/{uuid.uuid4()}/read", headers=headers)
+    assert response.json() == {"updated": 0}
+
+
+def test_notifications_are_cursor_paginated() -> None:
+    client, session_module = setup_app_with_sqlite()
+    token = _register_and_get_token(client, "user@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = _decode_sub(token)
+    with session_module.SessionLocal() as session:
+        for idx in range(5):
+            create_notification(session, user_id=user_id, type="t", payload={"n": idx})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/notifications", params=params, headers=headers)
+        assert response.status_code == 200
+        seen.extend(item["payload"]["n"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == [4, 3, 2, 1, 0]
+
+    response = client.get(
+        "/notifications", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
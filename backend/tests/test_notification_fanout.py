@@ -0,0 +1,99 @@
+import uuid
+
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.models.follow import Follow
+from backend.app.models.notification import Notification
+from backend.app.models.question import Question
+from backend.app.repositories.notification_repo import (
+    add_follower_notifications,
+    list_notifications,
+)
+from backend.app.services.notification_service import notify_answer_posted
+
+
+def _setup():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)()
+
+
+def _follow(session, question_id, user_ids) -> None:
+    session.execute(
+        insert(Follow),
+        [{"user_id": user_id, "question_id": question_id} for user_id in user_ids],
+    )
+    session.commit()
+
+
+def test_answer_fan_out_is_two_inserts_and_skips_author_and_actor() -> None:
+    engine, session = _setup()
+    author_id, actor_id = uuid.uuid4(), uuid.uuid4()
+    question = Question(
+        id=uuid.uuid4(),
+        author_id=author_id,
+        title="Followed question title",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+    session.add(question)
+    session.commit()
+    question_id = question.id
+    followers = [uuid.uuid4() for _ in range(500)]
+    _follow(session, question_id, followers + [author_id, actor_id])
+
+    statements = []
+
+    def _record(*args) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", _record)
+    sent = notify_answer_posted(
+        session, question_id=question_id, answer_id=uuid.uuid4(), actor_id=actor_id
+    )
+    event.remove(engine, "before_cursor_execute", _record)
+
+    assert sent == 501
+    inserts = [s for s in statements if s.startswith("INSERT INTO notifications ")]
+    assert len(inserts) == 2
+    assert "FROM follows" in inserts[1]
+    assert len([s for s in statements if "notification_counters" in s]) == 2
+    assert not any(s.startswith("SELECT") and "follows" in s for s in statements)
+
+    counts = dict(
+        session.execute(
+            select(Notification.type, func.count()).group_by(Notification.type)
+        ).all()
+    )
+    assert counts == {"answer_posted": 1, "followed_question_answer": 500}
+    assert session.scalar(select(func.count(func.distinct(Notification.id)))) == 501
+    assert list_notifications(session, user_id=actor_id) == []
+
+
+def test_fanned_out_rows_read_back_like_single_inserts() -> None:
+    _, session = _setup()
+    question_id = uuid.uuid4()
+    follower = uuid.uuid4()
+    _follow(session, question_id, [follower])
+
+    payload = {"question_id": str(question_id), "answer_id": "a1"}
+    assert (
+        add_follower_notifications(
+            session,
+            question_id=question_id,
+            type="followed_question_answer",
+            payload=payload,
+            exclude_user_ids=[None],
+        )
+        == 1
+    )
+    session.commit()
+
+    (item,) = list_notifications(session, user_id=follower, unread_only=True)
+    assert isinstance(item.id, uuid.UUID)
+    assert item.payload == payload
+    assert item.is_read is False
+    assert item.created_at is not None
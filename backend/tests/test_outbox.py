@@ -0,0 +1,186 @@
+import uuid
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.core.outbox import OutboxWorker
+from backend.app.db.base import Base
+from backend.app.models.notification import Notification
+from backend.app.models.outbox_event import OutboxEvent
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.outbox_repo import (
+    add_outbox_event,
+    claim_outbox_events,
+    outbox_stats,
+)
+from backend.app.repositories.question_repo import create_question
+from backend.app.services.notification_service import OUTBOX_HANDLERS
+from backend.app.services.vote_service import SelfVoteNotAllowed, cast_vote
+
+
+def _factory():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def _worker(handlers=None, **overrides) -> OutboxWorker:
+    options = {
+        "workers": 1,
+        "poll_interval_ms": 10,
+        "batch_size": 10,
+        "max_attempts": 3,
+        "retry_base_ms": 0,
+        "retry_max_ms": 0,
+        "lease_seconds": 60,
+    }
+    options.update(overrides)
+    return OutboxWorker(handlers=handlers or OUTBOX_HANDLERS, **options)
+
+
+def _count(factory, model) -> int:
+    with factory() as session:
+        return session.scalar(select(func.count()).select_from(model))
+
+
+def _question_id(factory, author_id) -> uuid.UUID:
+    with factory() as session:
+        return create_question(
+            session,
+            author_id=author_id,
+            title="Outbox question title",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+        ).id
+
+
+def test_domain_writes_enqueue_events_that_the_worker_delivers() -> None:
+    factory = _factory()
+    owner = uuid.uuid4()
+    question_id = _question_id(factory, owner)
+    with factory() as session:
+        create_answer(
+            session,
+            question_id=question_id,
+            author_id=uuid.uuid4(),
+            body="This is a helpful answer that explains the solution clearly.",
+        )
+        cast_vote(
+            session,
+            actor_id=uuid.uuid4(),
+            target_type="question",
+            target_id=question_id,
+            value=1,
+        )
+
+    assert _count(factory, OutboxEvent) == 2
+    assert _count(factory, Notification) == 0
+
+    worker = _worker()
+    assert worker.drain(factory) == 2
+    assert _count(factory, OutboxEvent) == 0
+    with factory() as session:
+        types = session.scalars(
+            select(Notification.type).where(Notification.user_id == owner)
+        ).all()
+    assert sorted(types) == ["answer_posted", "vote_received"]
+    assert worker.stats()["processed"] == 2
+
+
+def test_rejected_vote_leaves_no_event() -> None:
+    factory = _factory()
+    owner = uuid.uuid4()
+    question_id = _question_id(factory, owner)
+    with factory() as session:
+        try:
+            cast_vote(
+                session,
+                actor_id=owner,
+                target_type="question",
+                target_id=question_id,
+                value=1,
+            )
+        except SelfVoteNotAllowed:
+            session.rollback()
+    assert _count(factory, OutboxEvent) == 0
+
+
+def test_failures_back_off_and_park_after_max_attempts() -> None:
+    factory = _factory()
+    calls = []
+
+    def _flaky(session, payload) -> None:
+        calls.append(payload["n"])
+        if payload["n"] == 2 or calls.count(payload["n"]) == 1:
+            raise RuntimeError("boom")
+
+    with factory() as session:
+        for n in (1, 2):
+            add_outbox_event(session, topic="flaky", payload={"n": n})
+        add_outbox_event(session, topic="unknown", payload={})
+        session.commit()
+
+    worker = _worker({"flaky": _flaky})
+    worker.drain(factory)
+
+    assert sorted(calls) == [1, 1, 2, 2, 2]
+    assert worker.stats() | {"workers": 0} == {
+        "workers": 0,
+        "processed": 1,
+        "retried": 5,
+        "dead": 2,
+        "lost": 0,
+    }
+    with factory() as session:
+        parked = session.scalars(select(OutboxEvent).order_by(OutboxEvent.id)).all()
+        assert [(e.topic, e.attempts, e.available_at) for e in parked] == [
+            ("flaky", 3, None),
+            ("unknown", 3, None),
+        ]
+        assert parked[0].last_error == "RuntimeError: boom"
+        assert "no outbox handler" in parked[1].last_error
+        assert outbox_stats(session) == {
+            "pending": 0,
+            "due": 0,
+            "dead": 2,
+            "lag_seconds": 0.0,
+        }
+
+
+def test_retry_delay_grows_exponentially_up_to_the_cap() -> None:
+    worker = _worker(max_attempts=6, retry_base_ms=500, retry_max_ms=3000)
+    assert [worker.retry_delay(n) for n in range(1, 7)] == [
+        0.5,
+        1.0,
+        2.0,
+        3.0,
+        3.0,
+        None,
+    ]
+
+
+def test_claimed_events_are_not_claimed_twice() -> None:
+    factory = _factory()
+    with factory() as session:
+        for n in range(5):
+            add_outbox_event(session, topic="noop", payload={"n": n})
+        session.commit()
+        stats = outbox_stats(session)
+    assert (stats["pending"], stats["due"]) == (5, 5)
+
+    with factory() as first, factory() as second:
+        _, claimed = claim_outbox_events(first, limit=3, lease_seconds=60)
+        _, rest = claim_outbox_events(second, limit=10, lease_seconds=60)
+        _, none = claim_outbox_events(second, limit=10, lease_seconds=60)
+    assert len(claimed) == 3 and len(rest) == 2 and none == []
+    assert {e.id for e in claimed}.isdisjoint(e.id for e in rest)
+
+    with factory() as session:
+        stats = outbox_stats(session)
+    assert (stats["pending"], stats["due"]) == (5, 0)
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.security import (
+    PasswordHasher,
+    PasswordHasherBusy,
+    verify_password,
+)
+
+
+def test_process_pool_hashes_and_verifies() -> None:
+    hasher = PasswordHasher(workers=1, max_pending=4)
+
+    async def _scenario():
+        hashed = await hasher.hash("password123")
+        results = await asyncio.gather(
+            hasher.verify("password123", hashed), hasher.verify("wrong", hashed)
+        )
+        return hashed, results
+
+    try:
+        hashed, results = asyncio.run(_scenario())
+    finally:
+        hasher.shutdown()
+
+    assert verify_password("password123", hashed)
+    assert results == [True, False]
+    assert hasher.stats() == {
+        "workers": 1,
+        "in_flight": 0,
+        "queued": 0,
+        "max_pending": 4,
+        "completed": 3,
+        "rejected": 0,
+    }
+
+
+def test_calls_past_max_pending_are_refused() -> None:
+    hasher = PasswordHasher(workers=0, max_pending=2)
+
+    async def _scenario():
+        return await asyncio.gather(
+            *(hasher.hash("password123") for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(_scenario())
+
+    assert sum(isinstance(r, PasswordHasherBusy) for r in results) == 1
+    assert sum(isinstance(r, str) for r in results) == 2
+    assert hasher.stats()["rejected"] == 1
+    with pytest.raises(PasswordHasherBusy):
+        hasher.max_pending = 0
+        asyncio.run(hasher.verify("password123", results[0]))
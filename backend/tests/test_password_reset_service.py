@@ -1,13 +1,23 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 
+import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from backend.app.db.base import Base
 from backend.app.models.password_reset import PasswordResetToken
 from backend.app.models.user import User
+from backend.app.core.security import (
+    PasswordHasher,
+    PasswordHasherBusy,
+    verify_password,
+)
+from backend.app.services import password_reset_service
 from backend.app.services.password_reset_service import (
     create_reset_token,
+    reset_password,
     verify_reset_token,
 )
 
@@ -61,3 +71,37 @@ def test_verify_reset_token_expired_returns_none() -> None:
 
     found = verify_reset_token(session, token=raw)
     assert found is None
+
+
+def test_refused_hash_leaves_the_token_usable(monkeypatch) -> None:
+    # reset_password runs its queries in the threadpool.
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    user = User(email="test@example.com", full_name="Test", password_hash="x")
+    session.add(user)
+    session.commit()
+    raw = create_reset_token(session, user=user, expires_in_minutes=30)
+
+    def _reset():
+        return asyncio.run(
+            reset_password(session, token=raw, new_password="new-password")
+        )
+
+    busy = PasswordHasher(workers=0, max_pending=0)
+    monkeypatch.setattr(password_reset_service, "password_hasher", busy)
+    with pytest.raises(PasswordHasherBusy):
+        _reset()
+    assert session.query(PasswordResetToken).count() == 1
+
+    hasher = PasswordHasher(workers=0, max_pending=10)
+    monkeypatch.setattr(password_reset_service, "password_hasher", hasher)
+    assert _reset() is True
+    assert session.query(PasswordResetToken).count() == 0
+    assert verify_password("new-password", session.get(User, user.id).password_hash)
+
+    assert _reset() is False
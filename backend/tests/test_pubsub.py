@@ -0,0 +1,338 @@
+import asyncio
+import importlib
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.pubsub import (
+    PubSubBroker,
+    publish_after_commit,
+    pubsub,
+    question_channel,
+    user_channel,
+)
+from backend.app.db.base import Base
+from backend.app.models.follow import Follow
+from backend.app.models.pubsub_message import PubSubMessage
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.notification_repo import add_follower_notifications
+from backend.app.repositories.question_repo import create_question
+
+
+def _message(channel: str, n: int) -> dict:
+    return {"channel": channel, "event": "tick", "data": {"n": n}}
+
+
+def _drain(subscription) -> list[dict]:
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(subscription.queue.get_nowait())
+    return messages
+
+
+def test_broker_fans_out_across_threads_and_resyncs_slow_subscribers() -> None:
+    broker = PubSubBroker(max_queue=3)
+
+    async def _scenario():
+        fast = broker.subscribe(["a", "b"])
+        slow = broker.subscribe(["a"])
+        other = broker.subscribe(["c"])
+
+        publisher = threading.Thread(
+            target=broker.publish,
+            args=([_message("a", n) for n in range(5)] + [_message("b", 9)],),
+        )
+        publisher.start()
+        publisher.join()
+        await asyncio.sleep(0)
+
+        assert (await fast.get(1))["event"] == "resync"
+        assert _drain(fast) == [_message("a", 4), _message("b", 9)]
+        assert [m["event"] for m in _drain(slow)] == ["resync", "tick"]
+        assert await other.get(0.01) is None
+        assert broker.stats()["dropped"] == 8
+
+        for subscription in (fast, slow, other):
+            broker.unsubscribe(subscription)
+        assert broker.stats()["channels"] == 0
+
+    asyncio.run(_scenario())
+
+
+def test_messages_are_published_only_after_commit() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    author = uuid.uuid4()
+    question_id = create_question(
+        session,
+        author_id=author,
+        title="Live question title",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    ).id
+    followers = [uuid.uuid4(), uuid.uuid4()]
+    session.execute(
+        insert(Follow), [{"user_id": u, "question_id": question_id} for u in followers]
+    )
+    session.commit()
+
+    async def _scenario():
+        live = pubsub.subscribe([question_channel(question_id)])
+        inbox = pubsub.subscribe([user_channel(followers[0])])
+        try:
+            session.execute(select(Follow.id))
+            publish_after_commit(session, question_channel(question_id), "x", {})
+            session.rollback()
+
+            answer = create_answer(
+                session,
+                question_id=question_id,
+                author_id=uuid.uuid4(),
+                body="This is a helpful answer that explains the solution clearly.",
+            )
+            add_follower_notifications(
+                session,
+                question_id=question_id,
+                type="followed_question_answer",
+                payload={"answer_id": str(answer.id)},
+            )
+            await asyncio.sleep(0)
+            assert _drain(inbox) == []
+
+            session.commit()
+            await asyncio.sleep(0)
+            assert _drain(live) == [
+                {
+                    "channel": question_channel(question_id),
+                    "event": "answer",
+                    "data": {
+                        "question_id": str(question_id),
+                        "answer_id": str(answer.id),
+                    },
+                }
+            ]
+            (message,) = _drain(inbox)
+            assert message["event"] == "notification"
+            assert message["data"]["user_id"] == str(followers[0])
+            assert uuid.UUID(message["data"]["id"])
+            assert message["data"]["payload"] == {"answer_id": str(answer.id)}
+        finally:
+            pubsub.unsubscribe(live)
+            pubsub.unsubscribe(inbox)
+
+    asyncio.run(_scenario())
+
+
+def test_database_relay_shares_messages_between_brokers(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'relay.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    first = PubSubBroker(max_queue=10, relay="database")
+    second = PubSubBroker(max_queue=10, relay="database")
+    first._session_factory = factory
+    second._session_factory = factory
+
+    async def _scenario():
+        local = first.subscribe(["q"])
+        remote = second.subscribe(["q"])
+        first.publish([_message("q", 1)])
+        assert first.poll() == 0
+        assert second.poll() == 1
+        assert second.poll() == 0
+        await asyncio.sleep(0)
+        assert _drain(local) == [_message("q", 1)]
+        assert _drain(remote) == [_message("q", 1)]
+
+    asyncio.run(_scenario())
+    first.retention_seconds = -1
+    assert first.prune() == 1
+
+
+def test_database_relay_delivers_batches_committed_out_of_id_order(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'relay.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+    broker = PubSubBroker(max_queue=10, relay="database", lookback_seconds=60)
+    broker._session_factory = factory
+
+    def _commit(row_id: int, n: int, *, age_seconds: float = 0) -> None:
+        with factory() as session:
+            session.execute(
+                insert(PubSubMessage).values(
+                    id=row_id,
+                    origin="other",
+                    messages=[_message("q", n)],
+                    created_at=datetime.now(tz=timezone.utc)
+                    - timedelta(seconds=age_seconds),
+                )
+            )
+            session.commit()
+
+    async def _scenario():
+        subscription = broker.subscribe(["q"])
+        _commit(2, 2)
+        assert broker.poll() == 1
+        # Id 1 was allocated first but its transaction committed later.
+        _commit(1, 1)
+        assert broker.poll() == 1
+        assert broker.poll() == 0
+        _commit(3, 3)
+        assert broker.poll() == 1
+        await asyncio.sleep(0)
+        assert [m["data"]["n"] for m in _drain(subscription)] == [2, 1, 3]
+
+        broker.lookback_seconds = 0
+        assert broker.poll() == 0
+        assert broker._seen == {}
+        assert broker.poll() == 0
+
+    asyncio.run(_scenario())
+
+
+def test_event_stream_sends_heartbeats_and_events_then_unsubscribes() -> None:
+    events_module = importlib.import_module("backend.app.api.events")
+
+    class _Request:
+        disconnected = False
+
+        async def is_disconnected(self) -> bool:
+            return self.disconnected
+
+    async def _scenario():
+        request = _Request()
+        subscription = pubsub.subscribe(["stream-test"])
+        closed = []
+        stream = events_module.event_stream(
+            request, subscription, 0.01, on_close=lambda: closed.append(True)
+        )
+        assert (await anext(stream)).startswith("retry:")
+        assert await anext(stream) == ": keep-alive\n\n"
+        pubsub.publish([_message("stream-test", 7)])
+        assert await anext(stream) == 'event: tick\ndata: {"n": 7}\n\n'
+        request.disconnected = True
+        try:
+            await anext(stream)
+        except StopAsyncIteration:
+            pass
+        assert "stream-test" not in pubsub._subscribers
+        assert closed == [True]
+
+    asyncio.run(_scenario())
+
+
+def test_event_endpoints_check_ticket_and_question() -> None:
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    os.environ["JWT_SECRET"] = "test-secret"
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+    Base.metadata.create_all(bind=session_module.engine)
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+    deps_module = importlib.import_module("backend.app.core.deps")
+    client = TestClient(main_module.app)
+
+    assert client.get("/events").status_code == 401
+    assert client.get("/events", params={"ticket": "junk"}).status_code == 401
+    response = client.get(f"/questions/{uuid.uuid4()}/events")
+    assert response.status_code == 404
+
+    assert client.post("/events/ticket").status_code == 401
+    registered = client.post(
+        "/auth/register",
+        json={
+            "email": "stream@example.com",
+            "password": "password123",
+            "full_name": "Stream User",
+        },
+    )
+    access_token = registered.json()["access_token"]
+    issued = client.post(
+        "/events/ticket", headers={"Authorization": f"Bearer {access_token}"}
+    )
+    assert issued.status_code == 200
+    ticket = issued.json()["ticket"]
+    assert issued.json()["expires_in"] == 60
+
+    user_id = deps_module.token_subject(access_token)
+    assert deps_module.stream_ticket_subject(ticket) == user_id
+    # Neither token stands in for the other.
+    with pytest.raises(ValueError):
+        deps_module.token_subject(ticket)
+    with pytest.raises(ValueError):
+        deps_module.stream_ticket_subject(access_token)
+    assert client.get("/events", params={"ticket": access_token}).status_code == 401
+    assert (
+        client.get("/events", params={"access_token": access_token}).status_code == 401
+    )
+    assert (
+        client.post(
+            "/events/ticket", headers={"Authorization": f"Bearer {ticket}"}
+        ).status_code
+        == 401
+    )
+
+    expired = jwt.encode(
+        {
+            "sub": str(user_id),
+            "exp": datetime.now(tz=timezone.utc) - timedelta(seconds=1),
+            "purpose": "events",
+        },
+        "test-secret",
+        algorithm="HS256",
+    )
+    assert client.get("/events", params={"ticket": expired}).status_code == 401
+
+
+def test_public_question_streams_are_capped_per_question_and_client(
+    monkeypatch,
+) -> None:
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+    Base.metadata.create_all(bind=session_module.engine)
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+    events_module = importlib.import_module("backend.app.api.events")
+    monkeypatch.setattr(events_module.settings, "sse_max_streams_per_question", 3)
+    monkeypatch.setattr(events_module.settings, "sse_max_streams_per_client", 2)
+    limiter = events_module.stream_limiter
+    client = TestClient(main_module.app)
+
+    with session_module.SessionLocal() as session:
+        question_id = create_question(
+            session,
+            author_id=uuid.uuid4(),
+            title="Capped stream question",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+        ).id
+        session.commit()
+    question_key = f"question:{question_id}"
+
+    # Other clients already hold every slot for this question.
+    for _ in range(3):
+        assert limiter.acquire({question_key: 3})
+    response = client.get(f"/questions/{question_id}/events")
+    assert response.status_code == 429
+    assert response.json()["detail"] == "too many open streams"
+    limiter.release([question_key] * 3)
+    assert limiter._open == {}
+
+    # This client already holds its share of streams elsewhere.
+    assert limiter.acquire({"client:testclient": 2})
+    assert limiter.acquire({"client:testclient": 2})
+    assert client.get(f"/questions/{question_id}/events").status_code == 429
+    # The refused request did not take a slot for the question.
+    assert limiter._open == {"client:testclient": 2}
+    limiter.release(["client:testclient", "client:testclient"])
+    assert limiter._open == {}
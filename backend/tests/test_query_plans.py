@@ -0,0 +1,242 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.migrations import create_missing_indexes
+from backend.app.repositories.answer_repo import (
+    count_answers_for_questions,
+    list_answers_by_author,
+    list_answers_for_question,
+)
+from backend.app.repositories.flag_repo import get_flag, list_flags
+from backend.app.repositories.follow_repo import (
+    get_follow,
+    list_followed_questions,
+    list_followers,
+)
+from backend.app.repositories.notification_repo import (
+    coalesce_notification,
+    get_unread_count,
+    list_notifications,
+    mark_all_read,
+    mark_notification_read,
+)
+from backend.app.repositories.outbox_repo import claim_outbox_events
+from backend.app.repositories.question_repo import (
+    encode_cursor,
+    list_questions,
+    list_questions_by_author,
+)
+from backend.app.repositories.question_similarity_repo import (
+    list_similarity_candidates,
+    refresh_question_similarity,
+)
+from backend.app.repositories.question_tag_repo import list_tags_for_question
+from backend.app.repositories.question_view_repo import (
+    count_views_for_questions,
+    has_view_for_question,
+    record_views,
+)
+from backend.app.repositories.related_question_repo import (
+    list_related_questions,
+    list_related_questions_by_tags,
+)
+from backend.app.repositories.vote_repo import get_vote, get_vote_score, get_vote_scores
+from backend.app.services.password_reset_service import verify_reset_token
+
+USER_ID = uuid.uuid4()
+QUESTION_ID = uuid.uuid4()
+TARGET_ID = uuid.uuid4()
+NOTIFICATION_CURSOR = encode_cursor(
+    SimpleNamespace(created_at=datetime(2024, 1, 1), id=uuid.uuid4())
+)
+
+HOT_QUERIES = {
+    "list_answers_for_question": lambda s: list_answers_for_question(
+        s, question_id=QUESTION_ID
+    ),
+    "list_answers_by_author": lambda s: list_answers_by_author(s, author_id=USER_ID),
+    "count_answers_for_questions": lambda s: count_answers_for_questions(
+        s, question_ids=[QUESTION_ID, TARGET_ID]
+    ),
+    "get_vote": lambda s: get_vote(
+        s, user_id=USER_ID, target_type="answer", target_id=TARGET_ID
+    ),
+    "get_vote_score": lambda s: get_vote_score(
+        s, target_type="question", target_id=TARGET_ID
+    ),
+    "get_vote_scores": lambda s: get_vote_scores(
+        s, target_type="answer", target_ids=[TARGET_ID, QUESTION_ID]
+    ),
+    "has_view_for_viewer": lambda s: has_view_for_question(
+        s, question_id=QUESTION_ID, viewer_id=USER_ID
+    ),
+    "has_view_for_session": lambda s: has_view_for_question(
+        s, question_id=QUESTION_ID, viewer_session="session-1"
+    ),
+    "record_views": lambda s: record_views(
+        s, views=[(QUESTION_ID, USER_ID, None), (QUESTION_ID, None, "session-1")]
+    ),
+    "count_views_for_questions": lambda s: count_views_for_questions(
+        s, question_ids=[QUESTION_ID]
+    ),
+    "list_notifications": lambda s: list_notifications(s, user_id=USER_ID),
+    "list_unread_notifications": lambda s: list_notifications(
+        s, user_id=USER_ID, unread_only=True
+    ),
+    "mark_all_read": lambda s: mark_all_read(s, user_id=USER_ID),
+    "mark_notification_read": lambda s: mark_notification_read(
+        s, user_id=USER_ID, notification_id=TARGET_ID
+    ),
+    "list_notifications_page": lambda s: list_notifications(
+        s, user_id=USER_ID, limit=20, cursor=NOTIFICATION_CURSOR
+    ),
+    "get_unread_count": lambda s: get_unread_count(s, user_id=USER_ID),
+    "coalesce_notification": lambda s: coalesce_notification(
+        s,
+        user_id=USER_ID,
+        type="vote_received",
+        group_key="vote_received:answer:1",
+        actor_id=USER_ID,
+        payload={},
+        window_seconds=3600,
+        max_actors=3,
+    ),
+    "claim_outbox_events": lambda s: claim_outbox_events(
+        s, limit=100, lease_seconds=60
+    ),
+    "get_follow": lambda s: get_follow(s, user_id=USER_ID, question_id=QUESTION_ID),
+    "list_followers": lambda s: list_followers(s, question_id=QUESTION_ID),
+    "list_followed_questions": lambda s: list_followed_questions(s, user_id=USER_ID),
+    "get_flag": lambda s: get_flag(
+        s, user_id=USER_ID, target_type="question", target_id=TARGET_ID
+    ),
+    "list_flags_for_target": lambda s: list_flags(
+        s, target_type="question", target_id=TARGET_ID
+    ),
+    "verify_reset_token": lambda s: verify_reset_token(s, token="token"),
+    "list_questions": lambda s: list_questions(s, limit=20),
+    "list_questions_by_tag": lambda s: list_questions(s, limit=20, tag="python"),
+    "list_questions_by_author": lambda s: list_questions_by_author(
+        s, author_id=USER_ID
+    ),
+    "list_tags_for_question": lambda s: list_tags_for_question(
+        s, question_id=QUESTION_ID
+    ),
+    "list_related_questions": lambda s: list_related_questions(
+        s, question_id=QUESTION_ID
+    ),
+    "list_related_questions_by_tags": lambda s: list_related_questions_by_tags(
+        s, question_id=QUESTION_ID
+    ),
+    "refresh_question_similarity": lambda s: refresh_question_similarity(
+        s, question_id=QUESTION_ID
+    ),
+    "similarity_candidates": lambda s: list_similarity_candidates(
+        s, question_id=QUESTION_ID, tags={TARGET_ID}, per_tag=200
+    ),
+}
+
+HOT_TABLES = {
+    "answers",
+    "votes",
+    "question_views",
+    "notifications",
+    "follows",
+    "flags",
+    "password_reset_tokens",
+    "questions",
+    "question_tags",
+    "related_questions",
+    "question_similarity",
+    "notification_counters",
+    "outbox_events",
+}
+
+
+def _make_engine():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _capture_plans(engine, fn) -> list[tuple[str, list[str]]]:
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    Session = sessionmaker(bind=engine)
+    try:
+        with Session() as session:
+            fn(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    plans = []
+    with engine.connect() as conn:
+        raw = conn.connection.dbapi_connection
+        for statement, parameters in statements:
+            rows = raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            plans.append((statement, [row[-1] for row in rows]))
+    return plans
+
+
+def _full_scans(details: list[str]) -> list[str]:
+    scans = []
+    for detail in details:
+        parts = detail.split()
+        if len(parts) < 2 or parts[0] != "SCAN":
+            continue
+        if parts[1] in HOT_TABLES and "USING" not in detail:
+            scans.append(detail)
+    return scans
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(name: str) -> None:
+    engine = _make_engine()
+    plans = _capture_plans(engine, HOT_QUERIES[name])
+
+    assert plans, f"{name} emitted no statements"
+    for statement, details in plans:
+        assert not _full_scans(details), f"{name}: {details}\n{statement}"
+
+
+def test_create_missing_indexes_backfills_existing_tables() -> None:
+    engine = _make_engine()
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_votes_target")
+        conn.exec_driver_sql("DROP INDEX ix_answers_question_id_created_at")
+
+    created = create_missing_indexes(engine)
+
+    assert set(created) == {"ix_votes_target", "ix_answers_question_id_created_at"}
+    assert create_missing_indexes(engine) == []
+
+
+def test_plan_checker_flags_full_scans() -> None:
+    engine = _make_engine()
+    plans = _capture_plans(
+        engine,
+        lambda s: s.execute(
+            Base.metadata.tables["votes"]
+            .select()
+            .where(Base.metadata.tables["votes"].c.value == 1)
+        ).all(),
+    )
+    assert _full_scans(plans[0][1])
+
+
+def test_verify_reset_token_plan_with_expiry() -> None:
+    engine = _make_engine()
+    now = datetime.now(tz=timezone.utc)
+    plans = _capture_plans(engine, lambda s: verify_reset_token(s, token=str(now)))
+    assert all(not _full_scans(details) for _, details in plans)
@@ -0,0 +1,129 @@
+import uuid
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.models.user import User
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.question_view_repo import create_view
+from backend.app.repositories.vote_repo import upsert_vote
+from backend.app.services.question_service import build_question_outs
+
+
+def _make_session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)()
+
+
+def _seed_questions(session, count: int) -> list:
+    author = User(
+        email=f"{uuid.uuid4()}@example.com",
+        full_name="Author Name",
+        password_hash="x",
+        role="student",
+    )
+    session.add(author)
+    session.commit()
+
+    questions = []
+    for idx in range(count):
+        question = create_question(
+            session,
+            author_id=author.id,
+            title=f"Question number {idx} title",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+        )
+        create_answer(
+            session,
+            question_id=question.id,
+            author_id=uuid.uuid4(),
+            body="This is a helpful answer that explains the solution clearly.",
+        )
+        create_view(session, question_id=question.id, viewer_session="s1")
+        create_view(session, question_id=question.id, viewer_session="s2")
+        upsert_vote(
+            session,
+            user_id=uuid.uuid4(),
+            target_type="question",
+            target_id=question.id,
+            value=1,
+        )
+        questions.append(question)
+    return questions
+
+
+def _count_statements(engine, fn) -> int:
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return len(statements)
+
+
+def test_build_question_outs_loads_aggregates() -> None:
+    _, session = _make_session()
+    questions = _seed_questions(session, 2)
+
+    outs = build_question_outs(session, questions)
+
+    assert [o.id for o in outs] == [q.id for q in questions]
+    for out in outs:
+        assert out.author_name == "Author Name"
+        assert out.answers_count == 1
+        assert out.views_count == 2
+        assert out.vote_score == 1
+
+
+def test_build_question_outs_query_count_is_constant() -> None:
+    engine, session = _make_session()
+    small = _seed_questions(session, 2)
+    large = _seed_questions(session, 12)
+    session.expire_all()
+    small = [session.get(type(q), q.id) for q in small]
+    large = [session.get(type(q), q.id) for q in large]
+
+    small_count = _count_statements(
+        engine, lambda: build_question_outs(session, small)
+    )
+    large_count = _count_statements(
+        engine, lambda: build_question_outs(session, large)
+    )
+
+    assert small_count == large_count
+
+
+def test_build_question_outs_uses_known_author_names() -> None:
+    engine, session = _make_session()
+    questions = _seed_questions(session, 1)
+    session.expire_all()
+    question = session.get(type(questions[0]), questions[0].id)
+
+    known = {question.author_id: "Cached Name"}
+    with_known = _count_statements(
+        engine,
+        lambda: build_question_outs(session, [question], author_map=known),
+    )
+    without_known = _count_statements(
+        engine, lambda: build_question_outs(session, [question])
+    )
+
+    assert with_known == without_known - 1
+    assert build_question_outs(session, [question], author_map=known)[
+        0
+    ].author_name == "Cached Name"
+
+
+def test_build_question_outs_empty() -> None:
+    _, session = _make_session()
+    assert build_question_outs(session, []) == []
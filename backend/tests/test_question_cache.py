@@ -0,0 +1,306 @@
+import importlib
+import os
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+
+from backend.app.core.question_cache import QuestionDetailCache, question_cache
+from backend.app.core.view_buffer import view_buffer
+from backend.app.db.base import Base
+from backend.app.models.question import Question
+from backend.app.repositories.admin_content_repo import (
+    delete_question,
+    update_answer_content,
+    update_question_content,
+)
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.question_tag_repo import attach_tags
+from backend.app.repositories.related_question_repo import add_related_questions
+from backend.app.repositories.tag_repo import create_tag
+from backend.app.repositories.user_repo import get_user_by_email
+from backend.app.repositories.vote_repo import upsert_vote
+from backend.app.services.answer_service import accept_answer
+
+
+def setup_app_with_sqlite():
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    os.environ["JWT_SECRET"] = "test-secret"
+    os.environ["JWT_ALGORITHM"] = "HS256"
+    os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "60"
+
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+
+    questions_module = importlib.import_module("backend.app.api.questions")
+    importlib.reload(questions_module)
+
+    Base.metadata.create_all(bind=session_module.engine)
+
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+
+    question_cache.clear()
+    view_buffer.clear()
+    return TestClient(main_module.app), session_module
+
+
+def _question(session, title: str):
+    return create_question(
+        session,
+        author_id=uuid.uuid4(),
+        title=title,
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+
+
+class _StatementCounter:
+    def __init__(self, engine) -> None:
+        self.engine = engine
+        self.count = 0
+
+    def _record(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+def _auth_headers(client, email: str) -> dict:
+    registered = client.post(
+        "/auth/register",
+        json={"email": email, "password": "password123", "full_name": "Ops User"},
+    )
+    return {"Authorization": f"Bearer {registered.json()['access_token']}"}
+
+
+def _assert_refetched(client, session_module, question_id) -> dict:
+    before = question_cache.stats()["misses"]
+    response = client.get(f"/questions/{question_id}")
+    assert response.status_code == 200
+    assert question_cache.stats()["misses"] == before + 1
+    return response.json()
+
+
+def test_hot_question_is_served_after_a_stamp_check() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        question = _question(session, "Cached question title here")
+
+    before = question_cache.stats()
+    first = client.get(f"/questions/{question.id}")
+    assert first.status_code == 200
+
+    with _StatementCounter(session_module.engine) as counter:
+        second = client.get(f"/questions/{question.id}")
+    assert second.json() == first.json()
+    # Only the stamp check: the detail stamp and the question versions.
+    assert counter.count == 2
+
+    assert client.get("/health/cache").status_code == 401
+    member = _auth_headers(client, "member@example.com")
+    assert client.get("/health/cache", headers=member).status_code == 403
+    headers = _auth_headers(client, "ops@example.com")
+    with session_module.SessionLocal() as session:
+        get_user_by_email(session, "ops@example.com").role = "admin"
+        session.commit()
+    stats = client.get("/health/cache", headers=headers).json()["question_detail"]
+    assert stats["hits"] == before["hits"] + 1
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["size"] == 1
+
+
+def test_writes_invalidate_the_affected_question() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        question = _question(session, "Invalidated question title")
+        author_id = question.author_id
+    client.get(f"/questions/{question.id}")
+
+    with session_module.SessionLocal() as session:
+        answer = create_answer(
+            session, question_id=question.id, author_id=uuid.uuid4(), body="An answer"
+        )
+    data = _assert_refetched(client, session_module, question.id)
+    assert data["answers_count"] == 1
+
+    with session_module.SessionLocal() as session:
+        upsert_vote(
+            session,
+            user_id=uuid.uuid4(),
+            target_type="answer",
+            target_id=answer.id,
+            value=1,
+        )
+    data = _assert_refetched(client, session_module, question.id)
+    assert data["answers"][0]["vote_score"] == 1
+
+    with session_module.SessionLocal() as session:
+        accept_answer(
+            session,
+            question_id=question.id,
+            answer_id=answer.id,
+            acting_user_id=author_id,
+        )
+    data = _assert_refetched(client, session_module, question.id)
+    assert data["accepted_answer_id"] == str(answer.id)
+
+    with session_module.SessionLocal() as session:
+        tag = create_tag(session, name="python")
+        attach_tags(session, question_id=question.id, tag_ids=[tag.id])
+    data = _assert_refetched(client, session_module, question.id)
+    assert [t["name"] for t in data["tags"]] == ["python"]
+
+    with session_module.SessionLocal() as session:
+        update_answer_content(session, answer_id=answer.id, body="Edited answer")
+    data = _assert_refetched(client, session_module, question.id)
+    assert data["answers"][0]["body"] == "Edited answer"
+
+    with session_module.SessionLocal() as session:
+        update_question_content(
+            session,
+            question_id=question.id,
+            title="Renamed question title",
+            body=None,
+            category=None,
+            stage=None,
+        )
+    data = _assert_refetched(client, session_module, question.id)
+    assert data["title"] == "Renamed question title"
+
+    with session_module.SessionLocal() as session:
+        delete_question(session, question_id=question.id)
+    assert client.get(f"/questions/{question.id}").status_code == 404
+
+
+def test_changes_to_related_questions_invalidate_dependents() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        question_id = _question(session, "Question with related links").id
+        related_id = _question(session, "Linked related question").id
+        unrelated_id = _question(session, "Completely separate question").id
+    client.get(f"/questions/{question_id}")
+    client.get(f"/questions/{unrelated_id}")
+
+    with session_module.SessionLocal() as session:
+        add_related_questions(
+            session, question_id=question_id, related_question_ids=[related_id]
+        )
+    data = _assert_refetched(client, session_module, question_id)
+    assert [q["id"] for q in data["related_questions"]] == [str(related_id)]
+
+    with session_module.SessionLocal() as session:
+        create_answer(
+            session, question_id=related_id, author_id=uuid.uuid4(), body="Answer"
+        )
+    data = _assert_refetched(client, session_module, question_id)
+    assert data["related_questions"][0]["answers_count"] == 1
+
+    hits = question_cache.stats()["hits"]
+    client.get(f"/questions/{unrelated_id}")
+    assert question_cache.stats()["hits"] == hits + 1
+
+
+def test_view_flushes_refresh_cached_detail_without_bumping_versions() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        question = _question(session, "Question that gets viewed")
+
+    first = client.get(f"/questions/{question.id}")
+    with session_module.SessionLocal() as session:
+        first_version = session.get(Question, question.id).version
+    viewed = client.get(
+        f"/questions/{question.id}",
+        params={"track_view": True},
+        headers={"X-View-Session": "viewer-1"},
+    )
+    assert viewed.json()["views_count"] == 0
+    assert view_buffer.flush(session_module.SessionLocal) == 1
+
+    # The version stays put, but the cached entry no longer matches its
+    # stamps, so revalidation gets the new count instead of a 304.
+    with session_module.SessionLocal() as session:
+        assert session.get(Question, question.id).version == first_version
+    stale = question_cache.stats()["stale"]
+    refreshed = client.get(
+        f"/questions/{question.id}",
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.json()["views_count"] == 1
+    assert refreshed.headers["etag"] != first.headers["etag"]
+    assert question_cache.stats()["stale"] == stale + 1
+
+    with session_module.SessionLocal() as session:
+        update_question_content(
+            session,
+            question_id=question.id,
+            title="Question that gets viewed and edited",
+            body=None,
+            category=None,
+            stage=None,
+        )
+    edited = _assert_refetched(client, session_module, question.id)
+    assert edited["views_count"] == 1
+
+
+def test_cache_evicts_least_recently_used_and_skips_stale_puts() -> None:
+    cache = QuestionDetailCache(maxsize=2, ttl_seconds=60)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    def _put(question_id, payload, depends_on=(), version=None):
+        cache.put(
+            question_id,
+            payload,
+            depends_on=set(depends_on),
+            stamps=(0, {}),
+            version=cache.version() if version is None else version,
+        )
+
+    _put(first, "a")
+    _put(second, "b", {first})
+    assert cache.get(first) == ("a", (0, {}))
+    _put(third, "c")
+    assert cache.get(second) is None
+    assert cache.get(first)[0] == "a"
+
+    version = cache.version()
+    cache.invalidate([first])
+    _put(second, "stale", version=version)
+    assert cache.get(second) is None
+    assert cache.get(first) is None
+
+    cache.ttl_seconds = -1
+    _put(third, "expired")
+    assert cache.get(third) is None
+
+
+def test_entries_changed_by_another_process_are_rebuilt() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        question = _question(session, "Question edited elsewhere")
+    path = f"/questions/{question.id}"
+    first = client.get(path)
+    stale = question_cache.stats()["stale"]
+
+    # A commit from another worker: the row changes but this process's
+    # cache never sees an invalidation.
+    with session_module.engine.begin() as conn:
+        conn.execute(
+            update(Question)
+            .where(Question.id == question.id)
+            .values(title="Edited in another process", version=Question.version + 1)
+        )
+
+    second = client.get(path)
+    assert second.json()["title"] == "Edited in another process"
+    assert second.headers["etag"] != first.headers["etag"]
+    assert question_cache.stats()["stale"] == stale + 1
+    assert client.get(path).headers["etag"] == second.headers["etag"]
@@ -0,0 +1,182 @@
+import importlib
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.models.question import Question
+from backend.app.repositories.question_repo import (
+    create_question,
+    decode_cursor,
+    encode_cursor,
+    list_questions,
+)
+
+
+def setup_app_with_sqlite():
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    os.environ["JWT_SECRET"] = "test-secret"
+    os.environ["JWT_ALGORITHM"] = "HS256"
+    os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "60"
+
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+
+    questions_module = importlib.import_module("backend.app.api.questions")
+    importlib.reload(questions_module)
+
+    Base.metadata.create_all(bind=session_module.engine)
+
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+
+    return TestClient(main_module.app), session_module
+
+
+def _seed(session, count: int, *, same_timestamp: bool = False) -> list:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    questions = []
+    for idx in range(count):
+        created_at = base if same_timestamp else base + timedelta(minutes=idx)
+        questions.append(
+            Question(
+                author_id=uuid.uuid4(),
+                title=f"Question number {idx} title",
+                body="Question body is long enough for validation.",
+                category="Python" if idx % 2 == 0 else "React",
+                stage="Foundation",
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+    session.add_all(questions)
+    session.commit()
+    return questions
+
+
+def _walk(session, *, limit: int, **filters) -> list:
+    seen = []
+    cursor = None
+    while True:
+        page = list_questions(session, limit=limit, cursor=cursor, **filters)
+        seen.extend(q.id for q in page)
+        if len(page) < limit:
+            return seen
+        cursor = encode_cursor(page[-1])
+
+
+def test_cursor_walk_matches_offset_order() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    _seed(session, 11)
+
+    expected = [q.id for q in list_questions(session, limit=100)]
+    assert _walk(session, limit=3) == expected
+
+
+def test_cursor_breaks_timestamp_ties_by_id() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    questions = _seed(session, 7, same_timestamp=True)
+
+    walked = _walk(session, limit=2)
+    assert len(walked) == 7
+    assert set(walked) == {q.id for q in questions}
+
+
+def test_cursor_respects_filters_and_new_rows() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    _seed(session, 10)
+
+    first = list_questions(session, limit=2, category="Python")
+    cursor = encode_cursor(first[-1])
+    session.add(
+        Question(
+            author_id=uuid.uuid4(),
+            title="A brand new question title",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+            created_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+    session.commit()
+
+    rest = list_questions(session, limit=10, category="Python", cursor=cursor)
+    assert len(rest) == 3
+    assert all(q.category == "Python" for q in rest)
+    assert not {q.id for q in rest} & {q.id for q in first}
+
+
+def test_decode_cursor_rejects_garbage() -> None:
+    try:
+        decode_cursor("not-a-cursor")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
+
+
+def test_list_endpoint_returns_next_cursor_header() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        _seed(session, 5)
+
+    first = client.get("/questions", params={"limit": 3})
+    assert first.status_code == 200
+    assert len(first.json()) == 3
+    next_cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/questions", params={"limit": 3, "cursor": next_cursor})
+    assert second.status_code == 200
+    assert len(second.json()) == 2
+    assert "X-Next-Cursor" not in second.headers
+    ids = [q["id"] for q in first.json() + second.json()]
+    assert len(set(ids)) == 5
+
+    bad = client.get("/questions", params={"cursor": "garbage"})
+    assert bad.status_code == 400
+
+
+def test_search_pages_with_offset_and_reaches_every_match() -> None:
+    client, session_module = setup_app_with_sqlite()
+    with session_module.SessionLocal() as session:
+        for idx in range(8):
+            create_question(
+                session,
+                author_id=uuid.uuid4(),
+                title=f"Docker question {idx}",
+                body="docker " * (idx + 1) + "body that is long enough.",
+                category="Python",
+                stage="Foundation",
+            )
+
+    ranked = [q["id"] for q in client.get("/questions", params={"q": "docker"}).json()]
+    assert len(ranked) == 8
+
+    seen = []
+    for offset in range(0, 9, 3):
+        page = client.get(
+            "/questions", params={"q": "docker", "limit": 3, "offset": offset}
+        )
+        assert page.status_code == 200
+        assert "X-Next-Cursor" not in page.headers
+        seen.extend(q["id"] for q in page.json())
+    assert seen == ranked
+
+    cursor = encode_cursor(
+        SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid.uuid4())
+    )
+    with_cursor = client.get("/questions", params={"q": "docker", "cursor": cursor})
+    assert with_cursor.status_code == 400
+    assert with_cursor.json()["detail"] == "cursor is not supported with q"
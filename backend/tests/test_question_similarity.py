@@ -0,0 +1,181 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.migrations import upgrade_schema
+from backend.app.models.question import Question
+from backend.app.models.question_similarity import QuestionSimilarity
+from backend.app.models.question_tag import QuestionTag
+from backend.app.repositories.admin_content_repo import delete_question
+from backend.app.repositories.question_similarity_repo import (
+    rebuild_question_similarity,
+    refresh_question_similarity,
+)
+from backend.app.repositories.question_tag_repo import attach_tags
+from backend.app.repositories.related_question_repo import (
+    list_related_questions_by_tags,
+)
+from backend.app.repositories.tag_repo import create_tag
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _question(session, title: str) -> Question:
+    question = Question(
+        author_id=uuid.uuid4(),
+        title=title,
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+    session.add(question)
+    session.commit()
+    return question
+
+
+def _rows(session) -> set:
+    return {
+        (row.question_id, row.other_id, round(row.score, 6))
+        for row in session.scalars(select(QuestionSimilarity))
+    }
+
+
+def _seed(session):
+    python = create_tag(session, name="python")
+    django = create_tag(session, name="django")
+    orm = create_tag(session, name="orm")
+    react = create_tag(session, name="react")
+    questions = {
+        name: _question(session, f"{name} question title")
+        for name in ("target", "close", "loose", "other", "untagged")
+    }
+    attach_tags(
+        session,
+        question_id=questions["close"].id,
+        tag_ids=[python.id, django.id, orm.id],
+    )
+    attach_tags(session, question_id=questions["loose"].id, tag_ids=[python.id])
+    attach_tags(session, question_id=questions["other"].id, tag_ids=[react.id])
+    attach_tags(
+        session, question_id=questions["target"].id, tag_ids=[python.id, django.id]
+    )
+    return questions
+
+
+def test_attach_tags_orders_related_by_weighted_jaccard() -> None:
+    session = _session()
+    questions = _seed(session)
+
+    related = list_related_questions_by_tags(
+        session, question_id=questions["target"].id
+    )
+    assert [q.id for q in related] == [questions["close"].id, questions["loose"].id]
+
+    reverse = list_related_questions_by_tags(session, question_id=questions["loose"].id)
+    assert reverse[0].id in {questions["close"].id, questions["target"].id}
+    assert questions["other"].id not in {q.id for q in reverse}
+    assert (
+        list_related_questions_by_tags(session, question_id=questions["untagged"].id)
+        == []
+    )
+
+
+def test_incremental_updates_match_bulk_rebuild_ranking() -> None:
+    session = _session()
+    questions = _seed(session)
+
+    for name in ("target", "close", "loose"):
+        incremental = list_related_questions_by_tags(
+            session, question_id=questions[name].id
+        )
+        rebuild_question_similarity(session)
+        rebuilt = list_related_questions_by_tags(
+            session, question_id=questions[name].id
+        )
+        assert [q.id for q in incremental] == [q.id for q in rebuilt]
+
+
+def test_neighbour_lists_stay_bounded_to_top_k() -> None:
+    session = _session()
+    tag = create_tag(session, name="python")
+    hub = _question(session, "hub question title")
+    session.add(QuestionTag(question_id=hub.id, tag_id=tag.id))
+    session.commit()
+
+    for idx in range(4):
+        question = _question(session, f"spoke {idx} question title")
+        session.add(QuestionTag(question_id=question.id, tag_id=tag.id))
+        session.flush()
+        refresh_question_similarity(session, question_id=question.id, k=2)
+        session.commit()
+
+    counts = {}
+    for row in session.scalars(select(QuestionSimilarity)):
+        counts[row.question_id] = counts.get(row.question_id, 0) + 1
+    assert counts[hub.id] == 2
+    assert max(counts.values()) == 2
+
+
+def test_upgrade_swaps_the_tag_index_for_the_recency_index(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_question_tags_tag_created"))
+        conn.execute(
+            text("CREATE INDEX ix_question_tags_tag_id ON question_tags (tag_id)")
+        )
+
+    changes = upgrade_schema(engine)
+
+    assert "ix_question_tags_tag_created" in changes["indexes"]
+    assert changes["dropped_indexes"] == ["ix_question_tags_tag_id"]
+    indexes = {index["name"] for index in inspect(engine).get_indexes("question_tags")}
+    assert indexes == {"ix_question_tags_tag_created"}
+
+
+def test_refresh_scores_only_the_newest_questions_per_tag() -> None:
+    session = _session()
+    tag = create_tag(session, name="python")
+    older = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    spokes = []
+    for idx in range(4):
+        question = _question(session, f"spoke {idx} question title")
+        session.add(
+            QuestionTag(
+                question_id=question.id,
+                tag_id=tag.id,
+                created_at=older + timedelta(minutes=idx),
+            )
+        )
+        spokes.append(question)
+    session.commit()
+
+    question = _question(session, "new question title")
+    session.add(QuestionTag(question_id=question.id, tag_id=tag.id))
+    session.flush()
+    refresh_question_similarity(session, question_id=question.id, per_tag=2)
+    session.commit()
+
+    related = session.scalars(
+        select(QuestionSimilarity.other_id).where(
+            QuestionSimilarity.question_id == question.id
+        )
+    ).all()
+    assert set(related) == {spokes[2].id, spokes[3].id}
+
+
+def test_delete_question_removes_similarity_rows() -> None:
+    session = _session()
+    questions = _seed(session)
+
+    delete_question(session, question_id=questions["close"].id)
+
+    removed = questions["close"].id
+    assert all(removed not in (q, o) for q, o, _ in _rows(session))
@@ -0,0 +1,160 @@
+import uuid
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.search import (
+    LikeSearchBackend,
+    SqliteFtsBackend,
+    get_search_backend,
+    rebuild_search_index,
+)
+from backend.app.models.question import Question
+from backend.app.repositories.admin_content_repo import (
+    delete_answer,
+    delete_question,
+    update_question_content,
+)
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.question_repo import (
+    create_question,
+    list_questions,
+    search_snippets,
+)
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def _question(session, title: str, body: str) -> Question:
+    return create_question(
+        session,
+        author_id=uuid.uuid4(),
+        title=title,
+        body=body,
+        category="Python",
+        stage="Foundation",
+    )
+
+
+def _titles(session, q: str) -> list[str]:
+    return [question.title for question in list_questions(session, q=q)]
+
+
+def test_sqlite_uses_fts_backend() -> None:
+    session = _session()
+    assert isinstance(get_search_backend(session), SqliteFtsBackend)
+
+
+def test_search_ranks_title_matches_first_and_stems_terms() -> None:
+    session = _session()
+    _question(
+        session,
+        "Deploying a Flask app",
+        "Gunicorn keeps timing out when deployed with docker containers.",
+    )
+    _question(
+        session,
+        "Docker compose networking",
+        "Containers cannot reach each other on the default bridge network.",
+    )
+
+    assert _titles(session, "docker") == [
+        "Docker compose networking",
+        "Deploying a Flask app",
+    ]
+    assert _titles(session, "container") == [
+        "Docker compose networking",
+        "Deploying a Flask app",
+    ]
+    assert _titles(session, "docker flask") == ["Deploying a Flask app"]
+    assert _titles(session, "kubernetes") == []
+
+
+def test_search_covers_answers_and_tracks_edits_and_deletes() -> None:
+    session = _session()
+    question = _question(
+        session, "Virtualenv not activating", "The activate script does nothing."
+    )
+    answer = create_answer(
+        session,
+        question_id=question.id,
+        author_id=uuid.uuid4(),
+        body="Run it with source instead of executing it: use pyenv shims.",
+    )
+    assert _titles(session, "pyenv") == ["Virtualenv not activating"]
+
+    delete_answer(session, answer_id=answer.id)
+    assert _titles(session, "pyenv") == []
+
+    update_question_content(
+        session,
+        question_id=question.id,
+        title="Poetry shell not activating",
+        body=None,
+        category=None,
+        stage=None,
+    )
+    assert _titles(session, "poetry") == ["Poetry shell not activating"]
+    assert _titles(session, "virtualenv") == []
+
+    delete_question(session, question_id=question.id)
+    assert _titles(session, "poetry") == []
+
+
+def test_search_snippets_highlight_terms() -> None:
+    session = _session()
+    question = _question(
+        session,
+        "React state update",
+        "Why does useState not update immediately after an API call?",
+    )
+
+    snippets = search_snippets(session, q="usestate", question_ids=[question.id])
+    assert "<mark>useState</mark>" in snippets[question.id]
+
+
+def test_search_snippets_escape_question_text() -> None:
+    session = _session()
+    question = _question(
+        session,
+        "Script tag runs on page load",
+        'The preview runs <script>alert("x")</script> when the body is shown.',
+    )
+
+    snippet = search_snippets(session, q="preview", question_ids=[question.id])[
+        question.id
+    ]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt;" in snippet
+    assert "<mark>preview</mark>" in snippet
+
+
+def test_rebuild_indexes_rows_written_outside_the_repo() -> None:
+    session = _session()
+    session.add(
+        Question(
+            author_id=uuid.uuid4(),
+            title="Imported legacy question",
+            body="Seeded directly into the table without the search hook.",
+            category="Python",
+            stage="Foundation",
+        )
+    )
+    session.commit()
+    assert _titles(session, "legacy") == []
+
+    assert rebuild_search_index(session) == 1
+    assert _titles(session, "legacy") == ["Imported legacy question"]
+
+
+def test_like_backend_matches_substrings() -> None:
+    session = _session()
+    _question(session, "Pandas merge question", "How do I merge two dataframes?")
+
+    stmt = LikeSearchBackend().apply(select(Question), "ataframe")
+    assert [q.title for q in session.scalars(stmt)] == ["Pandas merge question"]
@@ -0,0 +1,61 @@
+import time
+import uuid
+from datetime import timedelta
+
+import pytest
+from jose import JWTError
+
+from backend.app.core import deps
+from backend.app.core.deps import TokenClaimCache, token_subject
+from backend.app.core.jwt import create_access_token
+
+
+def test_repeated_tokens_skip_verification(monkeypatch) -> None:
+    calls = []
+    decode = deps.decode_token
+
+    def _counting_decode(token: str) -> dict:
+        calls.append(token)
+        return decode(token)
+
+    monkeypatch.setattr(deps, "decode_token", _counting_decode)
+    monkeypatch.setattr(deps, "token_cache", TokenClaimCache(maxsize=10))
+    user_id = uuid.uuid4()
+    token = create_access_token(sub=str(user_id))
+
+    assert [token_subject(token) for _ in range(5)] == [user_id] * 5
+    assert len(calls) == 1
+    assert deps.token_cache.stats()["hit_ratio"] == 0.8
+
+    for bad in ("junk", token[:-2] + "xx"):
+        for _ in range(2):
+            with pytest.raises(JWTError):
+                token_subject(bad)
+    assert len(calls) == 5
+
+    expired = create_access_token(sub=str(user_id), expires_delta=timedelta(-1))
+    with pytest.raises(JWTError):
+        token_subject(expired)
+
+
+def test_entries_expire_exactly_and_are_bounded() -> None:
+    cache = TokenClaimCache(maxsize=2)
+    user_id = uuid.uuid4()
+    now = int(time.time())
+
+    cache.put(b"live", user_id, now + 60)
+    cache.put(b"stale", user_id, now - 1)
+    assert cache.get(b"stale") is None
+    assert cache.get(b"live") == user_id
+    assert cache.stats()["size"] == 1
+
+    cache.put(b"a", user_id, now + 60)
+    cache.put(b"b", user_id, now + 60)
+    assert cache.get(b"live") is None
+    assert cache.stats() | {"hit_ratio": None} == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 1,
+        "misses": 2,
+        "hit_ratio": None,
+    }
@@ -0,0 +1,112 @@
+import importlib
+import os
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from backend.app.core.user_cache import UserIdentity, UserIdentityCache, user_cache
+from backend.app.db.base import Base
+from backend.app.repositories.user_repo import get_user_by_email
+
+
+def setup_app_with_sqlite():
+    os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+    os.environ["JWT_SECRET"] = "test-secret"
+    os.environ["JWT_ALGORITHM"] = "HS256"
+    os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "60"
+
+    session_module = importlib.import_module("backend.app.db.session")
+    importlib.reload(session_module)
+
+    jwt_module = importlib.import_module("backend.app.core.jwt")
+    importlib.reload(jwt_module)
+
+    auth_module = importlib.import_module("backend.app.api.auth")
+    importlib.reload(auth_module)
+
+    Base.metadata.create_all(bind=session_module.engine)
+
+    main_module = importlib.import_module("backend.app.main")
+    importlib.reload(main_module)
+
+    return TestClient(main_module.app), session_module
+
+
+def _register_and_get_token(client: TestClient, email: str) -> str:
+    response = client.post(
+        "/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "full_name": "Test User",
+        },
+    )
+    return response.json()["access_token"]
+
+
+def _users_queries(engine, call) -> int:
+    statements = []
+
+    def _record(*args) -> None:
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return sum("FROM users" in statement for statement in statements)
+
+
+def test_authenticated_requests_reuse_cached_identity() -> None:
+    client, session_module = setup_app_with_sqlite()
+    admin_token = _register_and_get_token(client, "admin@example.com")
+    user_token = _register_and_get_token(client, "user@example.com")
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+    user_headers = {"Authorization": f"Bearer {user_token}"}
+    with session_module.SessionLocal() as session:
+        get_user_by_email(session, "admin@example.com").role = "admin"
+        user_id = get_user_by_email(session, "user@example.com").id
+        session.commit()
+
+    def _my_questions():
+        return client.get("/me/questions", headers=user_headers)
+
+    assert _users_queries(session_module.engine, _my_questions) == 1
+    assert _users_queries(session_module.engine, _my_questions) == 0
+    assert client.get("/admin/users", headers=user_headers).status_code == 403
+
+    response = client.patch(
+        f"/admin/users/{user_id}", headers=admin_headers, json={"role": "admin"}
+    )
+    assert response.status_code == 200
+    assert client.get("/admin/users", headers=user_headers).status_code == 200
+
+    response = client.delete(f"/admin/users/{user_id}", headers=admin_headers)
+    assert response.status_code == 200
+    assert client.get("/me/questions", headers=user_headers).status_code == 401
+
+
+def test_cache_expires_evicts_and_rejects_stale_puts() -> None:
+    cache = UserIdentityCache(maxsize=2, ttl_seconds=60)
+    first, second, third = (
+        UserIdentity(uuid.uuid4(), name, "student") for name in ("A", "B", "C")
+    )
+
+    cache.put([first, second], version=cache.version())
+    assert cache.get(first.id) == first
+    cache.put([third], version=cache.version())
+    assert cache.get(second.id) is None
+    assert cache.get(first.id) == first
+
+    version = cache.version()
+    cache.invalidate([first.id])
+    cache.put([first], version=version)
+    assert cache.get(first.id) is None
+
+    cache.ttl_seconds = -1
+    cache.put([second], version=cache.version())
+    assert cache.get(second.id) is None
+    assert cache.stats()["size"] == 1
+    assert user_cache.maxsize > 0
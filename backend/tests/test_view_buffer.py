@@ -0,0 +1,140 @@
+import time
+import uuid
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.core.view_buffer import ViewBuffer
+from backend.app.db.base import Base
+from backend.app.models.question import Question
+from backend.app.models.question_view import QuestionView
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.question_view_repo import create_view
+
+
+def _session_factory():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+
+def _buffer(**overrides) -> ViewBuffer:
+    options = {
+        "flush_interval_ms": 10,
+        "flush_size": 100,
+        "max_pending": 100,
+        "dedupe_size": 100,
+    }
+    options.update(overrides)
+    return ViewBuffer(**options)
+
+
+def _question(session) -> uuid.UUID:
+    return create_question(
+        session,
+        author_id=uuid.uuid4(),
+        title="Buffered view question",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    ).id
+
+
+def _views_count(factory, question_id) -> int:
+    with factory() as session:
+        return session.scalar(
+            select(Question.views_count).where(Question.id == question_id)
+        )
+
+
+def test_flush_writes_deduplicated_views_in_one_batch() -> None:
+    engine, factory = _session_factory()
+    with factory() as session:
+        first = _question(session)
+        second = _question(session)
+    viewer = uuid.uuid4()
+    buffer = _buffer()
+
+    assert buffer.record(first, viewer_session="s1")
+    assert not buffer.record(first, viewer_session="s1")
+    assert buffer.record(first, viewer_session="s2")
+    assert buffer.record(first, viewer_id=viewer, viewer_session="s1")
+    assert buffer.record(second, viewer_id=viewer)
+    assert buffer.record(uuid.uuid4(), viewer_session="s1")
+
+    inserts = []
+
+    def _record(conn, cursor, statement, *args) -> None:
+        if statement.startswith("INSERT INTO question_views"):
+            inserts.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    assert buffer.flush(factory) == 4
+    event.remove(engine, "before_cursor_execute", _record)
+
+    assert len(inserts) == 1
+    assert _views_count(factory, first) == 3
+    assert _views_count(factory, second) == 1
+    assert buffer.stats()["pending"] == 0
+    assert buffer.stats()["duplicates"] == 1
+
+
+def test_flush_skips_views_already_in_the_database() -> None:
+    _, factory = _session_factory()
+    with factory() as session:
+        question_id = _question(session)
+        create_view(session, question_id=question_id, viewer_session="old")
+
+    buffer = _buffer()
+    buffer.record(question_id, viewer_session="old")
+    buffer.record(question_id, viewer_session="new")
+    assert buffer.flush(factory) == 1
+
+    with factory() as session:
+        sessions = session.scalars(
+            select(QuestionView.viewer_session).where(
+                QuestionView.question_id == question_id
+            )
+        ).all()
+    assert sorted(sessions) == ["new", "old"]
+    assert _views_count(factory, question_id) == 2
+
+
+def test_full_buffer_drops_views_and_dedupe_window_is_bounded() -> None:
+    question_id = uuid.uuid4()
+    full = _buffer(max_pending=2)
+    assert full.record(question_id, viewer_session="a")
+    assert full.record(question_id, viewer_session="b")
+    assert not full.record(question_id, viewer_session="c")
+    assert full.stats()["dropped"] == 1
+
+    bounded = _buffer(dedupe_size=2)
+    for name in ("a", "b", "c"):
+        assert bounded.record(question_id, viewer_session=name)
+    assert not bounded.record(question_id, viewer_session="c")
+    assert bounded.record(question_id, viewer_session="a")
+
+
+def test_background_thread_flushes_and_stop_drains() -> None:
+    _, factory = _session_factory()
+    with factory() as session:
+        question_id = _question(session)
+
+    buffer = _buffer(flush_interval_ms=60_000, flush_size=2)
+    buffer.start(factory)
+    buffer.record(question_id, viewer_session="a")
+    buffer.record(question_id, viewer_session="b")
+    for _ in range(200):
+        if buffer.stats()["flushed"] == 2:
+            break
+        time.sleep(0.01)
+    assert buffer.stats()["flushed"] == 2
+
+    buffer.record(question_id, viewer_session="c")
+    buffer.stop()
+    assert _views_count(factory, question_id) == 3
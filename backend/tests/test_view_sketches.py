@@ -0,0 +1,121 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.hyperloglog import REGISTERS, STANDARD_ERROR, HyperLogLog
+from backend.app.models.question import Question
+from backend.app.models.question_view import QuestionView
+from backend.app.repositories.counter_repo import reconcile_counters
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.question_view_repo import (
+    backfill_view_sketches,
+    create_view,
+    prune_question_views,
+    record_views,
+)
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
+def _question(session) -> uuid.UUID:
+    return create_question(
+        session,
+        author_id=uuid.uuid4(),
+        title="Sketched view question",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    ).id
+
+
+def _views_count(session, question_id) -> int:
+    return session.scalar(
+        select(Question.views_count).where(Question.id == question_id)
+    )
+
+
+def test_sketch_is_exact_for_small_counts_and_bounded_for_large() -> None:
+    sketch = HyperLogLog()
+    for idx in range(20):
+        sketch.add(f"viewer-{idx}")
+        sketch.add(f"viewer-{idx}")
+    assert sketch.estimate() == 20
+
+    for idx in range(20, 50_000):
+        sketch.add(f"viewer-{idx}")
+    assert abs(sketch.estimate() / 50_000 - 1) < 3 * STANDARD_ERROR
+
+
+def test_sketch_round_trips_sparse_and_dense_and_merges() -> None:
+    small = HyperLogLog()
+    for idx in range(10):
+        small.add(f"a-{idx}")
+    blob = small.to_bytes()
+    assert len(blob) == 2 + 3 * 10
+    assert HyperLogLog.from_bytes(blob).registers == small.registers
+
+    large = HyperLogLog()
+    for idx in range(5000):
+        large.add(f"b-{idx}")
+    blob = large.to_bytes()
+    assert len(blob) == 2 + REGISTERS
+    assert HyperLogLog.from_bytes(blob).registers == large.registers
+
+    large.merge(small)
+    assert large.estimate() >= 5000
+    assert HyperLogLog.from_bytes(None).estimate() == 0
+    with pytest.raises(ValueError):
+        HyperLogLog.from_bytes(b"\x05\x00")
+    with pytest.raises(ValueError):
+        HyperLogLog.from_bytes(blob[:-1])
+
+
+def test_record_views_counts_distinct_viewers_without_rows() -> None:
+    session = _session()
+    question_id = _question(session)
+    viewer = uuid.uuid4()
+    views = [
+        (question_id, viewer, None),
+        (question_id, viewer, "s1"),
+        (question_id, None, "s1"),
+        (question_id, None, None),
+        (uuid.uuid4(), None, "s2"),
+    ]
+
+    assert record_views(session, views=views, store_rows=False) == 2
+    assert record_views(session, views=views, store_rows=False) == 0
+    assert _views_count(session, question_id) == 2
+    assert session.scalar(select(func.count()).select_from(QuestionView)) == 0
+
+
+def test_backfill_is_idempotent_and_survives_pruning() -> None:
+    session = _session()
+    question_id = _question(session)
+    for name in ("s1", "s2", "s3"):
+        create_view(session, question_id=question_id, viewer_session=name)
+    session.execute(
+        update(Question)
+        .where(Question.id == question_id)
+        .values(viewers_sketch=None, views_count=0)
+    )
+    session.commit()
+
+    assert backfill_view_sketches(session) == 1
+    assert _views_count(session, question_id) == 3
+
+    future = datetime.now(tz=timezone.utc) + timedelta(days=1)
+    assert prune_question_views(session, before=future) == 3
+    backfill_view_sketches(session)
+    assert _views_count(session, question_id) == 3
+
+    create_view(session, question_id=question_id, viewer_session="s1")
+    assert _views_count(session, question_id) == 3
+    assert reconcile_counters(session, apply=False)["questions"] == []
@@ -0,0 +1,178 @@
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event, func, inspect, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.migrations import upgrade_schema
+from backend.app.models.flag import Flag
+from backend.app.models.question import Question
+from backend.app.models.vote import Vote
+from backend.app.repositories.flag_repo import create_flag
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.vote_repo import upsert_vote
+
+THREADS = 8
+ROUNDS = 25
+
+
+def _file_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'stress.db'}",
+        connect_args={"timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _question_id(factory) -> uuid.UUID:
+    with factory() as session:
+        return create_question(
+            session,
+            author_id=uuid.uuid4(),
+            title="Contended question title",
+            body="Question body is long enough for validation.",
+            category="Python",
+            stage="Foundation",
+        ).id
+
+
+def _run_threads(target) -> None:
+    barrier = threading.Barrier(THREADS)
+    errors = []
+
+    def _worker(idx: int) -> None:
+        try:
+            barrier.wait()
+            target(idx)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_worker, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_concurrent_votes_never_duplicate_or_drift(tmp_path) -> None:
+    factory = sessionmaker(bind=_file_engine(tmp_path))
+    question_id = _question_id(factory)
+    voter = uuid.uuid4()
+
+    def _vote(idx: int) -> None:
+        for round_ in range(ROUNDS):
+            with factory() as session:
+                upsert_vote(
+                    session,
+                    user_id=voter,
+                    target_type="question",
+                    target_id=question_id,
+                    value=1 if (idx + round_) % 2 else -1,
+                )
+
+    _run_threads(_vote)
+
+    with factory() as session:
+        votes = session.scalars(select(Vote)).all()
+        assert len(votes) == 1
+        question = session.get(Question, question_id)
+        assert question.vote_score == votes[0].value
+
+
+def test_concurrent_flags_insert_once(tmp_path) -> None:
+    factory = sessionmaker(bind=_file_engine(tmp_path))
+    target_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    created = []
+
+    def _flag(idx: int) -> None:
+        with factory() as session:
+            flag = create_flag(
+                session,
+                user_id=user_id,
+                target_type="answer",
+                target_id=target_id,
+                reason=f"Spam {idx}",
+            )
+            if flag is not None:
+                created.append(flag.id)
+
+    _run_threads(_flag)
+
+    assert len(created) == 1
+    with factory() as session:
+        assert session.scalar(select(func.count()).select_from(Flag)) == 1
+
+
+def test_revote_is_a_single_statement_on_votes(tmp_path) -> None:
+    engine = _file_engine(tmp_path)
+    factory = sessionmaker(bind=engine)
+    question_id = _question_id(factory)
+    voter = uuid.uuid4()
+    with factory() as session:
+        upsert_vote(
+            session,
+            user_id=voter,
+            target_type="question",
+            target_id=question_id,
+            value=1,
+        )
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with factory() as session:
+        vote = upsert_vote(
+            session,
+            user_id=voter,
+            target_type="question",
+            target_id=question_id,
+            value=-1,
+        )
+        assert vote.value == -1
+    vote_statements = [s for s in statements if " votes" in s]
+    assert len(vote_statements) == 1
+    assert "ON CONFLICT" in vote_statements[0]
+    assert "RETURNING" in vote_statements[0]
+
+
+def test_upgrade_removes_duplicates_before_adding_unique_index(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    voter, target = uuid.uuid4(), uuid.uuid4()
+    older = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_votes_user_target"))
+        conn.execute(
+            text(
+                "CREATE INDEX ix_votes_user_target "
+                "ON votes (user_id, target_type, target_id)"
+            )
+        )
+        conn.execute(
+            insert(Vote),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": voter,
+                    "target_type": "answer",
+                    "target_id": target,
+                    "value": value,
+                    "created_at": created_at,
+                }
+                for value, created_at in ((1, older), (-1, older + timedelta(hours=1)))
+            ],
+        )
+
+    changes = upgrade_schema(engine)
+
+    assert changes["duplicates"] == {"votes": 1}
+    assert "uq_votes_user_target" in changes["indexes"]
+    assert changes["dropped_indexes"] == ["ix_votes_user_target"]
+    with engine.connect() as conn:
+        assert conn.execute(select(Vote.value)).scalars().all() == [-1]
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes("votes")}
+    assert indexes["uq_votes_user_target"]["unique"]
@@ -0,0 +1,169 @@
+import uuid
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.db.base import Base
+from backend.app.db.migrations import COUNTER_COLUMNS, upgrade_schema
+from backend.app.repositories.admin_content_repo import (
+    delete_answer,
+    delete_user_content,
+)
+from backend.app.repositories.answer_repo import create_answer
+from backend.app.repositories.counter_repo import reconcile_counters
+from backend.app.repositories.question_repo import create_question
+from backend.app.repositories.vote_repo import (
+    get_vote_score,
+    get_vote_scores,
+    get_vote_totals,
+    upsert_vote,
+)
+
+
+def _make_session():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine)()
+
+
+def _question(session):
+    return create_question(
+        session,
+        author_id=uuid.uuid4(),
+        title="Question title",
+        body="Question body is long enough for validation.",
+        category="Python",
+        stage="Foundation",
+    )
+
+
+def _answer(session, question_id):
+    return create_answer(
+        session,
+        question_id=question_id,
+        author_id=uuid.uuid4(),
+        body="This is a helpful answer that explains the solution clearly.",
+    )
+
+
+def _vote(session, user_id, target_type, target_id, value) -> None:
+    upsert_vote(
+        session,
+        user_id=user_id,
+        target_type=target_type,
+        target_id=target_id,
+        value=value,
+    )
+
+
+def test_upsert_vote_applies_deltas_to_the_score_columns() -> None:
+    _, session = _make_session()
+    question = _question(session)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    _vote(session, first, "question", question.id, 1)
+    _vote(session, second, "question", question.id, 1)
+    _vote(session, third, "question", question.id, -1)
+    _vote(session, first, "question", question.id, -1)
+    _vote(session, first, "question", question.id, -1)
+
+    assert get_vote_score(session, target_type="question", target_id=question.id) == -1
+    assert get_vote_score(session, target_type="question", target_id=uuid.uuid4()) == 0
+    session.refresh(question)
+    assert question.vote_score == -1
+
+
+def test_bulk_scores_are_one_lookup_and_match_reconcile() -> None:
+    engine, session = _make_session()
+    question = _question(session)
+    answers = [_answer(session, question.id) for _ in range(50)]
+    voters = [uuid.uuid4() for _ in range(3)]
+    for idx, answer in enumerate(answers):
+        for offset, voter in enumerate(voters):
+            if (idx + offset) % 3:
+                _vote(session, voter, "answer", answer.id, 1 if idx % 2 else -1)
+
+    answer_ids = [answer.id for answer in answers]
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    scores = get_vote_scores(session, target_type="answer", target_ids=answer_ids)
+    assert len(statements) == 1
+    assert "FROM answers" in statements[0]
+    assert scores[answer_ids[1]] == 2
+    assert scores[answer_ids[2]] == -2
+    assert reconcile_counters(session, apply=False)["answers"] == []
+
+
+def test_deletes_keep_scores_in_sync() -> None:
+    _, session = _make_session()
+    question = _question(session)
+    answer = _answer(session, question.id)
+    voter, other = uuid.uuid4(), uuid.uuid4()
+    _vote(session, voter, "question", question.id, 1)
+    _vote(session, other, "question", question.id, 1)
+    _vote(session, voter, "answer", answer.id, -1)
+
+    delete_user_content(session, user_id=voter)
+    assert get_vote_score(session, target_type="question", target_id=question.id) == 1
+
+    _vote(session, other, "answer", answer.id, 1)
+    delete_answer(session, answer_id=answer.id)
+    assert get_vote_scores(session, target_type="answer", target_ids=[answer.id]) == {}
+
+
+def test_vote_totals_track_up_and_down_counts() -> None:
+    engine, session = _make_session()
+    question = _question(session)
+    answer = _answer(session, question.id)
+    question_id, answer_id = question.id, answer.id
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    _vote(session, first, "question", question_id, 1)
+    _vote(session, second, "question", question_id, 1)
+    _vote(session, third, "question", question_id, -1)
+    _vote(session, first, "question", question_id, -1)
+    _vote(session, first, "question", question_id, -1)
+    _vote(session, first, "answer", answer_id, 1)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    totals = get_vote_totals(
+        session, target_type="question", target_ids=[question_id, uuid.uuid4()]
+    )
+    assert len(statements) == 1
+    assert totals == {question_id: {"score": -1, "up": 1, "down": 2}}
+    assert get_vote_totals(session, target_type="answer", target_ids=[answer_id]) == {
+        answer_id: {"score": 1, "up": 1, "down": 0}
+    }
+
+    delete_user_content(session, user_id=first)
+    assert get_vote_totals(
+        session, target_type="question", target_ids=[question_id]
+    ) == {question_id: {"score": 0, "up": 1, "down": 1}}
+    assert get_vote_totals(session, target_type="answer", target_ids=[answer_id]) == {
+        answer_id: {"score": 0, "up": 0, "down": 0}
+    }
+    assert reconcile_counters(session, apply=False) == {"questions": [], "answers": []}
+
+
+def test_upgrade_backfills_up_and_down_counts() -> None:
+    engine, session = _make_session()
+    question_id = _question(session).id
+    _vote(session, uuid.uuid4(), "question", question_id, 1)
+    _vote(session, uuid.uuid4(), "question", question_id, -1)
+    _vote(session, uuid.uuid4(), "question", question_id, -1)
+    session.close()
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE questions DROP COLUMN up_count"))
+        conn.execute(text("ALTER TABLE questions DROP COLUMN down_count"))
+
+    changes = upgrade_schema(engine)
+    assert COUNTER_COLUMNS.intersection(changes["columns"]) == {
+        ("questions", "up_count"),
+        ("questions", "down_count"),
+    }
+    session = sessionmaker(bind=engine)()
+    reconcile_counters(session)
+    assert get_vote_totals(
+        session, target_type="question", target_ids=[question_id]
+    ) == {question_id: {"score": -1, "up": 1, "down": 2}}
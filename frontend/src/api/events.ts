@@ -0,0 +1,74 @@
+import { AUTH_TOKEN_KEY, apiClient } from "./client";
+
+type EventHandlers = Record<string, (data: unknown) => void>;
+
+const REOPEN_DELAY_MS = 5000;
+
+const getStreamTicket = async (): Promise<string> => {
+  const response = await apiClient.post<{ ticket: string; expires_in: number }>(
+    "/events/ticket"
+  );
+  return response.data.ticket;
+};
+
+// EventSource cannot send an Authorization header, so authenticated streams
+// trade the access token for a short-lived ticket that goes in the query
+// string. The browser retries network errors on its own with the same URL;
+// once the ticket has expired that retry is refused and the stream closes,
+// so a fresh ticket is fetched and the stream reopened.
+export const openEventStream = (
+  path: string,
+  handlers: EventHandlers,
+  options: { authenticated?: boolean } = {}
+): (() => void) => {
+  if (options.authenticated && !localStorage.getItem(AUTH_TOKEN_KEY)) {
+    return () => undefined;
+  }
+
+  let source: EventSource | null = null;
+  let reopenTimer: ReturnType<typeof setTimeout> | undefined;
+  let closed = false;
+
+  const scheduleReopen = () => {
+    if (!closed) {
+      reopenTimer = setTimeout(open, REOPEN_DELAY_MS);
+    }
+  };
+
+  const open = async () => {
+    const url = new URL(
+      `${import.meta.env.VITE_API_BASE_URL ?? ""}${path}`,
+      window.location.origin
+    );
+    if (options.authenticated) {
+      try {
+        url.searchParams.set("ticket", await getStreamTicket());
+      } catch {
+        scheduleReopen();
+        return;
+      }
+    }
+    if (closed) {
+      return;
+    }
+
+    source = new EventSource(url.toString());
+    Object.entries(handlers).forEach(([name, handler]) => {
+      source?.addEventListener(name, (event) => {
+        handler(JSON.parse((event as MessageEvent<string>).data));
+      });
+    });
+    source.onerror = () => {
+      if (source?.readyState === EventSource.CLOSED) {
+        scheduleReopen();
+      }
+    };
+  };
+
+  void open();
+  return () => {
+    closed = true;
+    clearTimeout(reopenTimer);
+    source?.close();
+  };
+};
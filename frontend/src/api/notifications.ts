@@ -13,6 +13,13 @@ export const listNotifications = async (
   return response.data;
 };
 
+export const getUnreadCount = async (): Promise<{ unread: number }> => {
+  const response = await apiClient.get<{ unread: number }>(
+    "/notifications/unread-count"
+  );
+  return response.data;
+};
+
 export const markAllRead = async (): Promise<{ updated: number }> => {
   const response = await apiClient.post<{ updated: number }>(
     "/notifications/mark-all-read"
@@ -1,5 +1,5 @@
 import { apiClient } from "./client";
-import type { Question, QuestionDetail, Tag } from "../types";
+import type { DuplicateQuestion, Question, QuestionDetail, Tag } from "../types";
 
 export type QuestionCreateRequest = {
   title: string;
@@ -74,8 +74,10 @@ export const createQuestion = async (
   return response.data;
 };
 
-export const listDuplicateQuestions = async (title: string): Promise<Question[]> => {
-  const response = await apiClient.get<Question[]>("/questions/duplicates", {
+export const listDuplicateQuestions = async (
+  title: string
+): Promise<DuplicateQuestion[]> => {
+  const response = await apiClient.get<DuplicateQuestion[]>("/questions/duplicates", {
     params: { title },
   });
   return response.data;
@@ -14,7 +14,7 @@ type TopbarProps = {
 
 const Topbar = ({ onMenuClick, placeholder, title }: TopbarProps) => {
   const { displayName, role } = useAppSelector(selectAuth);
-  const { items: notifications } = useAppSelector(selectNotifications);
+  const { unreadCount } = useAppSelector(selectNotifications);
   const searchPlaceholder = useMemo(
     () => placeholder ?? "Search questions, tags, users...",
     [placeholder]
@@ -28,8 +28,6 @@ const Topbar = ({ onMenuClick, placeholder, title }: TopbarProps) => {
     .slice(0, 2)
     .join("")
     .toUpperCase();
-  const unreadCount = notifications.filter((notification) => !notification.is_read)
-    .length;
 
   return (
     <header className="sticky top-0 z-20 border-b border-slate-200/80 bg-white/80 shadow-sm backdrop-blur">
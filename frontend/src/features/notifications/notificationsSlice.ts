@@ -1,9 +1,14 @@
-import { createAsyncThunk, createSlice } from "@reduxjs/toolkit";
+import {
+  createAsyncThunk,
+  createSlice,
+  type PayloadAction,
+} from "@reduxjs/toolkit";
 import axios from "axios";
 
 import type { RootState } from "../../app/store";
 import type { Notification } from "../../types";
 import {
+  getUnreadCount,
   listNotifications,
   markAllRead,
 } from "../../api/notifications";
@@ -12,6 +17,7 @@ type LoadStatus = "idle" | "loading" | "succeeded" | "failed";
 
 type NotificationsState = {
   items: Notification[];
+  unreadCount: number;
   status: LoadStatus;
   error: string | null;
   markStatus: LoadStatus;
@@ -20,6 +26,7 @@ type NotificationsState = {
 
 const initialState: NotificationsState = {
   items: [],
+  unreadCount: 0,
   status: "idle",
   error: null,
   markStatus: "idle",
@@ -50,6 +57,17 @@ export const fetchNotifications = createAsyncThunk(
   }
 );
 
+export const fetchUnreadCount = createAsyncThunk(
+  "notifications/unreadCount",
+  async (_, { rejectWithValue }) => {
+    try {
+      return (await getUnreadCount()).unread;
+    } catch (error) {
+      return rejectWithValue(getErrorMessage(error));
+    }
+  }
+);
+
 export const markAllNotificationsRead = createAsyncThunk(
   "notifications/markAllRead",
   async (_, { rejectWithValue }) => {
@@ -64,7 +82,20 @@ export const markAllNotificationsRead = createAsyncThunk(
 const notificationsSlice = createSlice({
   name: "notifications",
   initialState,
-  reducers: {},
+  reducers: {
+    notificationReceived: (state, action: PayloadAction<Notification>) => {
+      // A coalesced notification arrives again under the same id; move it
+      // to the top without counting it twice.
+      const existing = state.items.find((item) => item.id === action.payload.id);
+      state.items = [
+        action.payload,
+        ...state.items.filter((item) => item.id !== action.payload.id),
+      ];
+      if (!existing || existing.is_read) {
+        state.unreadCount += 1;
+      }
+    },
+  },
   extraReducers: (builder) => {
     builder
       .addCase(fetchNotifications.pending, (state) => {
@@ -79,12 +110,16 @@ const notificationsSlice = createSlice({
         state.status = "failed";
         state.error = (action.payload as string) ?? "Failed to load notifications";
       })
+      .addCase(fetchUnreadCount.fulfilled, (state, action) => {
+        state.unreadCount = action.payload;
+      })
       .addCase(markAllNotificationsRead.pending, (state) => {
         state.markStatus = "loading";
         state.markError = null;
       })
       .addCase(markAllNotificationsRead.fulfilled, (state) => {
         state.markStatus = "succeeded";
+        state.unreadCount = 0;
         state.items = state.items.map((notification) => ({
           ...notification,
           is_read: true,
@@ -98,5 +133,6 @@ const notificationsSlice = createSlice({
   },
 });
 
+export const { notificationReceived } = notificationsSlice.actions;
 export const selectNotifications = (state: RootState) => state.notifications;
 export default notificationsSlice.reducer;
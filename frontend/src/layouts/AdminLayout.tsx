@@ -2,14 +2,28 @@ import { useEffect } from "react";
 import { Outlet } from "react-router-dom";
 
 import { useAppDispatch } from "../app/hooks";
-import { fetchNotifications } from "../features/notifications/notificationsSlice";
+import { openEventStream } from "../api/events";
+import {
+  fetchUnreadCount,
+  notificationReceived,
+} from "../features/notifications/notificationsSlice";
+import type { Notification } from "../types";
 import AppShell from "./AppShell";
 
 const AdminLayout = () => {
   const dispatch = useAppDispatch();
 
   useEffect(() => {
-    dispatch(fetchNotifications(undefined));
+    dispatch(fetchUnreadCount());
+    return openEventStream(
+      "/events",
+      {
+        notification: (data) =>
+          dispatch(notificationReceived(data as Notification)),
+        resync: () => dispatch(fetchUnreadCount()),
+      },
+      { authenticated: true }
+    );
   }, [dispatch]);
 
   return (
@@ -2,8 +2,13 @@ import { useEffect } from "react";
 import { Outlet } from "react-router-dom";
 
 import { useAppDispatch, useAppSelector } from "../app/hooks";
-import { fetchNotifications } from "../features/notifications/notificationsSlice";
+import { openEventStream } from "../api/events";
+import {
+  fetchUnreadCount,
+  notificationReceived,
+} from "../features/notifications/notificationsSlice";
 import { selectAuth } from "../features/auth/authSlice";
+import type { Notification } from "../types";
 import AppShell from "./AppShell";
 
 const AppLayout = () => {
@@ -11,7 +16,16 @@ const AppLayout = () => {
   const { role } = useAppSelector(selectAuth);
 
   useEffect(() => {
-    dispatch(fetchNotifications(undefined));
+    dispatch(fetchUnreadCount());
+    return openEventStream(
+      "/events",
+      {
+        notification: (data) =>
+          dispatch(notificationReceived(data as Notification)),
+        resync: () => dispatch(fetchUnreadCount()),
+      },
+      { authenticated: true }
+    );
   }, [dispatch]);
 
   return (
@@ -25,10 +25,17 @@ const formatMessage = (notification: Notification) => {
   const answerId =
     typeof payload.answer_id === "string" ? payload.answer_id : null;
   const badge = typeof payload.badge === "string" ? payload.badge : null;
+  const actorCount =
+    typeof payload.actor_count === "number" ? payload.actor_count : null;
 
   if (badge) {
     return `You earned the ${badge} badge.`;
   }
+  if (notification.type === "vote_received" && actorCount && actorCount > 1) {
+    const target =
+      typeof payload.target_type === "string" ? payload.target_type : "post";
+    return `${actorCount} people voted on your ${target}.`;
+  }
   if (questionId && answerId) {
     return `Activity on question ${questionId} (answer ${answerId}).`;
   }
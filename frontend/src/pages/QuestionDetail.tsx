@@ -27,6 +27,7 @@ import {
 } from "../features/questions/questionsSlice";
 import { castVoteItem, selectVotes } from "../features/votes/votesSlice";
 import { selectAuth } from "../features/auth/authSlice";
+import { openEventStream } from "../api/events";
 import {
   deleteAnswer,
   deleteQuestion,
@@ -77,6 +78,22 @@ const QuestionDetail = () => {
     }
   }, [dispatch, questionId]);
 
+  useEffect(() => {
+    if (!questionId) {
+      return undefined;
+    }
+    const refresh = () => {
+      dispatch(fetchQuestionDetail(questionId));
+      dispatch(fetchAnswers(questionId));
+    };
+    return openEventStream(`/questions/${questionId}/events`, {
+      answer: refresh,
+      accepted: refresh,
+      vote: refresh,
+      resync: refresh,
+    });
+  }, [dispatch, questionId]);
+
   useEffect(() => {
     if (detail && !isEditingQuestion) {
       setEditQuestionTitle(detail.title ?? "");
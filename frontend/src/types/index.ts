@@ -2,7 +2,7 @@ export type { Answer } from "./answer";
 export type { FAQ } from "./faq";
 export type { Flag } from "./flag";
 export type { Notification } from "./notification";
-export type { Question, QuestionDetail } from "./question";
+export type { DuplicateQuestion, Question, QuestionDetail } from "./question";
 export type { Tag } from "./tag";
 export type { User, UserRole } from "./user";
 export type { MyAnswer, MyQuestion } from "./me";
@@ -12,6 +12,11 @@ export interface Question {
   answers_count?: number;
   views_count?: number;
   vote_score: number;
+  snippet?: string | null;
+}
+
+export interface DuplicateQuestion extends Question {
+  score: number;
 }
 
 export interface QuestionDetail extends Question {